@@ -0,0 +1,1489 @@
+# ── PC용 전송량 비교 (보드 없이 st7735.host 가짜 SPI로 측정)
+# 사용: python3 bench.py [항목...]
+import sys
+from st7735.host import host_display
+from st7735 import rgb565
+from st7735.font import FONT5x7, glyph
+
+# 기존(점 하나당 창 하나) 방식 그대로 재현: 비교 기준
+def _draw_text_per_dot(tft, x, y, text, color, bg, scale):
+    for ch in text:
+        g = glyph(ch)
+        for cx in range(5):
+            col = FONT5x7[g+cx]
+            for cy in range(7):
+                c = color if (col >> cy) & 1 else bg
+                if scale == 1: tft.pixel(x+cx, y+cy, c)
+                else: tft.fill_rect(x+cx*scale, y+cy*scale, scale, scale, c)
+        if scale == 1: tft.vline(x+5, y, 7, bg)
+        else: tft.fill_rect(x+5*scale, y, scale, 7*scale, bg)
+        x += 6*scale
+
+def text():
+    # 글자/문자열 그리기의 트랜잭션 수: 점 단위 vs 일괄 전송
+    tft, rec = host_display(rotation=1)
+    rows = []
+    for s, scale in (("8", 1), ("12:34:56", 1), ("12:34:56", 2), ("T:23.4C", 3)):
+        rec.reset(); _draw_text_per_dot(tft, 0, 0, s, 0xFFFF, 0x0000, scale)
+        before = rec.snapshot()
+        rec.reset(); tft.draw_text(0, 0, s, 0xFFFF, bg=0x0000, scale=scale)
+        after = rec.snapshot()
+        rows.append((s, scale, before, after))
+    print("text           scale  tx(before)  tx(after)  bytes(before)  bytes(after)")
+    for s, scale, b, a in rows:
+        print("{:<14} {:>5}  {:>10}  {:>9}  {:>13}  {:>12}".format(
+            s, scale, b["transactions"], a["transactions"], b["bytes"], a["bytes"]))
+    return rows
+
+def glyphs(budgets=(0, 1024, 2048, 3072, 4096)):
+    # tft_weather 대시보드(시계 1시간 + 센서/날씨 줄) 기준 글자 캐시 적중률
+    FG=rgb565(240,240,240); OK=rgb565(60,220,130); WARN=rgb565(255,180,0)
+    PANEL=rgb565(10,10,20); LBG=rgb565(5,5,12); RBG=rgb565(8,8,16)
+    print("budget  entries  bytes  hits    misses  evict  hit_rate")
+    out = []
+    for budget in budgets:
+        tft, rec = host_display(rotation=1, glyph_budget=budget)
+        for sec in range(3600):
+            h, m, s = 12 + sec//3600, (sec//60) % 60, sec % 60
+            tft.draw_text(4, 6, "{:02d}:{:02d}:{:02d}".format(h, m, s), OK if sec > 5 else WARN, bg=PANEL)
+            if sec % 5 == 0:
+                tft.draw_text(4, 34, "T:{:>4.1f}C".format(20 + (sec % 50)/10), FG, bg=LBG)
+                tft.draw_text(4, 46, "H:{:>3.0f}%".format(40 + sec % 7), FG, bg=LBG)
+            if sec % 600 == 0:
+                tft.draw_text(84, 34, "T:{:>4.1f}C".format(17.3), FG, bg=RBG)
+                tft.draw_text(84, 46, "H:{:>3.0f}%".format(55), FG, bg=RBG)
+        st = tft.glyphs.stats() if tft.glyphs else {"entries": 0, "bytes": 0, "hits": 0, "misses": 0, "evictions": 0, "hit_rate": 0.0}
+        print("{:>6}  {:>7}  {:>5}  {:>6}  {:>6}  {:>5}  {:>8.3f}".format(
+            budget, st["entries"], st["bytes"], st["hits"], st["misses"], st["evictions"], st["hit_rate"]))
+        out.append((budget, st))
+    return out
+
+# tft_weather 레이아웃(ROTATION=1, 160x80) 그대로
+_HEADER=18; _CY=18; _COLW=36; _LX=2; _RX=82
+_LINES = {"L1": (_LX+2, _CY+16, _COLW-4, 10), "L2": (_LX+2, _CY+28, _COLW-4, 10),
+          "R1": (_RX+2, _CY+16, _COLW-4, 10), "R2": (_RX+2, _CY+28, _COLW-4, 10),
+          "RD": (_RX+2, _CY+40, _COLW-4, 12)}
+
+def _dashboard_updates(seconds):
+    # 표준 루프: 매초 시계, 5초마다 센서 2줄, 600초마다 날씨 3줄
+    for sec in range(seconds):
+        ups = [("clock", (4, 6), "{:02d}:{:02d}:{:02d}".format(12, (sec//60) % 60, sec % 60))]
+        if sec % 5 == 0:
+            ups.append(("L1", None, "T:{:>4.1f}C".format(20 + (sec % 50)/10)))
+            ups.append(("L2", None, "H:{:>3.0f}%".format(40 + sec % 7)))
+        if sec % 600 == 0:
+            ups += [("R1", None, "T:17.3C"), ("R2", None, "H: 55%"), ("RD", None, "LIGHT")]
+        yield sec, ups
+
+def dashboard(seconds=600):
+    # 초당 전송 바이트: 직접 그리기(clear_line + draw_text) vs 합성기(flush)
+    from st7735.compositor import Compositor
+    PANEL=rgb565(10,10,20); LBG=rgb565(5,5,12); FG=rgb565(240,240,240)
+    res = {}
+    for mode in ("direct", "compositor"):
+        tft, rec = host_display(rotation=1)
+        comp = Compositor(tft) if mode == "compositor" else None
+        for sec, ups in _dashboard_updates(seconds):
+            for key, pos, s in ups:
+                bg = PANEL if key == "clock" else LBG
+                if key == "clock":
+                    x, y = pos; box = None
+                else:
+                    x, y, w, h = box = _LINES[key]
+                if comp is None:
+                    if box: tft.fill_rect(x, y, w, h, bg)
+                    tft.draw_text(x, y, s, FG, bg=bg)
+                else:
+                    if box: comp.fill_rect(x, y, w, h, bg)
+                    comp.text(x, y, s, FG, bg)
+            if comp is not None:
+                comp.flush()
+        res[mode] = snap = rec.snapshot()
+        print("{:<10}  bytes/s {:>8.1f}  tx/s {:>6.2f}".format(
+            mode, snap["bytes"]/seconds, snap["transactions"]/seconds))
+    return res
+
+def clock(seconds=3600):
+    # 1시간 시계: 매초 전체 문자열 vs 바뀐 칸만(DiffText), 10초 뒤 WARN → OK
+    from st7735.difftext import DiffText
+    PANEL=rgb565(10,10,20); OK=rgb565(60,220,130); WARN=rgb565(255,180,0)
+    res = {}
+    for mode in ("full", "diff"):
+        tft, rec = host_display(rotation=1)
+        dt = DiffText(tft.draw_text, 4, 6, PANEL)
+        for sec in range(seconds):
+            s = "{:02d}:{:02d}:{:02d}".format(12 + sec//3600, (sec//60) % 60, sec % 60)
+            col = OK if sec >= 10 else WARN
+            if mode == "full":
+                tft.draw_text(4, 6, s, col, bg=PANEL); dt.cells += len(s)
+            else:
+                dt.update(s, col)
+        res[mode] = snap = rec.snapshot()
+        snap["cells"] = dt.cells
+        print("{:<5} cells {:>6}  bytes {:>8}  tx {:>6}".format(mode, dt.cells, snap["bytes"], snap["transactions"]))
+    return res
+
+def jitter(seconds=8, fetch_s=2.5, bound_ms=100):
+    # 대시보드 asyncio 루프를 PC에서 돌림: 느린 날씨 요청(fetch_s초)이 걸려 있는 동안
+    # 초가 바뀐 뒤 시계가 그려지기까지의 지연(ms)이 bound_ms 이하인지 확인
+    # 처음 접속(BSSID 모름)이라 시간 맞춤 뒤 BSSID 알아내기 스캔이 한 번 있음 → 그 직후 한 번은 따로 보고,
+    # 스캔이 딱 한 번이고 BSSID를 알아냈는지 확인
+    # NTP는 ntp.sync 그대로 가짜 UDP 서버에: 첫 요청은 버려짐(1초 기다렸다 재시도), 응답은 0.8초 늦게
+    import time
+    import dashboard, ntp
+    from compat import asyncio, async_sleep_ms
+    from weather_cache import WeatherCache
+    from wifimgr import WifiManager
+    from nethost import FakeWLAN, NTPServer
+    tft, rec = host_display(rotation=1)
+    dash = dashboard.Dashboard(tft)
+    lags = []; fetches = []; last = [None]; scans = []
+    orig = dash.draw_clock
+    def draw_clock(t):
+        drawn = orig(t)
+        if drawn and t[5] != last[0]:
+            if last[0] is not None:
+                lags.append((time.time(), (time.time() % 1) * 1000))   # 초 경계에서 얼마나 늦었나
+            last[0] = t[5]
+        return drawn
+    dash.draw_clock = draw_clock
+    now = lambda: time.localtime(int(time.time()))
+    async def fetch_weather():
+        fetches.append(time.time())
+        await async_sleep_ms(int(fetch_s*1000))      # 네트워크 대기 흉내
+        return ("light rain", 17.3, 55)
+    synced = []
+    async def ntp_sync():
+        return await ntp.sync("127.0.0.1", srv.port, timeout_ms=1000, retry_ms=100, set_time=synced.append)
+    async def main():
+        try:
+            # 스캔/접속 시간은 보드 그대로(time_scale=1): 처음 접속이 루프를 막으면 여기서 걸림
+            wlan = FakeWLAN(time_scale=1.0)
+            scan = wlan.scan
+            def timed_scan():
+                r = scan(); scans.append(time.time()); return r
+            wlan.scan = timed_scan
+            wifi[0] = WifiManager("mtinet", "pw", cache_path=None, wlan=wlan)
+            await asyncio.wait_for(dash.run(now, lambda: (23.4, 41), WeatherCache(fetch_weather, path=None),
+                                           wifi[0], ntp_sync), seconds)
+        except asyncio.TimeoutError:
+            pass
+    wifi = [None]
+    with NTPServer(delay_s=0.8, drop=1) as srv:
+        asyncio.run(main())
+    # 스캔이 끝난 뒤 첫 그리기만 빼고(그 한 번은 스캔 시간만큼 늦음)
+    skip = next((i for i, (t, _) in enumerate(lags) if scans and t >= scans[0]), None)
+    rest = [l for i, (t, l) in enumerate(lags) if i != skip]
+    worst = max(rest) if rest else 0.0
+    learned = len(scans) == 1 and wifi[0].bssid is not None
+    ntp_ok = len(synced) == 1 and srv.requests == 2 and abs(synced[0] - time.time()) < 5
+    ok = worst <= bound_ms and learned and ntp_ok
+    print("clock draws {}  fetches {}  worst lag {:.1f} ms  (bound {} ms)  {}".format(
+        len(lags), len(fetches), worst, bound_ms, "OK" if worst <= bound_ms else "FAIL"))
+    print("BSSID 알아내기 스캔 {}번, 그 뒤 한 번 {:.0f} ms 늦음  {}".format(
+        len(scans), lags[skip][1] if skip is not None else 0, "OK" if learned else "FAIL"))
+    print("NTP(UDP, 요청 {}번, 응답 0.8초 늦음) 맞춤 {}".format(srv.requests, "OK" if ntp_ok else "FAIL"))
+    return {"draws": len(lags), "worst_lag_ms": worst, "learn_scans": len(scans), "ntp_requests": srv.requests,
+            "ok": ok}
+
+def weather_fetch(n=30):
+    # 로컬 가짜 날씨 서버 상대로: urequests 방식(매번 새 연결 + 본문 전체 json) vs
+    # owm.HttpClient(keep-alive + 스트리밍 필드 추출). 지연/연결 수와 파싱 중 최대 힙 비교
+    # (CPython asyncio는 소켓 수신마다 256KB 버퍼를 잡으므로 힙은 파싱 단계만 따로 잼)
+    import json, socket, time, tracemalloc
+    from compat import asyncio
+    import owm
+    from nethost import OWMServer
+
+    def get_raw(port, path):
+        s = socket.create_connection(("127.0.0.1", port))
+        s.sendall("GET {} HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n".format(path).encode())
+        raw = b""
+        while True:
+            b = s.recv(1024)
+            if not b: break
+            raw += b
+        s.close()
+        return raw.split(b"\r\n\r\n", 1)[1]
+
+    def parse_full(body):
+        d = json.loads(body)
+        return (d["weather"][0]["description"], d["main"]["temp"], d["main"]["humidity"])
+
+    def parse_stream(body):
+        ex = owm.FieldExtractor(owm.WEATHER_FIELDS)
+        for i in range(0, len(body), owm.READ_CHUNK):
+            if ex.feed(body[i:i+owm.READ_CHUNK]): break
+        ex.close(); f = ex.found
+        return (f["desc"], f["temp"], f["hum"])
+
+    def parse_peak(fn, body):
+        tracemalloc.start(); tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        r = fn(body)
+        peak = tracemalloc.get_traced_memory()[1] - base
+        tracemalloc.stop()
+        return r, peak
+
+    path = owm.weather_path("Seoul", "KEY")
+    res = {}
+    with OWMServer() as srv:
+        t0 = time.perf_counter()
+        for _ in range(n): r1 = parse_full(get_raw(srv.port, path))
+        ms = (time.perf_counter() - t0) * 1000 / n
+        body = get_raw(srv.port, path)
+        _, peak = parse_peak(parse_full, body)
+        res["urequests_style"] = {"parse_peak_bytes": peak, "ms": ms, "connections": n}
+
+        async def streamed():
+            c = owm.HttpClient("127.0.0.1", srv.port)
+            await owm.fetch_weather(c, path)          # 이벤트 루프 준비는 제외
+            t0 = time.perf_counter()
+            for _ in range(n): r = await owm.fetch_weather(c, path)
+            ms = (time.perf_counter() - t0) * 1000 / n
+            await c.close()
+            return r, ms, c.connects
+        r2, ms, connects = asyncio.run(streamed())
+        _, peak = parse_peak(parse_stream, body)
+        res["streaming"] = {"parse_peak_bytes": peak, "ms": ms, "connections": connects}
+    assert r1 == r2, (r1, r2)
+    for k, v in res.items():
+        print("{:<16} parse peak {:>6} B  {:>6.2f} ms/req  connections {}".format(
+            k, v["parse_peak_bytes"], v["ms"], v["connections"]))
+
+    # 재사용한 연결이 본문 중간(설명 문자열 안)에서 끊기면 새 연결로 다시 받되,
+    # 추출기도 새로 만들어야 값이 맞음
+    with OWMServer(cut=(2,), cut_at=body.find(b"shower")) as srv:
+        async def retried():
+            c = owm.HttpClient("127.0.0.1", srv.port)
+            a = await owm.fetch_weather(c, path)
+            b = await owm.fetch_weather(c, path)
+            await c.close()
+            return a, b, c.connects
+        a, b, connects = asyncio.run(retried())
+    ok = a == b == r1 and connects == 2
+    print("retry after cut: {!r}  connections {}  {}".format(b, connects, "OK" if ok else "FAIL"))
+    res["retry"] = {"result": b, "connections": connects}
+    res["ok"] = ok
+    return res
+
+def _pct(xs, p):
+    xs = sorted(xs)
+    return xs[min(len(xs)-1, int(len(xs)*p))] if xs else 0.0
+
+def weather_cache(max_age_ms=600_000):
+    # WeatherCache를 가짜 시계로: 레코드 왕복(잘림/깨진 레코드 포함), 부팅 때 플래시에서 읽기,
+    # 오래된 값을 보여 주면서 갱신, 실패해도 값 유지, 재시도 간격 15s → 10분(지수), 이상한 값 저장
+    import os, tempfile, types
+    import weather_cache as wcm
+    from compat import asyncio
+    clk = {"ms": 0, "s": 1_700_000_000}
+    saved = (wcm.ticks_ms, wcm.time)
+    wcm.ticks_ms = lambda: clk["ms"]
+    wcm.time = types.SimpleNamespace(time=lambda: clk["s"])
+    def advance(ms):
+        clk["ms"] += ms; clk["s"] += ms // 1000
+    checks = {}
+    answers = []
+    seen = []                                 # fetch 중에 화면이 보던 값
+    async def fetch():
+        seen.append(wc.get())
+        await asyncio.sleep(0)
+        r = answers.pop(0)
+        if isinstance(r, Exception): raise r
+        return r
+    d = tempfile.TemporaryDirectory()
+    path = os.path.join(d.name, "weather.bin")
+    try:
+        # 레코드 왕복
+        cases = [("light rain", 17.3, 55), ("맑음", -12.5, 0), ("x"*300, 5000.0, 300), ("", 0.0, -5)]
+        back = [wcm.unpack_record(wcm.pack_record(123, w)) for w in cases]
+        checks["roundtrip"] = (back[0] == (123, ("light rain", 17.3, 55)) and back[1][1] == ("맑음", -12.5, 0) and
+                               back[2][1] == ("x"*255, 3276.7, 255) and back[3][1] == ("", 0.0, 0))
+        rec = wcm.pack_record(123, cases[0])
+        checks["bad_record"] = (wcm.unpack_record(rec[:-1]) is None and wcm.unpack_record(b"XYZ" + rec[3:]) is None
+                                and wcm.unpack_record(b"") is None)
+        # 첫 부팅: 저장된 값 없음 → 받아서 저장
+        wc = wcm.WeatherCache(fetch, path=path, max_age_ms=max_age_ms)
+        answers.append(("clear sky", 21.0, 40))
+        first = wc.due() and wc.get() is None
+        asyncio.run(wc.refresh())
+        checks["first_fetch"] = first and wc.get() == ("clear sky", 21.0, 40) and not wc.due()
+        # 재부팅(1분 뒤): 플래시 값을 바로, 시계가 맞으면 아직 새 것
+        advance(60_000); clk["ms"] = 0
+        wc = wcm.WeatherCache(fetch, path=path, max_age_ms=max_age_ms)
+        checks["reload"] = wc.get() == ("clear sky", 21.0, 40) and not wc.due()
+        # 재부팅(20분 뒤): 오래된 값을 보여 주면서 갱신
+        advance(20*60_000); clk["ms"] = 0
+        wc = wcm.WeatherCache(fetch, path=path, max_age_ms=max_age_ms)
+        answers.append(("rain", 15.5, 80))
+        due = wc.due()
+        asyncio.run(wc.refresh())
+        checks["stale_while_revalidate"] = due and seen[-1] == ("clear sky", 21.0, 40) and wc.get() == ("rain", 15.5, 80)
+        # 10분 지나 갱신이 실패: 값은 그대로, 간격 15s, 30s, ... 600s에서 멈춤
+        advance(max_age_ms)
+        delays = []
+        for k in range(8):
+            answers.append(None if k % 2 else OSError("timeout"))
+            asyncio.run(wc.refresh())
+            t = 0
+            while not wc.due():
+                advance(1000); t += 1000
+            delays.append(t)
+        checks["fail_keeps_value"] = wc.get() == ("rain", 15.5, 80) and wc.failures == 8
+        checks["backoff"] = delays == [15_000, 30_000, 60_000, 120_000, 240_000, 480_000, 600_000, 600_000]
+        answers.append(("sun", 25.0, 30))
+        asyncio.run(wc.refresh())
+        checks["recover"] = wc.get() == ("sun", 25.0, 30) and not wc.due() and wc._delay == 0
+        # 이상한 값(기온이 i16 밖, NaN): 예외 없이, 잘린 값이 저장되거나 저장만 건너뜀
+        ok = True
+        for w in (("hot", 9999.9, 50), ("nan", float("nan"), 50)):
+            answers.append(w)
+            try:
+                asyncio.run(wc.refresh())
+            except Exception:
+                ok = False
+        r = wcm.WeatherCache(fetch, path=path).get()
+        checks["odd_values"] = ok and r == ("hot", 3276.7, 50)
+    finally:
+        wcm.ticks_ms, wcm.time = saved
+        d.cleanup()
+    for k, v in checks.items():
+        print("{:<24} {}".format(k, "OK" if v else "FAIL"))
+    print("재시도 간격(s):", [t // 1000 for t in delays])
+    return {"checks": checks, "backoff_ms": delays, "ok": all(checks.values())}
+
+def wifi_reconnect(n=20, scale=0.02):
+    # 가짜 WLAN(시간 scale배)으로 연결 지연 분포: 처음(스캔) vs 저장된 BSSID로 재접속(끊김 감지 포함)
+    import os, tempfile, time
+    from compat import asyncio
+    from nethost import FakeWLAN
+    import wifimgr
+    from wifimgr import WifiManager
+    cold = []; warm = []
+    # 관리자의 대기 간격도 같은 배율로 줄여야 시뮬레이션 ms가 실제 ms와 맞음
+    saved = wifimgr.POLL_MS, wifimgr.WATCH_MS
+    wifimgr.POLL_MS = max(1, round(saved[0]*scale)); wifimgr.WATCH_MS = max(1, round(saved[1]*scale))
+
+    async def one(seed):
+        wlan = FakeWLAN(time_scale=scale, seed=seed)
+        mgr = WifiManager("mtinet", "pw", cache_path=None, wlan=wlan, scan=True)
+        t0 = time.monotonic()
+        await mgr.connect()
+        cold.append((time.monotonic() - t0) * 1000 / scale)
+        sup = asyncio.create_task(mgr.supervise())
+        await asyncio.sleep(0)
+        wlan.drop(); t0 = time.monotonic()
+        await mgr.wait_down(); await mgr.wait_up()
+        warm.append((time.monotonic() - t0) * 1000 / scale)
+        sup.cancel()
+
+    async def stale(path):
+        # 저장된 BSSID의 AP가 없어짐(공유기 교체) + ESP32처럼 config("bssid") 모름, scan=False(tft_weather):
+        # 빠른 시도 실패 → 파일 지움 → SSID로 접속 → learn() 스캔으로 새 BSSID 저장 → 다음 부팅은 빠른 접속
+        with open(path, "wb") as f:
+            f.write(b"\xde\xad\xbe\xef\x00\x01" + bytes([1]))
+        wlan = FakeWLAN(time_scale=scale)
+        mgr = WifiManager("mtinet", "pw", cache_path=path, wlan=wlan)
+        up = await mgr.connect(fast_timeout_ms=4000*scale)
+        dropped = not os.path.exists(path)
+        learned = mgr.learn()
+        again = WifiManager("mtinet", "pw", cache_path=path, wlan=FakeWLAN(time_scale=scale))
+        await again.connect(fast_timeout_ms=4000*scale)
+        return {"joined": up and mgr.history[-1][0] == "join", "file_dropped": dropped, "learned": learned,
+                "next_boot": again.history[-1][0], "bssid": again.bssid == wlan.aps[0][0]}
+
+    async def main():
+        for i in range(n): await one(i)
+        return await stale(os.path.join(d.name, "wifi.bin"))
+    d = tempfile.TemporaryDirectory()
+    try:
+        st = asyncio.run(main())
+    finally:
+        wifimgr.POLL_MS, wifimgr.WATCH_MS = saved
+        d.cleanup()
+    res = {}
+    for name, xs in (("cold(scan)", cold), ("reconnect(bssid)", warm)):
+        res[name] = {"p50": _pct(xs, .5), "p95": _pct(xs, .95), "max": max(xs)}
+        print("{:<17} p50 {:>6.0f} ms  p95 {:>6.0f} ms  max {:>6.0f} ms".format(name, *res[name].values()))
+    ok = st["joined"] and st["file_dropped"] and st["learned"] and st["next_boot"] == "fast" and st["bssid"]
+    print("없어진 AP의 wifi.bin: 지움 {}  learn 저장 {}  다음 부팅 {}  {}".format(
+        st["file_dropped"], st["learned"], st["next_boot"], "OK" if ok else "FAIL"))
+    res.update({"stale_cache": st, "ok": ok})
+    return res
+
+def boot(seconds=3, scale=0.25):
+    # 부팅 시간표: 패널 초기화(실제 대기) / Wi-Fi(가짜, scale배) / NTP / 첫 날씨가 겹치는지 확인
+    # cold: 처음 부팅(저장된 BSSID 없음, SSID로 접속), warm: 저장된 BSSID로 접속(평소 부팅)
+    # cold도 Wi-Fi 접속이 루프를 막지 않아야 함 → 패널 초기화 끝이 warm과 비슷해야 함
+    # SPI는 machine.SPI처럼 속도를 못 읽는 것(BareSPI)으로, 초기화 뒤 SPI 속도 맞추기(spi_cal)도 거침
+    import os, tempfile, time
+    import dashboard, bootseq
+    from compat import asyncio, async_sleep_ms
+    from weather_cache import WeatherCache
+    from wifimgr import WifiManager
+    from nethost import FakeWLAN
+    from st7735.host import BareSPI
+    async def fetch_weather():
+        await async_sleep_ms(400); return ("clear sky", 21.0, 40)
+    async def ntp_sync():
+        await async_sleep_ms(300); return True
+    res = {}
+    for mode in ("cold", "warm"):
+        tft, rec = host_display(rotation=1, init=False)
+        host_spi = tft.bus.spi
+        tft.bus.spi = tft.spi = BareSPI(host_spi)
+        dash = dashboard.Dashboard(tft)
+        tl = bootseq.Timeline()
+        spi_dir = tempfile.TemporaryDirectory()
+        wlan = FakeWLAN(time_scale=scale)
+        async def main():
+            wifi = WifiManager("mtinet", "pw", cache_path=None, wlan=wlan)
+            if mode == "warm":
+                wifi.bssid, wifi.channel = wlan.aps[0][:2]
+            now = lambda: time.localtime(int(time.time()))
+            try:
+                await asyncio.wait_for(dash.run(now, lambda: None, WeatherCache(fetch_weather, path=None),
+                                                wifi, ntp_sync, tl=tl,
+                                                spi_cache=os.path.join(spi_dir.name, "spi.bin"),
+                                                spi_baud=40_000_000), seconds)
+            except asyncio.TimeoutError:
+                pass
+        asyncio.run(main())
+        print("[{}]".format(mode)); tl.print()
+        ph = {n: (s, e) for n, s, e in tl.as_list()}
+        serial = sum(e - s for s, e in ph.values() if e is not None)
+        total = max(e for s, e in ph.values() if e is not None)
+        spi_cal = ph.get("spi_cal", (0, None))[1] is not None and host_spi.baudrate == 40_000_000
+        spi_dir.cleanup()
+        ok = ph["wifi"][0] <= ph["display_init"][0] and total < serial and spi_cal
+        print("직렬 합계 {} ms → 실제 {} ms  겹침 {}  spi_cal(MISO 없음 → 40MHz) {}".format(
+            serial, total, "OK" if total < serial else "FAIL", "OK" if spi_cal else "FAIL"))
+        res[mode] = {"phases": ph, "serial_ms": serial, "total_ms": total, "ok": ok}
+    lag = res["cold"]["phases"]["display_init"][1] - res["warm"]["phases"]["display_init"][1]
+    res["cold"]["ok"] = res["cold"]["ok"] and lag < 100
+    print("cold 패널 초기화 끝 - warm = {} ms  스캔 블로킹 없음 {}".format(lag, "OK" if lag < 100 else "FAIL"))
+    res["ok"] = res["cold"]["ok"] and res["warm"]["ok"]
+    return res
+
+def hwscroll(steps=160, baud=40_000_000):
+    # 세로 티커(회전 0, 화면 전체) 한 스텝당 전송량: 화면 전체 재전송 vs 하드웨어 스크롤
+    from st7735.scroll import HwScroll
+    tft, rec = host_display(rotation=0)
+    frame = bytearray(tft.width * tft.height * 2)
+    rec.reset()
+    for _ in range(steps):
+        tft.write_window(0, 0, tft.width, tft.height, frame)
+    full = rec.snapshot()
+    line = bytearray(tft.width * 2)
+    sc = HwScroll(tft)
+    rec.reset()
+    seen = set()
+    for _ in range(steps):
+        for y in sc.scroll(1):
+            seen.add(y); sc.write_line(y, line)
+    hw = rec.snapshot()
+    sc.stop()
+    # 줄이 한 바퀴 돌면 모든 화면 줄을 정확히 한 번씩 다시 씀
+    ok = seen == set(range(tft.height))
+    print("mode          bytes/step  tx/step  fps(wire @{} MHz)".format(baud // 1_000_000))
+    res = {}
+    for name, r in (("full", full), ("hwscroll", hw)):
+        b = r["bytes"] / steps
+        res[name] = {"bytes_per_step": b, "tx_per_step": r["transactions"] / steps, "fps": baud / 8 / b}
+        print("{:<12} {:>11.0f}  {:>7.1f}  {:>16.0f}".format(name, b, r["transactions"] / steps, res[name]["fps"]))
+    print("줄 커버리지", "OK" if ok else "FAIL")
+    res["ok"] = ok
+    return res
+
+def _fb_text_per_dot(buf, w, x, y, s, color, bg):
+    # 기존 demo_fast_scroll: 매 프레임 배경 칠 + fb.pixel로 점마다 찍기(framebuf 대신 바이트 직접)
+    hi = bg >> 8; lo = bg & 0xFF
+    for k in range(0, len(buf), 2):
+        buf[k] = hi; buf[k+1] = lo
+    h = len(buf) // (w*2)
+    for ch in s:
+        g = glyph(ch)
+        for cx in range(5):
+            px = x + cx
+            if not 0 <= px < w: continue
+            col = FONT5x7[g+cx]
+            for cy in range(7):
+                if (col >> cy) & 1 and 0 <= y+cy < h:
+                    o = ((y+cy)*w + px)*2
+                    buf[o] = color >> 8; buf[o+1] = color & 0xFF
+        x += 6
+
+def _strip_frame(tft, mq, off):
+    # 비교용: 문자열 전체를 띠 하나에 그려서 off 위치를 잘라낸 w x h 프레임(고리 없는 원래 방식)
+    w, h, s = mq.w, mq.h, mq.scale
+    sw = mq.period + w; st = sw*2
+    strip = bytearray(st*h)
+    for k in range(0, len(strip), 2):
+        strip[k] = mq.bg >> 8; strip[k+1] = mq.bg & 0xFF
+    ty = max(0, (h - 7*s)//2)
+    if ty + 7*s <= h:
+        tft.text_into(strip, st, mq.gap, ty, mq.text, mq.color, mq.bg, s)
+    for r in range(h):
+        o = r*st; strip[o+mq.period*2:o+sw*2] = strip[o:o+w*2]
+    o = (off % mq.period)*2
+    return b"".join(bytes(strip[o + r*st:o + r*st + w*2]) for r in range(h))
+
+def marquee(frames=300):
+    # 가로 전광판 프레임당 CPU 시간(전송 제외): 매 프레임 다시 찍기 vs 고리에서 자르기(들어오는 글자만 찍음)
+    # 그리고 고리 프레임이 문자열 전체 띠에서 자른 것과 같은지(한 칸씩/여러 칸씩/되감기/건너뛰기),
+    # 100글자여도 메모리가 글자 수와 무관한지
+    import time
+    from st7735.marquee import Marquee
+    tft, rec = host_display(rotation=0)
+    msg = "FAST SCROLL  ST7735  ESP32-C3  "
+    W, H = tft.width, 16
+    fg, bg = rgb565(100, 255, 180), 0
+    buf = bytearray(W*H*2)
+    t = time.perf_counter()
+    x = W
+    for _ in range(frames):
+        _fb_text_per_dot(buf, W, x, 4, msg, fg, bg)
+        x -= 2
+        if x < -len(msg)*6: x = W
+    old = (time.perf_counter() - t) / frames
+    t = time.perf_counter()
+    mq = Marquee(tft, 0, 0, W, H, msg, fg, bg)
+    build = time.perf_counter() - t
+    t = time.perf_counter()
+    for i in range(frames):
+        mq.frame(i*2)
+    new = (time.perf_counter() - t) / frames
+    # 같은 위치의 프레임이 기존 방식과 같은지(글자가 처음 들어오는 위치 기준)
+    _fb_text_per_dot(buf, W, W - 40, (H - 7)//2, msg, fg, bg)
+    same = bytes(mq.frame(40)) == bytes(buf)
+    mismatch = 0
+    for scale, h, text in ((1, H, msg), (2, 18, "Seoul 17.3C"), (1, 16, "x"*100)):
+        m = Marquee(tft, 0, 0, W, h, text, fg, bg, gap=W//3, scale=scale)
+        for off in list(range(0, 3*m.period, 3)) + [5, 7*m.period + 1, 40, 39, 2]:
+            if bytes(m.frame(off)) != _strip_frame(tft, m, off):
+                mismatch += 1
+    long = Marquee(tft, 0, 0, W, H, "x"*100, fg, bg)
+    mem = len(long._ring) + len(long._cell) + len(long._bgc)
+    strip_mem = (long.period + W)*H*2
+    ok = same and not mismatch and mem < strip_mem // 4
+    print("per-dot  {:8.1f} us/frame".format(old*1e6))
+    print("ring     {:8.1f} us/frame  (만들기 {:.1f} ms, 고리 {} B)".format(new*1e6, build*1e3, len(mq._ring)))
+    print("x{:.0f}  프레임 일치 {}  띠 비교 불일치 {}".format(old/new, "OK" if same else "FAIL", mismatch))
+    print("100글자: 고리 {} B (전체 띠였다면 {} B)  {}".format(mem, strip_mem, "OK" if ok else "FAIL"))
+    return {"per_dot_us": old*1e6, "strip_us": new*1e6, "build_ms": build*1e3, "same": same,
+            "mismatch": mismatch, "mem_100": mem, "ok": ok}
+
+def present(frames=40, w=80, h=160):
+    # 이중 버퍼: 전송 시간을 흉내 내는 가짜 SPI(realtime)로 프레임 시간 = max(그리기, 전송)인지 확인
+    import time
+    from st7735.present import DoubleBuffer
+    sw = sys.getswitchinterval()
+    sys.setswitchinterval(0.0002)           # CPython GIL 양보 간격(기본 5 ms)이 전송 스레드를 막지 않도록
+    def render(buf, i):
+        # 순수 파이썬 그리기(점마다 계산): 보드의 fb 그리기 대신 CPU를 쓰는 일
+        o = 0
+        for yy in range(h):
+            dy = (yy - h//2)*(yy - h//2)
+            for xx in range(w):
+                c = (((xx - w//2)*(xx - w//2) + dy + i*8) >> 4) & 0xFFFF
+                c = (c ^ (c >> 5) ^ (xx*yy)) & 0xFFFF
+                buf[o] = c >> 8; buf[o+1] = c & 0xFF
+                o += 2
+    buf = bytearray(w*h*2)
+    t = time.perf_counter()
+    for i in range(frames): render(buf, i)
+    r = (time.perf_counter() - t) / frames
+    baud = int(w*h*2*8 / r)                 # 전송 시간이 그리기와 비슷해지는 속도
+    res = {"render_ms": r*1e3}
+    for mode, threaded in (("serial", False), ("double", True)):
+        tft, rec = host_display(rotation=0, baudrate=baud, realtime=True)
+        t0 = time.perf_counter()
+        rec.reset(); tft.write_window(0, 0, w, h, buf)
+        res["transmit_ms"] = (time.perf_counter() - t0)*1e3
+        db = DoubleBuffer(tft, w, h, threaded=threaded)
+        ts = [time.perf_counter()]
+        for i in range(frames):
+            render(db.back, i)
+            db.present()
+            ts.append(time.perf_counter())
+        db.close()
+        # 프레임 간격의 중앙값(PC 스케줄러가 가끔 끼어드는 것은 제외)
+        res[mode + "_ms"] = _pct([b - a for a, b in zip(ts, ts[1:])], 0.5) * 1e3
+    sys.setswitchinterval(sw)
+    rm, tm = res["render_ms"], res["transmit_ms"]
+    # 보드가 아닌 PC(스레드 전환/잠 오차)라 max와 딱 맞진 않음 → 직렬보다 확실히 빠른지만 판정
+    ok = res["double_ms"] < 0.8*res["serial_ms"]
+    print("render {:.2f} ms  transmit {:.2f} ms ({:.1f} MHz 흉내)".format(rm, tm, baud/1e6))
+    print("serial {:.2f} ms/frame (합 {:.2f})".format(res["serial_ms"], rm + tm))
+    print("double {:.2f} ms/frame (max {:.2f})  {}".format(res["double_ms"], max(rm, tm), "OK" if ok else "FAIL"))
+    # 백그라운드 전송이 실패하면 다음 present()/wait()에서 그 예외가 나와야 함(조용히 넘어가면 안 됨)
+    class Broken:
+        def write_window(self, x, y, w, h, mv): raise OSError(5)
+    raised = []
+    for call in ("present", "wait"):
+        db = DoubleBuffer(Broken(), w, h, threaded=True)
+        db.present(0, 0)
+        try:
+            getattr(db, call)()
+        except OSError:
+            raised.append(call)
+        db.close()
+    err_ok = raised == ["present", "wait"]
+    print("전송 예외 전달: {}  {}".format(raised, "OK" if err_ok else "FAIL"))
+    res["error_raised"] = raised
+    res["ok"] = ok and err_ok
+    return res
+
+def _balls(n, w, h, seed=1):
+    import random
+    rnd = random.Random(seed)
+    out = []
+    for _ in range(n):
+        r = rnd.randint(3, 7)
+        out.append([rnd.randint(0, w-2*r-1), rnd.randint(0, h-2*r-1), r,
+                    rnd.choice((-3, -2, -1, 1, 2, 3)), rnd.choice((-3, -2, -1, 1, 2, 3))])
+    return out
+
+def _bounce(b, w, h):
+    x, y, r, dx, dy = b
+    if not 0 <= x+dx <= w-2*r: dx = -dx
+    if not 0 <= y+dy <= h-2*r: dy = -dy
+    b[0] = x+dx; b[1] = y+dy; b[3] = dx; b[4] = dy
+
+def sprites(frames=100, counts=(1, 12, 36)):
+    # 공 N개 바운스의 프레임당 전송: 기존(지우기 + 사각형 + 십자 2줄 = 공당 4창) vs 스프라이트 레이어
+    from st7735.sprites import Sprite, SpriteLayer
+    print("balls  mode      tx/frame  windows/frame  bytes/frame")
+    res = {}
+    for n in counts:
+        tft, rec = host_display(rotation=0)
+        W, H = tft.width, tft.height
+        balls = _balls(n, W, H)
+        for _ in range(frames):
+            for b in balls:
+                x, y, r = b[0], b[1], b[2]
+                tft.fill_rect(x-1, y-1, 2*r+2, 2*r+2, 0)
+                _bounce(b, W, H)
+                x, y = b[0], b[1]
+                tft.fill_rect(x, y, 2*r, 2*r, 0xFFE0)
+                tft.hline(x, y+r, 2*r, 0); tft.vline(x+r, y, 2*r, 0)
+        old = rec.snapshot(); old_win = 4*n
+        tft, rec = host_display(rotation=0)
+        layer = SpriteLayer(tft, 0)
+        balls = _balls(n, W, H)
+        ss = [layer.add(Sprite.circle(b[2], 0xFFE0, x=b[0], y=b[1])) for b in balls]
+        layer.update(); rec.reset(); layer.transfers = 0
+        for _ in range(frames):
+            for b, s in zip(balls, ss):
+                _bounce(b, W, H); s.move_to(b[0], b[1])
+            layer.update()
+        new = rec.snapshot()
+        for mode, r, win in (("old", old, old_win), ("sprites", new, layer.transfers / frames)):
+            print("{:>5}  {:<8} {:>9.1f}  {:>13.1f}  {:>11.0f}".format(
+                n, mode, r["transactions"] / frames, win, r["bytes"] / frames))
+        res[n] = {"old": old, "sprites": new, "windows": layer.transfers / frames}
+    # 안 움직이면 아무것도 안 보냄
+    rec.reset(); layer.update()
+    print("정지 프레임 전송", rec.transactions)
+    return res
+
+def _fill_color_per_call(tft, color565, x, y, w, h):
+    # 기존 fill_color: 호출마다 pair*chunk 바이트를 새로 만듦(비교 기준)
+    tft.set_window(x, y, x+w-1, y+h-1)
+    chunk = bytes([(color565 >> 8) & 0xFF, color565 & 0xFF]) * tft.chunk
+    pixels = w*h
+    tft.bus.begin_data()
+    while pixels > 0:
+        n = min(pixels, tft.chunk)
+        tft.bus.write(memoryview(chunk)[:n*2])
+        pixels -= n
+    tft.bus.end()
+
+def fills(n=1000):
+    # 반복 칠하기의 힙: 1000번 칠한 뒤 힙이 늘지 않는지(tracemalloc), 호출당 할당 바이트 비교
+    import gc, tracemalloc
+    tft, rec = host_display(rotation=0, chunk=512)
+    colors = [rgb565(255, 0, 0), rgb565(0, 255, 0), rgb565(8, 8, 16), rgb565(255, 255, 255)]
+    bars = [(c, tft.width*20) for c in colors]
+    def work(fill):
+        for i in range(n):
+            fill(colors[i & 1], 0, (i*7) % 140, tft.width, 20)
+    def measure(fn):
+        # 드라이버 쪽(st7735/ 중 host.py 제외)에서 남은 바이트. 가짜 SPI 카운터 등은 제외
+        fn()                                   # 색 버퍼 등 처음 한 번 만드는 것은 제외
+        gc.collect()
+        tracemalloc.start()
+        flt = [tracemalloc.Filter(True, "*st7735*"), tracemalloc.Filter(False, "*host.py")]
+        before = tracemalloc.take_snapshot().filter_traces(flt)
+        fn(); gc.collect()
+        peak = tracemalloc.get_traced_memory()[1]
+        after = tracemalloc.take_snapshot().filter_traces(flt)
+        tracemalloc.stop()
+        grow = sum(st.size_diff for st in after.compare_to(before, "filename"))
+        return grow, peak
+    res = {}
+    res["old(per-call)"] = measure(lambda: work(lambda c, x, y, w, h: _fill_color_per_call(tft, c, x, y, w, h)))
+    res["fill_color"] = measure(lambda: work(tft.fill_color))
+    res["fill_runs"] = measure(lambda: [tft.fill_runs(0, 0, tft.width, 160, bars) for _ in range(n // 10)])
+    res["gradient"] = measure(lambda: [tft.gradient(0, 0, tft.width, 160, (0, 0, 64), (255, 128, 0), v)
+                                       for _ in range(n // 20) for v in (True, False)])
+    print("path          growth(B)  peak(B, 전체)")
+    for k, (g, p) in res.items():
+        print("{:<12} {:>10}  {:>7}".format(k, g, p))
+    rec.reset(); tft.fill_runs(0, 0, tft.width, 160, bars)
+    bars_tx = rec.transactions
+    rec.reset()
+    for c, m in bars: tft.fill_color(c, 0, 0, tft.width, 20)
+    print("색 막대 4개: fill_runs 창 하나 {} tx, 막대마다 fill_color {} tx".format(bars_tx, rec.transactions))
+    ok = all(res[k][0] <= 0 for k in ("fill_color", "fill_runs", "gradient"))
+    print("힙 증가 없음", "OK" if ok else "FAIL")
+    res["ok"] = ok
+    return res
+
+def font():
+    # 폰트 메모리: 예전 dict-of-list(같은 95글자) vs bytes 한 덩어리. 모듈을 읽어 들인 뒤 남는 힙
+    import gc, tracemalloc
+    from st7735.font import FIRST, LAST, WIDTH5x7
+    chars = [chr(c) for c in range(FIRST, LAST+1)]
+    old_src = "F = {\n" + "".join("    {!r}:[{}],\n".format(
+        c, ",".join("0x%02X" % b for b in FONT5x7[glyph(c):glyph(c)+5])) for c in chars) + "}\n"
+    new_src = "F = {!r}\nW = {!r}\n".format(FONT5x7, WIDTH5x7)
+    def heap(src):
+        gc.collect(); tracemalloc.start()
+        ns = {}; exec(compile(src, "font", "exec"), ns)
+        gc.collect(); cur = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return cur, ns
+    old, ns = heap(old_src)
+    new, _ = heap(new_src)
+    same = all(ns["F"][c] == list(FONT5x7[glyph(c):glyph(c)+5]) for c in chars)
+    print("dict-of-list {:>6} B (글자 {})".format(old, len(chars)))
+    print("bytes        {:>6} B (글꼴 {} + 폭표 {} B; freeze하면 힙 0)".format(new, len(FONT5x7), len(WIDTH5x7)))
+    print("x{:.1f}  글자 일치 {}".format(old / new, "OK" if same else "FAIL"))
+    return {"dict_bytes": old, "blob_bytes": new, "same": same, "ok": same}
+
+_DESCS = ("clear sky", "few clouds", "scattered clouds", "broken clouds", "overcast clouds",
+          "light rain", "moderate rain", "light intensity shower rain", "heavy intensity rain",
+          "thunderstorm with light drizzle", "mist")
+
+def layout(width=72, lines=2):
+    # 날씨 설명 칸(R_DESC): 예전 고정폭 한 줄 자르기 vs 가변폭 2줄 줄바꿈에서 보이는 글자 수
+    import time
+    from st7735.font import wrap, text_width
+    tft, rec = host_display(rotation=1)
+    print("{:<32} {:>6} {:>6}  {}".format("desc", "old", "new", "lines"))
+    shown_old = shown_new = total = 0
+    for d in _DESCS:
+        old = len(d[:width // 6])
+        ls = wrap(d, width, lines, prop=True)
+        new = sum(len(l.rstrip(".")) for l in ls) + len(ls) - 1
+        new = min(new, len(d))
+        shown_old += old; shown_new += new; total += len(d)
+        print("{:<32} {:>6} {:>6}  {}".format(d, old, new, " / ".join(ls)))
+    rec.reset()
+    t = time.perf_counter()
+    for _ in range(1000):
+        for d in _DESCS: tft.text_width(d, prop=True)
+    us = (time.perf_counter() - t) / (1000*len(_DESCS)) * 1e6
+    print("보이는 글자 {}/{} → {}/{}   text_width {:.1f} us/호출, 버스 {} tx".format(
+        shown_old, total, shown_new, total, us, rec.transactions))
+    return {"old": shown_old, "new": shown_new, "total": total, "text_width_us": us,
+            "bus_tx": rec.transactions}
+
+# 안티에일리어스 골든: (문자열, 배율, 가변폭) → 그린 RGB565 버퍼의 sha1 앞 16자리
+# (FG=(240,240,240) / RBG=(8,8,16), 글자 모양·팔레트 섞기가 바뀌면 여기서 잡힘)
+_AA_GOLDEN = {
+    "12:34:56|1|0": "7b63cfb51f514592", "12:34:56|2|0": "6cb241d858c12412",
+    "light rain|1|1": "a4eaeb75b552e78f", "AVWXYZ/2|2|0": "bef3db2970e1d134",
+    "thunderstorm|2|1": "17799540ecc0de90",
+}
+
+def _aa_render(tft, text, scale, prop, aa, fg, bg):
+    from st7735.font import text_width
+    w = text_width(text, scale, prop); h = 7*scale
+    buf = bytearray(w*h*2)
+    tft.text_into(buf, w*2, 0, 0, text, fg, bg, scale, prop, aa)
+    return w, h, buf
+
+def aa(show="2/", update=False):
+    # 안티에일리어스 글자: 골든 비교 + 전송량이 1비트 글자와 같은지 + 캐시 없을 때 블록 만드는 시간
+    import hashlib, time
+    FG = rgb565(240, 240, 240); RBG = rgb565(8, 8, 16)
+    tft, rec = host_display(rotation=1)
+    cases = [("12:34:56", 1, False), ("12:34:56", 2, False), ("light rain", 1, True),
+             ("AVWXYZ/2", 2, False), ("thunderstorm", 2, True)]
+    ok = True
+    for text, scale, prop in cases:
+        w, h, buf = _aa_render(tft, text, scale, prop, True, FG, RBG)
+        d = hashlib.sha1(buf).hexdigest()[:16]
+        key = "{}|{}|{}".format(text, scale, int(prop))
+        want = _AA_GOLDEN.get(key)
+        if update: _AA_GOLDEN[key] = d
+        good = want == d
+        ok = ok and good
+        print("{:<14} x{} {:<5} {}  {}".format(text, scale, "prop" if prop else "fixed", d,
+                                               "OK" if good else "FAIL (want {})".format(want)))
+    # 모양 눈으로 확인(알파 0~3 → " .:#")
+    from st7735 import aafont
+    for ch in show:
+        m = aafont.alpha_map(ch, 2)
+        for y in range(14):
+            print("  " + "".join(" .:#"[(m[(y*12+x) >> 2] >> (6 - 2*((y*12+x) & 3))) & 3] for x in range(12)))
+    res = {}
+    for aa_on in (False, True):
+        tft.glyphs.clear(); rec.reset()
+        t = time.perf_counter()
+        tft.draw_text(0, 0, "12:34:56", FG, bg=RBG, scale=2, aa=aa_on)
+        miss = time.perf_counter() - t
+        first = rec.snapshot(); rec.reset()
+        t = time.perf_counter()
+        tft.draw_text(0, 0, "12:34:56", FG, bg=RBG, scale=2, aa=aa_on)
+        hit = time.perf_counter() - t
+        again = rec.snapshot()
+        res["aa" if aa_on else "1bit"] = {"tx": again["transactions"], "bytes": again["bytes"],
+                                          "miss_ms": miss*1e3, "hit_ms": hit*1e3}
+        print("{:<5} tx {}  bytes {}  첫 그리기 {:.2f} ms  캐시 후 {:.2f} ms".format(
+            "aa" if aa_on else "1bit", again["transactions"], again["bytes"], miss*1e3, hit*1e3))
+    same = res["aa"]["tx"] == res["1bit"]["tx"] and res["aa"]["bytes"] == res["1bit"]["bytes"]
+    print("골든", "OK" if ok else "FAIL", " 전송량 같음", "OK" if same else "FAIL")
+    res["ok"] = ok and same
+    return res
+
+def widgets(minutes=10):
+    # 대시보드 위젯 트리를 PC에서(가짜 화면) 돌림: 5초마다 DHT 값이 들어올 때
+    # 예전처럼 매번 두 줄을 다시 그리기 vs 서식 적용 뒤 문자열이 바뀐 위젯만
+    # DHT는 0.1C/1% 단위라 대부분 같은 값 → 같은 값이면 전송 0바이트여야 함
+    import dashboard
+    n = minutes*60*1000 // dashboard.SENSOR_MS
+    readings = [(23.4 + 0.1*((i // 6) % 3), 41 + (i // 10) % 2) for i in range(n)]
+    res = {}
+    for mode in ("always", "changed"):
+        tft, rec = host_display(rotation=1)
+        dash = dashboard.Dashboard(tft)
+        dash.draw_background_once()
+        dash.draw_sensor_text(readings[0]); dash.draw_weather_text(("light rain", 17.3, 55))
+        dash.ui.render(dash.comp); dash.comp.flush()
+        rec.reset()
+        flushes = 0; idle_bytes = 0
+        for i, d in enumerate(readings[1:], 1):
+            changed = dash.draw_sensor_text(d)
+            if mode == "always":
+                dash.s_temp.invalidate(); dash.s_hum.invalidate()
+            elif not changed:
+                b = rec.bytes
+                dash.ui.render(dash.comp); dash.comp.flush()
+                idle_bytes += rec.bytes - b          # 같은 값: 그려지는 게 없어야 함
+                continue
+            dash.ui.render(dash.comp); dash.comp.flush()
+            flushes += 1
+        snap = rec.snapshot()
+        res[mode] = {"readings": n, "flushes": flushes, "redraws": dash.s_temp.draws + dash.s_hum.draws - 2,
+                     "bytes": snap["bytes"], "tx": snap["transactions"], "idle_bytes": idle_bytes}
+        print("{:<8} 읽기 {}  flush {:>4}  위젯 다시 그림 {:>4}  bytes {:>7}  tx {:>5}".format(
+            mode, n, flushes, res[mode]["redraws"], snap["bytes"], snap["transactions"]))
+    ok = res["changed"]["idle_bytes"] == 0 and res["changed"]["bytes"] < res["always"]["bytes"]
+    print("같은 값 전송 {} B  {}".format(res["changed"]["idle_bytes"], "OK" if ok else "FAIL"))
+    res["ok"] = ok
+    return res
+
+def sim(baud=20_000_000):
+    # 패널 시뮬레이터 자체 점검(좌표/반전/하드웨어 스크롤/log 재생/그라데이션) + tft_colorlane을 돌려 프레임별 SPI 시간
+    from st7735.sim import PanelSim, replay, run_script, summary
+    from st7735.scroll import HwScroll
+    RED = rgb565(255, 0, 0)
+    checks = {}
+    for rot in (0, 1):
+        s = PanelSim()
+        tft, rec = host_display(rotation=rot, mirror_x=True, recorder=s)
+        tft.fill_color(0); tft.fill_rect(3, 5, 4, 2, RED)
+        img = s.image()
+        checks["rot{} xy".format(rot)] = (s.pixel(3, 5, img) == RED and s.pixel(6, 6, img) == RED and
+                                          s.pixel(7, 5, img) == 0 and s.pixel(2, 5, img) == 0)
+    s = PanelSim()
+    tft, rec = host_display(rotation=0, invert=False, recorder=s)
+    tft.fill_color(RED)
+    checks["invoff"] = s.pixel(0, 0) == RED ^ 0xFFFF         # 이 유리는 INVON이어야 제 색
+    s = PanelSim(keep=True)
+    tft, rec = host_display(rotation=0, mirror_x=True, recorder=s, init=False)
+    tft.init()                                                # 초기화도 log에 남김(재생용)
+    sc = HwScroll(tft)
+    line = sc.scroll(1)[0]
+    sc.write_line(line, bytes((RED >> 8, RED & 0xFF))*tft.width)
+    img = s.image()
+    checks["hwscroll"] = s.pixel(0, tft.height-1, img) == RED and s.pixel(0, 0, img) == 0
+    checks["replay"] = replay(s.log).image()[2] == img[2]
+    # 그라데이션(tft_colorlane에는 없음): 위 절반은 세로, 아래 절반은 가로로 끝 색이 맞는지
+    s = PanelSim()
+    tft, rec = host_display(rotation=0, mirror_x=True, recorder=s)
+    w, h = tft.width, tft.height; half = h // 2
+    tft.gradient(0, 0, w, half, (0, 0, 64), (255, 128, 0))
+    tft.gradient(0, half, w, h-half, (0, 255, 128), (128, 0, 255), vertical=False)
+    img = s.image()
+    checks["gradient"] = (s.pixel(w//2, 0, img) == rgb565(0, 0, 64) and
+                          s.pixel(w//2, half-1, img) == rgb565(255, 128, 0) and
+                          s.pixel(0, h-1, img) == rgb565(0, 255, 128) and s.pixel(w-1, half, img) == rgb565(128, 0, 255))
+    for k, v in checks.items():
+        print("{:<10} {}".format(k, "OK" if v else "FAIL"))
+    run = summary(run_script("tft_colorlane.py", baudrate=baud))
+    print("tft_colorlane @{} Hz: 프레임 {}  bytes {}  tx {}  SPI/프레임 p50 {:.2f} ms  max {:.2f} ms".format(
+        baud, run["frames"], run["bytes"], run["tx"], run["spi_ms_p50"], run["spi_ms_max"]))
+    return {"checks": checks, "ok": all(checks.values()), "colorlane": run}
+
+def _set_window_per_cmd(tft, x0, y0, x1, y1):
+    # 예전 set_window: 명령/인자마다 CS를 올렸다 내리고, 명령 바이트·인자를 매번 새로 만듦(5 트랜잭션)
+    import struct
+    bus = tft.bus
+    x0 += tft.x_offset; x1 += tft.x_offset
+    y0 += tft.y_offset; y1 += tft.y_offset
+    for c, a in ((0x2A, struct.pack(">HH", x0, x1)), (0x2B, struct.pack(">HH", y0, y1)), (0x2C, None)):
+        bus.cs.value(0); bus.dc.value(0); bus.spi.write(bytearray([c])); bus.cs.value(1)
+        if a is not None:
+            bus.cs.value(0); bus.dc.value(1); bus.spi.write(a); bus.cs.value(1)
+
+def window(n=1000):
+    # set_window + 글자 한 칸(6x7) 픽셀 전송의 비용: 예전(명령마다 트랜잭션) vs 묶음(CS 한 번, 미리 잡은
+    # 인자 버퍼, 같은 창이면 CASET/PASET 생략). 할당 수는 SPI로 넘긴 버퍼를 붙잡아 두고 tracemalloc으로 셈
+    # (bytearray는 객체 + 내용 두 번)
+    import gc, time, tracemalloc
+    tft, rec = host_display(rotation=1)
+    bus = tft.bus
+    px = bytes(6*7*2)
+    modes = (("old", lambda x0, y0, x1, y1: _set_window_per_cmd(tft, x0, y0, x1, y1), False),
+             ("coalesced", tft.set_window, False), ("same-window", tft.set_window, True))
+    def run(setw, same, k):
+        for i in range(k):
+            x = 4 if same else 4 + 6*(i % 8)          # 시계 숫자 칸처럼 옆 칸으로 옮겨 가며
+            setw(x, 6, x+5, 12)
+            bus.begin_data(); bus.write(px); bus.end()
+    res = {}
+    print("{:<12} {:>7} {:>9} {:>10} {:>9} {:>8}".format("mode", "tx/창", "CS토글/창", "설정 B/창", "할당/창", "us/창"))
+    for name, setw, same in modes:
+        run(setw, same, 8)
+        rec.reset()
+        t = time.perf_counter(); run(setw, same, n); us = (time.perf_counter() - t)/n*1e6
+        snap = rec.snapshot()
+        keep = [None]*(n*8); at = [0]; write = bus.spi.write
+        def hold(b):
+            keep[at[0]] = b; at[0] += 1; write(b)
+        bus.spi.write = hold
+        gc.collect(); tracemalloc.start()
+        flt = [tracemalloc.Filter(False, "*host.py"), tracemalloc.Filter(False, tracemalloc.__file__)]
+        before = tracemalloc.take_snapshot().filter_traces(flt)
+        run(setw, same, n)
+        after = tracemalloc.take_snapshot().filter_traces(flt)
+        tracemalloc.stop()
+        del bus.spi.write
+        allocs = sum(st.count_diff for st in after.compare_to(before, "filename")) / n
+        r = res[name] = {"tx": snap["transactions"]/n, "cs": snap["cs_toggles"]/n,
+                         "setup_bytes": snap["bytes"]/n - len(px), "allocs": allocs, "us": us}
+        print("{:<12} {:>7.2f} {:>9.2f} {:>10.1f} {:>9.2f} {:>8.1f}".format(
+            name, r["tx"], r["cs"], r["setup_bytes"], r["allocs"], us))
+    ok = (res["coalesced"]["tx"] == 1 and res["coalesced"]["allocs"] < 0.01 and
+          res["same-window"]["setup_bytes"] == 1)
+    print("창+픽셀 한 트랜잭션, 할당 없음, 같은 창은 RAMWR만", "OK" if ok else "FAIL")
+    res["ok"] = ok
+    return res
+
+def calibrate(seeds=(1, 2, 3), ber=1e-3):
+    # 되읽기 SPI 속도 맞추기: 패널 흉내(PanelSim, MISO 응답)에 "이 속도 넘으면 비트 오류"를 넣고
+    # 고른 속도가 오류 없는 가장 빠른 단계인지. MISO 없음 → fallback, 두 번째 부팅은 저장 값을 한 번만 확인
+    import os, tempfile
+    from st7735 import calibrate as cal
+    from st7735.host import Recorder
+    from st7735.sim import PanelSim
+    def expect(th):
+        ok = [r for r in cal.RATES if th is None or r <= th]
+        return max(ok) if ok else None
+    res = {"runs": []}
+    good = True
+    print("{:>10} {:>5} {:>10} {:>6} {:>8} {:>8}".format("오류>Hz", "seed", "고름", "시도", "뒤집힘", "읽기 B"))
+    for th in (None, 70_000_000, 50_000_000, 30_000_000, 15_000_000):
+        for seed in seeds:
+            errors = None if th is None else {"error_above": th, "ber": ber, "seed": seed}
+            tft, rec = host_display(rotation=1, recorder=PanelSim(), errors=errors)
+            chosen, log = cal.calibrate(tft)
+            flips = getattr(tft.bus.spi, "flips", 0)
+            ok = chosen == expect(th) and tft.bus.spi.baudrate == chosen
+            good = good and ok
+            res["runs"].append({"error_above": th, "seed": seed, "chosen": chosen, "tried": len(log),
+                                "flips": flips, "read_bytes": rec.read_bytes, "ok": ok})
+            print("{:>10} {:>5} {:>10} {:>6} {:>8} {:>8}{}".format(
+                "-" if th is None else th, seed, chosen, len(log), flips, rec.read_bytes, "" if ok else "  FAIL"))
+    tft, rec = host_display(rotation=1)
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "spi.bin")
+        nomiso = cal.ensure(tft, path, fallback=20_000_000)
+        nomiso_ok = nomiso == 20_000_000 and not os.path.exists(path)
+        print("MISO 없음: {} Hz, 저장 {}".format(nomiso, "없음" if nomiso_ok else "됨"))
+        errors = {"error_above": 30_000_000, "ber": ber, "seed": 1}
+        boots = []
+        for k in range(2):
+            tft, rec = host_display(rotation=1, recorder=PanelSim(), errors=errors)
+            rec.reset()
+            baud = cal.ensure(tft, path)
+            snap = rec.snapshot()
+            boots.append({"baud": baud, "tx": snap["transactions"], "bytes": snap["bytes"],
+                          "read_bytes": rec.read_bytes})
+            print("부팅 {}: {} Hz, 전송 {} B/{} tx, 읽기 {} B".format(
+                k + 1, baud, snap["bytes"], snap["transactions"], rec.read_bytes))
+        tft, rec = host_display(rotation=1, recorder=PanelSim(), errors={"error_above": 15_000_000, "ber": ber})
+        again = cal.ensure(tft, path)
+        print("배선이 나빠짐(오류>15MHz): 저장 {} → {} Hz".format(boots[1]["baud"], again))
+    persist_ok = (boots[0]["baud"] == boots[1]["baud"] == 26_666_666 and
+                  boots[1]["read_bytes"] < boots[0]["read_bytes"] and again == 13_333_333)
+    # MISO가 떠 있음(읽을 때마다 잡음): 패널이 있다고 믿지 않음 → 시험 무늬를 안 씀
+    class Floating(Recorder):
+        def __init__(self):
+            import random
+            self._rnd = random.Random(7); Recorder.__init__(self)
+        def read(self, n):
+            Recorder.read(self, n)
+            return bytes(self._rnd.getrandbits(8) for _ in range(n))
+    tft, rec = host_display(rotation=1, recorder=Floating())
+    rec.reset()
+    chosen, log = cal.calibrate(tft)
+    noise_ok = chosen is None and not log and rec.data_bytes == 0
+    # 모든 속도에서 틀림(가장 느린 시험 속도도 넘는 배선 한계): fallback 속도로 다시 초기화 → 시험 무늬가 안 남음
+    sim = PanelSim()
+    tft, rec = host_display(rotation=1, recorder=sim, errors={"error_above": 9_000_000, "ber": ber, "seed": 1})
+    chosen, log = cal.calibrate(tft, fallback=8_000_000)
+    iw, ih, img = sim.image()
+    blank = img == img[:2]*(iw*ih)           # 화면 전체가 한 색(초기화의 검은 화면)
+    allbad_ok = (chosen is None and len(log) == len(cal.RATES) and tft.bus.spi.baudrate == 8_000_000 and blank)
+    print("MISO 잡음: 시험 안 함 {}  모든 속도 실패: fallback으로 다시 초기화, 무늬 지워짐 {}".format(
+        "OK" if noise_ok else "FAIL", "OK" if allbad_ok else "FAIL"))
+    ok = good and nomiso_ok and persist_ok and noise_ok and allbad_ok
+    print("오류 없는 가장 빠른 속도, MISO 없으면 fallback, 저장 값은 한 번 확인", "OK" if ok else "FAIL")
+    res.update({"nomiso": nomiso, "boots": boots, "degraded": again, "noise": noise_ok, "all_bad": allbad_ok,
+                "ok": ok})
+    return res
+
+def _expand_per_pixel(dst, d, src, s, n, pal16):
+    # 비교용: 픽셀(4비트)마다 16칸 표에서 2바이트씩
+    for b in src[s:s+n]:
+        j = (b >> 4) << 1
+        dst[d] = pal16[j]; dst[d+1] = pal16[j+1]
+        j = (b & 15) << 1
+        dst[d+2] = pal16[j]; dst[d+3] = pal16[j+1]
+        d += 4
+
+def indexed(frames=50):
+    # 16색 팔레트 화면 버퍼(4비트/픽셀): RAM, flush 때 RGB565로 펼치는 속도, RGB565 버퍼와 화면이 같은지
+    # 펼치기: 바이트(두 픽셀)→4바이트 표(256칸) vs 픽셀마다 16칸 표. 전체 화면 = 160x80
+    # 시간은 참고용(호스트에서는 차이가 잡음 수준). 판정은 결과가 같은지와 바이트마다 조각을 안 만드는지
+    import time, dashboard
+    from st7735.compositor import Compositor
+    from st7735.indexed import IndexedCompositor, expand
+    from st7735.sim import PanelSim
+    tft, rec = host_display(rotation=1)
+    ic = IndexedCompositor(tft, dashboard.PALETTE)
+    ic._build_lut()
+    src = memoryview(ic.buf)
+    for i in range(len(ic.buf)):
+        ic.buf[i] = (i*37) & 0xFF
+    px = tft.width*tft.height
+    dst = bytearray(px*2)
+    pal16 = bytearray(32)
+    for i, c in enumerate(ic.palette):                 # 같은 색은 한 칸(PANEL == RBG)
+        pal16[2*i] = c >> 8; pal16[2*i+1] = c & 0xFF
+    ref = bytearray(px*2)
+    _expand_per_pixel(ref, 0, src, 0, len(ic.buf), pal16)
+    res = {"ram": {"rgb565": px*2, "indexed": len(ic.buf), "lut": len(ic._lut)}}
+    print("화면 버퍼 RGB565 {} B → 팔레트 {} B (+ 펼치기 표 {} B)".format(px*2, len(ic.buf), len(ic._lut)))
+    print("{:<12} {:>10} {:>10}".format("펼치기", "ms/화면", "Mpx/s"))
+    runs = (("per-pixel", lambda: _expand_per_pixel(dst, 0, src, 0, len(ic.buf), pal16)),
+            ("byte-lut", lambda: expand(dst, 0, src, 0, len(ic.buf), ic._lut)))
+    for name, fn in runs:
+        fn()
+        same = dst == ref
+        t = time.perf_counter()
+        for _ in range(frames):
+            fn()
+        ms = (time.perf_counter() - t)/frames*1000
+        res[name] = {"ms": ms, "mpx_s": px/ms/1000, "same": same}
+        print("{:<12} {:>10.2f} {:>10.2f}{}".format(name, ms, px/ms/1000, "" if same else "  FAIL"))
+    # 전체 flush(펼치기 + 전송, 전송은 가짜 SPI라 거의 0) RGB565 버퍼 복사와 비교
+    for name, C in (("rgb565", Compositor), ("indexed", IndexedCompositor)):
+        tft, rec = host_display(rotation=1)
+        c = C(tft)
+        c.fill(dashboard.PANEL); c.flush()
+        t = time.perf_counter()
+        for _ in range(frames):
+            c.invalidate(0, 0, c.width, c.height); c.flush()
+        ms = (time.perf_counter() - t)/frames*1000
+        res["flush_" + name] = ms
+        print("flush 전체 화면 {:<8} {:>7.2f} ms".format(name, ms))
+    # 표(lut)를 조각으로 읽으면(lut[j:j+4]) 바이트마다 새 객체 → 조각 읽기 횟수를 셈
+    class _Lut(bytearray):
+        slices = 0
+        def __getitem__(self, k):
+            if isinstance(k, slice): _Lut.slices += 1
+            return bytearray.__getitem__(self, k)
+    expand(dst, 0, src, 0, len(ic.buf), _Lut(ic._lut))
+    res["lut_slices"] = _Lut.slices
+    print("펼치기 중 표 조각 읽기 {} 번(화면 {} 바이트)".format(_Lut.slices, len(ic.buf)))
+    # 대시보드 첫 화면 + 값 갱신: RGB565(aa 끔)와 팔레트가 패널에서 같은 그림인지, 전송량도 같은지
+    out = {}
+    for mode in ("rgb565", "indexed"):
+        sim = PanelSim()
+        tft, rec = host_display(rotation=1, recorder=sim)
+        dash = dashboard.Dashboard(tft, aa=False, indexed=(mode == "indexed"))
+        dash.draw_background_once()
+        dash.draw_clock((2024, 1, 1, 12, 34, 56, 0, 0))
+        dash.draw_sensor_text((23.4, 41)); dash.draw_weather_text(("light rain", 17.3, 55))
+        dash.ui.render(dash.comp); dash.comp.flush()
+        dash.draw_clock((2024, 1, 1, 12, 34, 57, 0, 0)); dash.draw_sensor_text((23.5, 41))
+        dash.ui.render(dash.comp); dash.comp.flush()
+        out[mode] = (sim.image()[2], rec.bytes, len(dash.comp.buf))
+    same = out["rgb565"][0] == out["indexed"][0]
+    print("대시보드 화면 같음 {}  전송 {} B vs {} B  버퍼 {} B vs {} B".format(
+        same, out["rgb565"][1], out["indexed"][1], out["rgb565"][2], out["indexed"][2]))
+    ok = same and all(res[k]["same"] for k in ("per-pixel", "byte-lut")) and res["lut_slices"] == 0
+    print("팔레트 버퍼 = RGB565 버퍼 화면, 펼치기에 바이트별 할당 없음", "OK" if ok else "FAIL")
+    res.update({"dashboard_same": same, "dashboard_bytes": [out["rgb565"][1], out["indexed"][1]], "ok": ok})
+    return res
+
+def profile(frames=200):
+    # st7735.profile: 꺼져 있을 때 비용(드라이버는 안 감쌈, 루프의 frame()/sleep_ms()만 남음),
+    # 켰을 때 호출당 비용, 그리고 바운싱 볼 루프(demo_bounce)의 프레임 분해가 그리기/SPI/대기로 나뉘는지
+    import time, compat
+    from st7735 import profile as prof
+    from st7735.sprites import Sprite, SpriteLayer
+    def loop(tft, n, pad_ms):
+        layer = SpriteLayer(tft, 0)
+        layer.clear()
+        balls = [[layer.add(Sprite.circle(4 + i, 0xF800 + 0x41*i, x=8 + 12*i, y=8 + 25*i)), 1 + i % 3, 2]
+                 for i in range(5)]
+        for _ in range(n):
+            for b in balls:
+                s, dx, dy = b
+                x = s.x + dx; y = s.y + dy
+                if x <= 0 or x + s.w >= tft.width: b[1] = -dx
+                if y <= 0 or y + s.h >= tft.height: b[2] = -dy
+                s.move_to(x, y)
+            layer.update()
+            prof.sleep_ms(pad_ms)
+            prof.frame()
+    res = {}
+    print("{:<10} {:>10} {:>12}".format("mode", "us/프레임", "감싼 메서드"))
+    for mode in ("none", "off", "on"):
+        tft, rec = host_display(rotation=0)
+        if mode == "on":
+            prof.enable(tft, frames=64)
+        elif mode == "none":
+            saved = (prof.sleep_ms, prof.frame)
+            prof.sleep_ms = compat.sleep_ms; prof.frame = lambda: None   # 프로파일러 호출이 없던 때
+        loop(tft, 10, 0)
+        t = time.perf_counter()
+        loop(tft, frames, 0)
+        us = (time.perf_counter() - t)/frames*1e6
+        wrapped = sum(1 for k in prof.DRIVER if k in tft.__dict__)
+        if mode == "on":
+            prof.disable()
+        elif mode == "none":
+            prof.sleep_ms, prof.frame = saved
+        res[mode] = {"us": us, "wrapped": wrapped}
+        print("{:<10} {:>10.1f} {:>12}".format(mode, us, wrapped))
+    tft, rec = host_display(rotation=0)
+    prof.enable(tft, frames=64)
+    loop(tft, 100, 12)
+    s = prof.report()
+    prof.disable()
+    f = s["frames"]
+    restored = type(tft.bus.spi).__name__ == "HostSPI" and not any(k in tft.__dict__ for k in prof.DRIVER)
+    ok = (res["off"]["wrapped"] == 0 and res["off"]["us"] < res["none"]["us"]*1.25 + 20 and restored and
+          f["sleep"][0] >= 12000 and f["spi"][0] <= f["draw"][0] <= f["wall"][0] and s["calls"]["spi.write"]["n"] > 0)
+    print("꺼짐 = 감싼 것 없음, 켜면 그리기/SPI/대기로 나뉨, 끄면 원래대로", "OK" if ok else "FAIL")
+    res.update({"frames": f, "ok": ok})
+    return res
+
+# ── 표준 작업 모음(suite): 커밋마다 돌려서 JSON으로 남기고 diff로 비교
+# 작업마다 새 화면(호스트: 가짜 SPI)에서 돌려 트랜잭션/바이트/할당/시간을 셈
+# 보드에서는 bench.suite(tft=tft): 전송량은 못 세고(None) 시간과 할당만(정의는 _allocs, 호스트와 같음)
+# 긴 작업은 제너레이터: yield마다 한 덩어리(몇 프레임/1분 등). 할당은 덩어리 경계에서 잼
+def _w_fill(tft, n=10):
+    for i in range(n):
+        tft.fill_color(rgb565(255*(i & 1), 64, 255*(~i & 1)))
+        yield
+
+_BARS = ((255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 0),
+         (255, 0, 255), (0, 255, 255), (255, 255, 255), (32, 32, 32))
+
+def _w_colorlane(tft):
+    # tft_colorlane.py의 화면 순서(대기 없이): 막대마다 fill_color(재사용 채우기 버퍼)
+    colors = [rgb565(*c) for c in _BARS]
+    tft.fill_color(rgb565(0, 0, 0))
+    bar_h = tft.height // len(colors)
+    for i, c in enumerate(colors):
+        tft.fill_color(c, 0, i*bar_h, tft.width, bar_h)
+    tft.rect(0, 0, tft.width, tft.height, rgb565(255, 255, 255))
+    tft.hline(0, tft.height//2, tft.width, rgb565(255, 128, 0))
+    tft.vline(tft.width//2, 0, tft.height, rgb565(0, 255, 255))
+
+def _w_gradient(tft):
+    # 그라데이션(위 세로, 아래 가로) 다음 같은 막대를 fill_runs 창 하나로(데모 스크립트에는 없음)
+    half = tft.height // 2
+    tft.gradient(0, 0, tft.width, half, (0, 0, 64), (255, 128, 0))
+    tft.gradient(0, half, tft.width, tft.height-half, (0, 255, 128), (128, 0, 255), vertical=False)
+    colors = [rgb565(*c) for c in _BARS]
+    bar_h = tft.height // len(colors)
+    tft.fill_runs(0, 0, tft.width, bar_h*len(colors), [(c, tft.width*bar_h) for c in colors])
+
+def _w_text(tft, scale, n=100):
+    words = ("T:23.4C", "H:41%", "12:34:56", "Seoul", "light rain", "No data", "WEATHER", "SENSOR")
+    lh = 8*scale
+    for i in range(n):
+        tft.draw_text(0, (i*lh) % (tft.height - lh), words[i % len(words)], 0xFFFF, 0, scale)
+        if i % 10 == 9: yield
+
+def _w_fast_scroll(tft, frames=300):
+    # tft_fastscroll.demo_fast_scroll: 16줄 전광판, 프레임 간격 5ms(가상 시간)
+    from st7735.marquee import Marquee
+    from st7735.present import DoubleBuffer
+    mq = Marquee(tft, 0, tft.height - 18, tft.width, 16, "FAST SCROLL  ST7735  ESP32-C3  ",
+                 rgb565(100, 255, 180), 0, speed=200)
+    db = DoubleBuffer(tft, tft.width, 16, threaded=False)
+    for i in range(frames):
+        mq.step(mq._t0 + 5*i, present=db)
+        if i % 10 == 9: yield
+
+def _w_bounce(tft, frames=300, n=5):
+    # tft_fastscroll.demo_bounce: 공 5개(색 고정)
+    from st7735.sprites import Sprite, SpriteLayer
+    layer = SpriteLayer(tft, 0)
+    layer.clear()
+    balls = []
+    for i in range(n):
+        r = 4 + i % 4
+        balls.append([layer.add(Sprite.circle(r, rgb565(255, 40*i, 255 - 40*i), x=8 + 12*i % (tft.width-2*r-8),
+                                              y=8 + 25*i)), 1 + i % 3, 2 + (i+1) % 2])
+    for i in range(frames):
+        for b in balls:
+            s, dx, dy = b
+            x = s.x + dx; y = s.y + dy
+            if x <= 0 or x + s.w >= tft.width: b[1] = -dx
+            if y <= 0 or y + s.h >= tft.height: b[2] = -dy
+            s.move_to(x, y)
+        layer.update()
+        if i % 10 == 9: yield
+
+def _w_weather_hour(tft, seconds=3600):
+    # tft_weather.main 한 시간: 초마다 시계, 5초마다 센서, 10분마다 날씨(값이 바뀔 때만 flush)
+    import dashboard
+    dash = dashboard.Dashboard(tft)
+    dash.synced = True
+    dash.draw_background_once()
+    descs = ("light rain", "clear sky", "broken clouds")
+    for t in range(seconds):
+        ch = dash.draw_clock((2024, 1, 1, 12 + t // 3600, (t // 60) % 60, t % 60, 0, 0))
+        if t % (dashboard.SENSOR_MS // 1000) == 0:
+            i = t // 5
+            ch = dash.draw_sensor_text((23.4 + 0.1*((i // 6) % 3), 41 + (i // 10) % 2)) or ch
+        if t % 600 == 0:
+            k = t // 600
+            ch = dash.draw_weather_text((descs[k % 3], 17.3 + 0.2*k, 55 - k)) or ch
+        if ch:
+            dash.ui.render(dash.comp); dash.comp.flush()
+        if t % 60 == 59: yield
+
+WORKLOADS = {
+    "fill": _w_fill,
+    "colorlane": _w_colorlane,
+    "gradient": _w_gradient,
+    "text_s1": lambda tft: _w_text(tft, 1),
+    "text_s2": lambda tft: _w_text(tft, 2),
+    "fast_scroll": _w_fast_scroll,
+    "bounce": _w_bounce,
+    "weather_hour": _w_weather_hour,
+}
+_ROT = {"colorlane": 0, "gradient": 0, "fast_scroll": 0, "bounce": 0}     # 나머지는 가로(1)
+
+def _run(fn, tft, tick=None):
+    # 작업 하나를 끝까지. 제너레이터면 덩어리마다 tick()
+    it = fn(tft)
+    if it is not None:
+        for _ in it:
+            if tick: tick()
+
+def _wall(fn, tft):
+    from compat import ticks_us, ticks_diff
+    t = ticks_us()
+    _run(fn, tft)
+    return ticks_diff(ticks_us(), t)/1000
+
+def _heap():
+    # (사용 중인 힙 함수, 측정 방식, 멈추는 함수). 호스트 tracemalloc 현재값, 보드 gc.mem_alloc()
+    # tracemalloc은 켠 뒤에 잡은 것만 세므로 할당 측정 내내 켜 둠(작업마다 켜면 그 전 것을 놓는 게 안 보임)
+    import gc
+    try:
+        import tracemalloc
+    except ImportError:
+        return gc.mem_alloc, "gc.mem_alloc", lambda: None
+    tracemalloc.start()
+    return (lambda: tracemalloc.get_traced_memory()[0]), "tracemalloc", tracemalloc.stop
+
+def _allocs(fn, tft, used):
+    # (최고 힙 증가, 끝나고 남은 바이트). gc는 켠 채로(끄면 보드에서 긴 작업이 MemoryError)
+    # 호스트와 보드가 같은 정의: 시작 전 gc.collect 후 사용 중인 힙을 기준으로, 덩어리 경계마다
+    # gc.collect 후 사용 중인 힙의 최고치(= 보드의 gc.mem_free 최저점). 덩어리 안의 잠깐 쓰레기는 안 셈
+    import gc
+    gc.collect()
+    base = used(); peak = [0]
+    def tick():
+        gc.collect()
+        peak[0] = max(peak[0], used() - base)
+    _run(fn, tft, tick)
+    tick()
+    return peak[0], used() - base
+
+def _git_rev():
+    try:
+        import subprocess
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True).stdout.strip() or None
+    except Exception:
+        return None
+
+def suite(names=None, out="suite.json", tft=None, repeat=5):
+    # names: WORKLOADS 중 일부(None이면 전부). out: 결과 JSON 경로(None이면 안 씀)
+    # 전송량/할당은 먼저 작업마다 한 번씩(매번 같아야 함), 시간은 그 뒤 repeat번 중 가장 빠른 값
+    # (tracemalloc을 켠 실행은 느려서 시간에서 뺌)
+    import json, sys
+    import dashboard, st7735.marquee, st7735.present, st7735.sprites   # 모듈 로딩은 할당에서 빼려고 미리
+    names = names or list(WORKLOADS)
+    results = {}
+    print("{:<13} {:>7} {:>9} {:>8} {:>10} {:>9}".format("workload", "tx", "bytes", "CS", "alloc B", "ms"))
+    def display(name):
+        if tft is None:
+            return host_display(rotation=_ROT.get(name, 1))
+        return tft, None
+    used, how, stop = _heap()
+    try:
+        for name in names:
+            t, rec = display(name)
+            alloc, live = _allocs(WORKLOADS[name], t, used)
+            snap = rec.snapshot() if rec is not None else {}
+            results[name] = {"tx": snap.get("transactions"), "bytes": snap.get("bytes"),
+                             "cs_toggles": snap.get("cs_toggles"), "alloc_bytes": alloc,
+                             "alloc_live": live, "alloc_method": how}
+    finally:
+        stop()
+    for name in names:
+        best = None
+        for _ in range(repeat):
+            ms = _wall(WORKLOADS[name], display(name)[0])
+            best = ms if best is None else min(best, ms)
+        r = results[name]; r["wall_ms"] = round(best, 3)
+        print("{:<13} {:>7} {:>9} {:>8} {:>10} {:>9.2f}".format(
+            name, r["tx"] if r["tx"] is not None else "-", r["bytes"] if r["bytes"] is not None else "-",
+            r["cs_toggles"] if r["cs_toggles"] is not None else "-", r["alloc_bytes"], r["wall_ms"]))
+    doc = {"meta": {"rev": _git_rev() if tft is None else None, "platform": sys.platform,
+                    "impl": sys.implementation.name, "target": "host" if tft is None else "board"},
+           "workloads": results}
+    if out:
+        with open(out, "w") as f:
+            try:
+                json.dump(doc, f, indent=1, sort_keys=True)
+            except TypeError:               # MicroPython json.dump(obj, stream[, separators])
+                json.dump(doc, f)
+            f.write("\n")
+        print("→", out)
+    return doc
+
+def suite_board():
+    # suite의 보드 경로를 PC에서: tracemalloc 없음 → gc.mem_alloc, json.dump는 MicroPython처럼
+    # 키워드 인자를 안 받음, tft를 넘겨받음(전송량 None). 작업 전부를 돌려서
+    # - gc가 내내 켜져 있는지(끄면 보드에서 긴 작업이 MemoryError)
+    # - 할당 값이 호스트 경로와 같은 정의인지(mem_alloc을 tracemalloc 현재값으로 흉내 → 값이 같아야 함)
+    import gc, json, os, tempfile, tracemalloc
+    def strict_dump(obj, stream, separators=None):
+        stream.write(json.dumps(obj, separators=separators))
+    off = [0]
+    def mem_alloc():
+        if not gc.isenabled(): off[0] += 1
+        return tracemalloc.get_traced_memory()[0]
+    for name, fn in WORKLOADS.items():        # 작업 안의 첫 import는 양쪽 다 빼려고 미리 한 번
+        _run(fn, host_display(rotation=_ROT.get(name, 1))[0])
+    # 비교 기준: 같은 순서로 화면 하나를 넘겨서 tracemalloc으로(글리프 캐시 등이 이어지는 것까지 같게)
+    host = suite(out=None, tft=host_display(rotation=1)[0], repeat=1)["workloads"]
+    saved = (sys.modules.get("tracemalloc"), json.dump, getattr(gc, "mem_alloc", None))
+    sys.modules["tracemalloc"] = None        # import tracemalloc → ImportError
+    json.dump = strict_dump; gc.mem_alloc = mem_alloc
+    tracemalloc.start()
+    tft, rec = host_display(rotation=1)
+    d = tempfile.TemporaryDirectory()
+    out = os.path.join(d.name, "board.json")
+    try:
+        suite(out=out, tft=tft, repeat=1)
+        with open(out) as f:
+            doc = json.load(f)
+    finally:
+        tracemalloc.stop()
+        if saved[0] is None: del sys.modules["tracemalloc"]
+        else: sys.modules["tracemalloc"] = saved[0]
+        json.dump = saved[1]
+        if saved[2] is None: del gc.mem_alloc
+        else: gc.mem_alloc = saved[2]
+        d.cleanup()
+    w = doc["workloads"]
+    close = all(abs(w[k]["alloc_bytes"] - host[k]["alloc_bytes"]) <= max(1024, host[k]["alloc_bytes"]//10)
+                for k in WORKLOADS)
+    ok = (doc["meta"]["target"] == "board" and set(w) == set(WORKLOADS) and not off[0] and close and
+          all(r["alloc_method"] == "gc.mem_alloc" and r["alloc_bytes"] >= 0 and r["tx"] is None and
+              r["wall_ms"] >= 0 for r in w.values()) and gc.isenabled())
+    for k in WORKLOADS:
+        print("{:<13} 호스트 {:>7} B  보드 경로 {:>7} B".format(k, host[k]["alloc_bytes"], w[k]["alloc_bytes"]))
+    print("보드 경로(작업 전부, gc 켠 채로, 호스트와 같은 할당 정의, json.dump 인자 없이)", "OK" if ok else "FAIL")
+    return {"doc": doc, "host": host, "ok": ok}
+
+def diff(old, new, tolerance=0.25):
+    # suite JSON 두 개 비교. 전송량/할당은 조금이라도 바뀌면, 시간은 tolerance 넘게 바뀌면 표시
+    import json
+    with open(old) as f: a = json.load(f)["workloads"]
+    with open(new) as f: b = json.load(f)["workloads"]
+    changed = {}
+    print("{:<13} {:<12} {:>12} {:>12} {:>8}".format("workload", "metric", "old", "new", "change"))
+    for name in sorted(set(a) | set(b)):
+        ra = a.get(name, {}); rb = b.get(name, {})
+        for m in ("tx", "bytes", "cs_toggles", "alloc_bytes", "wall_ms"):
+            va = ra.get(m); vb = rb.get(m)
+            if va == vb:
+                continue
+            rel = (vb - va)/va if va and vb is not None else None
+            if m == "wall_ms" and rel is not None and abs(rel) <= tolerance:
+                continue
+            changed.setdefault(name, {})[m] = (va, vb)
+            print("{:<13} {:<12} {:>12} {:>12} {:>8}".format(
+                name, m, "-" if va is None else va, "-" if vb is None else vb,
+                "-" if rel is None else "{:+.1%}".format(rel)))
+    if not changed:
+        print("차이 없음")
+    return changed
+
+BENCHES = {"text": text, "glyphs": glyphs, "dashboard": dashboard, "clock": clock, "jitter": jitter,
+           "weather_fetch": weather_fetch, "weather_cache": weather_cache,
+           "wifi_reconnect": wifi_reconnect,
+           "boot": boot, "hwscroll": hwscroll,
+           "marquee": marquee, "present": present,
+           "sprites": sprites, "fills": fills,
+           "font": font, "layout": layout,
+           "aa": aa, "widgets": widgets, "sim": sim,
+           "window": window, "calibrate": calibrate,
+           "indexed": indexed, "profile": profile,
+           "suite": suite, "suite_board": suite_board}
+
+if __name__ == "__main__":
+    # python3 bench.py diff old.json new.json: suite 결과 비교
+    if sys.argv[1:2] == ["diff"]:
+        diff(*sys.argv[2:4])
+    else:
+        # 확인(ok)이 있는 bench 중 하나라도 실패하면 종료 코드 1(스크립트/CI에서 잡히도록)
+        failed = []
+        for name in (sys.argv[1:] or list(BENCHES)):
+            r = BENCHES[name]()
+            if isinstance(r, dict) and r.get("ok") is False:
+                failed.append(name)
+        if failed:
+            print("FAIL:", " ".join(failed))
+            sys.exit(1)
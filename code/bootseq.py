@@ -0,0 +1,61 @@
+# ── 부팅 순서 조율 + 단계별 시간 기록
+# 직렬(패널 초기화 → 배경 → Wi-Fi 최대 15s → NTP → 첫 데이터) 대신
+# Wi-Fi 접속을 맨 먼저 걸어 두고, 패널 리셋 대기/첫 화면 그리기/NTP를 그 사이에 겹쳐서 진행
+from compat import asyncio, ticks_ms, ticks_diff
+
+class Timeline:
+    # 단계 이름별 (시작, 끝) ms(부팅 시작 기준). 같은 단계는 처음 begin/end만 기록
+    def __init__(self):
+        self.t0 = ticks_ms()
+        self.phases = {}
+        self.order = []
+
+    def now(self):
+        return ticks_diff(ticks_ms(), self.t0)
+
+    def begin(self, name):
+        if name not in self.phases:
+            self.phases[name] = [self.now(), None]
+            self.order.append(name)
+
+    def end(self, name):
+        p = self.phases.get(name)
+        if p is not None and p[1] is None:
+            p[1] = self.now()
+
+    def mark(self, name):
+        self.begin(name); self.end(name)
+
+    def as_list(self):
+        return [(n, self.phases[n][0], self.phases[n][1]) for n in self.order]
+
+    def print(self, width=40):
+        # 간단한 막대 그래프(시리얼 REPL용)
+        rows = self.as_list()
+        total = max([e for _, _, e in rows if e is not None] + [1])
+        for name, s, e in rows:
+            e2 = e if e is not None else total
+            a = s * width // total; b = max(a + 1, e2 * width // total)
+            print("{:<13} {:>6} {:>6}  |{}{}{}|".format(
+                name, s, "-" if e is None else e, " " * a, "#" * (b - a), " " * (width - b)))
+
+async def start(tft, wifi, tl, spi_cache=None, spi_baud=20_000_000):
+    # Wi-Fi 감시(=첫 접속) 작업을 먼저 띄우고, 패널 초기화 대기 동안 접속이 진행되게 함
+    # spi_cache: 주면 초기화 뒤 SPI 속도를 되읽기로 맞춤(st7735.calibrate, 저장된 값이면 한 번 확인만)
+    # spi_baud: SPI를 만들 때 준 속도(되읽기가 안 되면 이 값으로 되돌림. machine.SPI는 속도를 못 읽음)
+    tl.begin("wifi")
+    def up(on, mgr):
+        if on: tl.end("wifi")
+    wifi.on_change(up)
+    if wifi.isconnected(): tl.end("wifi")
+    task = asyncio.create_task(wifi.supervise())
+    if not tft.ready:
+        tl.begin("display_init")
+        await tft.init_async()
+        tl.end("display_init")
+    if spi_cache:
+        from st7735 import calibrate
+        tl.begin("spi_cal")
+        calibrate.ensure(tft, spi_cache, fallback=spi_baud)
+        tl.end("spi_cal")
+    return task
@@ -0,0 +1,32 @@
+# MicroPython / CPython(호스트) 공용 시간·상수 헬퍼
+# 보드에서는 time.sleep_ms/ticks_* 를 그대로 쓰고, PC에서는 같은 이름으로 흉내냄
+import time
+
+try:
+    sleep_ms   = time.sleep_ms
+    ticks_ms   = time.ticks_ms
+    ticks_us   = time.ticks_us
+    ticks_diff = time.ticks_diff
+    ticks_add  = time.ticks_add
+except AttributeError:
+    def sleep_ms(ms): time.sleep(ms / 1000)
+    def ticks_ms(): return time.monotonic_ns() // 1_000_000
+    def ticks_us(): return time.monotonic_ns() // 1_000
+    def ticks_diff(a, b): return a - b
+    def ticks_add(a, b): return a + b
+
+try:
+    from micropython import const
+except ImportError:
+    def const(x): return x
+
+# asyncio: 최신 MicroPython은 asyncio, 예전 펌웨어는 uasyncio
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
+
+if hasattr(asyncio, "sleep_ms"):
+    async_sleep_ms = asyncio.sleep_ms
+else:
+    async def async_sleep_ms(ms): await asyncio.sleep(ms / 1000)
@@ -0,0 +1,162 @@
+# ── 2칼럼 대시보드(시계/센서/날씨) 화면 + asyncio 작업
+# 하드웨어/네트워크는 tft_weather.py가 넘겨주는 함수로만 다룸 → PC에서도 가짜로 돌릴 수 있음
+from compat import asyncio, async_sleep_ms
+from st7735 import rgb565
+from st7735.compositor import Compositor
+from st7735.widgets import Screen, Panel, Label, Value, Clock
+from st7735 import profile
+import bootseq
+
+# ── 색상 ──
+BG=rgb565(0,0,0); PANEL=rgb565(10,10,20); LBG=rgb565(5,5,12); RBG=rgb565(8,8,16)
+FG=rgb565(240,240,240); ACCENT=rgb565(100,200,255); OK=rgb565(60,220,130); WARN=rgb565(255,180,0)
+TITLE=rgb565(255,220,120)
+PALETTE=(BG, PANEL, LBG, RBG, FG, ACCENT, OK, WARN, TITLE)
+
+# ── 주기(ms) ──
+CLOCK_POLL_MS=20       # 초 바뀜 감지 간격(시계 지연 상한)
+SENSOR_MS=5000
+WIFI_CHECK_MS=2000
+NTP_RETRY_MS=30_000
+
+class Dashboard:
+    # aa: 글자를 배경색(PANEL/LBG/RBG)과 미리 섞은 안티에일리어스로(캐시된 뒤 전송량은 같음)
+    # indexed: 화면 버퍼를 16색 팔레트로(6.4KB, RGB565는 25.6KB). 섞인 색이 없어야 하므로 aa는 꺼짐
+    def __init__(self, tft, lang="en", aa=True, indexed=False):
+        if indexed: aa=False
+        self.tft=tft; self.lang=lang; self.aa=aa
+        # 화면 전체 RAM 버퍼: 위젯이 그린 영역만 모아서 전송
+        if indexed:
+            from st7735.indexed import IndexedCompositor   # 쓸 때만 읽음
+            self.comp=IndexedCompositor(tft, PALETTE)
+        else:
+            self.comp=Compositor(tft)
+        self.lock=asyncio.Lock()    # flush는 이 락으로 한 번에 하나만
+        self.synced=False
+        self.wifi=None
+
+        # ── 레이아웃 ──
+        self.TOP_PAD=2            # ↑ 상단 여유 2px 보정
+        self.HEADER_H=16
+        m=2                       # COL_MARGIN
+        self.COL_W=(tft.width//2)-m*2
+        self.LEFT_X=m
+        self.RIGHT_X=tft.width//2+m
+        self.CONTENT_Y=self.HEADER_H+self.TOP_PAD
+        self.CONTENT_H=tft.height-self.CONTENT_Y-2
+        cy=self.CONTENT_Y; cw=self.COL_W
+        # ── 위젯 트리(좌표는 패널 기준). 값이 바뀐 위젯만 다시 그림
+        self.clock=Clock(4, self.TOP_PAD+4)                              # 바뀐 숫자 칸만
+        self.s_temp=Value(2, 16, cw-4, 10, "T:{:>4.1f}C", FG, none="No sensor")
+        self.s_hum =Value(2, 28, cw-4, 10, "H:{:>3.0f}%", FG)
+        self.w_temp=Value(2, 16, cw-4, 10, "T:{:>4.1f}C", FG, none="No data")
+        self.w_hum =Value(2, 28, cw-4, 10, "H:{:>3.0f}%", FG)
+        self.w_desc=Value(2, 40, cw-4, 17, "{}", ACCENT, prop=True, lines=2, step=9)  # 가변폭 2줄
+        self.ui=Screen(tft.width, tft.height, BG, [
+            Panel(0, 0, tft.width, self.HEADER_H+self.TOP_PAD, PANEL, [self.clock]),
+            Panel(self.LEFT_X, cy, cw, self.CONTENT_H, LBG,
+                  [Label(2, 2, "SENSOR", ACCENT), self.s_temp, self.s_hum]),
+            Panel(self.RIGHT_X, cy, cw, self.CONTENT_H, RBG,
+                  [Label(2, 2, "WEATHER", TITLE), self.w_temp, self.w_hum, self.w_desc]),
+        ], aa=aa)
+
+    # ── 값 넣기(위젯만 갱신; 그리기/전송은 flush). 화면이 바뀌면 True
+    def draw_background_once(self):
+        self.ui.invalidate()      # 다음 flush에서 배경부터 전부
+
+    def draw_clock(self, t):
+        # t: time.localtime() 형식. 초나 색이 바뀔 때만
+        return self.clock.set(t, OK if self.synced else WARN)
+
+    def draw_sensor_text(self, d):
+        tc,hu=d if d is not None else (None,None)
+        a=self.s_temp.set(tc); b=self.s_hum.set(hu)
+        return a or b
+
+    def draw_weather_text(self, w):
+        desc,tmp,hum=w if w is not None else (None,None,None)
+        a=self.w_temp.set(tmp); b=self.w_hum.set(hum); c=self.w_desc.set(desc)
+        return a or b or c
+
+    async def flush(self):
+        async with self.lock:
+            self.ui.render(self.comp)
+            self.comp.flush()
+        profile.frame()           # 켜져 있을 때만(st7735.profile): flush 한 번 = 프레임 하나
+
+    # ── 작업들 ──
+    async def clock_task(self, now):
+        while True:
+            if self.draw_clock(now()):
+                await self.flush()
+            await async_sleep_ms(CLOCK_POLL_MS)
+
+    async def sensor_task(self, read_sensor):
+        # 첫 값은 run()의 첫 화면에서 이미 그림. 읽은 값이 같으면(대부분) 안 그림
+        while True:
+            await async_sleep_ms(SENSOR_MS)
+            if self.draw_sensor_text(read_sensor()):
+                await self.flush()
+
+    async def weather_task(self, weather):
+        # weather: WeatherCache. 저장된 값은 첫 화면에 이미 그렸으니, 온라인이 되는 즉시
+        # (값이 오래됐으면) 요청. 응답을 기다리는 동안 시계/센서는 계속 돎
+        shown=weather.get()
+        while True:
+            if not self._online():
+                await self.wifi.wait_up()
+            if weather.due():
+                self.tl.begin("weather")
+                w=await weather.refresh()     # 실패하면 이전 값 그대로
+                if not weather.stale: self.tl.end("weather")
+                if w!=shown:
+                    shown=w
+                    if self.draw_weather_text(w):
+                        await self.flush()
+            await async_sleep_ms(WIFI_CHECK_MS)
+
+    async def net_task(self, wifi, ntp_sync):
+        # 연결/재연결은 wifi.supervise()가 맡음. 붙을 때마다 아직 동기화 전이면 시간 맞춤
+        # 그 뒤 BSSID를 모르면(첫 부팅/AP 바뀜) 한 번 스캔해서 저장(다음 접속부터 빠른 재접속).
+        # 스캔 동안(약 2초) 루프가 멈추므로 시계가 어차피 바뀌는 시간 맞춤 직후에
+        while True:
+            await wifi.wait_up()
+            if not self.synced:
+                self.tl.begin("ntp")
+                self.synced=await ntp_sync()
+                if self.synced: self.tl.end("ntp")
+                if not self.synced:
+                    await async_sleep_ms(NTP_RETRY_MS); continue
+            if wifi.bssid is None:
+                self.tl.begin("wifi_learn")
+                if wifi.learn(): self.tl.end("wifi_learn")
+            await wifi.wait_down()
+
+    def _online(self):
+        return self.wifi is not None and self.wifi.isconnected()
+
+    async def run(self, now, read_sensor, weather, wifi, ntp_sync, tl=None, spi_cache=None,
+                  spi_baud=20_000_000):
+        # now(): localtime 튜플, read_sensor(): (T,H)|None, weather: WeatherCache
+        # wifi: WifiManager, ntp_sync: 코루틴 함수, tl: bootseq.Timeline(단계별 부팅 시간)
+        # spi_cache/spi_baud: SPI 속도 저장 파일과 시작 속도(bootseq.start 참고)
+        self.tl=tl=tl or bootseq.Timeline()
+        self.wifi=wifi
+        # Wi-Fi 접속을 먼저 걸고 패널 초기화 대기와 겹침(붙는 즉시 NTP도 시작)
+        tasks=[asyncio.create_task(self.net_task(wifi, ntp_sync))]
+        tasks.append(await bootseq.start(self.tft, wifi, tl, spi_cache, spi_baud))
+        # 첫 화면: 배경 + 시계 + 센서 + 저장된 날씨를 한 번에(네트워크 안 기다림)
+        tl.begin("first_paint")
+        self.draw_background_once()
+        self.draw_clock(now())
+        self.draw_sensor_text(read_sensor())
+        self.draw_weather_text(weather.get())
+        await self.flush()
+        tl.end("first_paint")
+        tasks+=[asyncio.create_task(self.clock_task(now)),
+                asyncio.create_task(self.sensor_task(read_sensor)),
+                asyncio.create_task(self.weather_task(weather))]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for t in tasks: t.cancel()
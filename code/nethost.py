@@ -0,0 +1,186 @@
+# ── PC(CPython) 전용 네트워크 대역: 보드 없이 클라이언트/재연결 로직을 재기 위함
+import json, threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 실제 OpenWeatherMap 응답과 같은 모양(약 500바이트)
+OWM_SAMPLE = {
+    "coord": {"lon": 126.9778, "lat": 37.5683},
+    "weather": [{"id": 520, "main": "Rain", "description": "light intensity shower rain", "icon": "09d"}],
+    "base": "stations",
+    "main": {"temp": 17.3, "feels_like": 16.91, "temp_min": 16.69, "temp_max": 18.78,
+             "pressure": 1013, "humidity": 55, "sea_level": 1013, "grnd_level": 1003},
+    "visibility": 10000, "wind": {"speed": 3.6, "deg": 270}, "rain": {"1h": 0.21},
+    "clouds": {"all": 75}, "dt": 1760760000,
+    "sys": {"type": 1, "id": 8105, "country": "KR", "sunrise": 1760737300, "sunset": 1760777700},
+    "timezone": 32400, "id": 1835848, "name": "Seoul", "cod": 200,
+}
+
+class OWMServer:
+    # 로컬 가짜 날씨 서버(HTTP/1.1 keep-alive). with 문으로 쓰면 자동 종료
+    #   delay_s: 응답 전 대기, status: 돌려줄 상태 코드, chunked: 청크 전송 여부
+    #   cut: 이 번호(1부터)의 요청들은 본문을 cut_at바이트(기본 절반)만 보내고 연결을 끊음
+    #        (유휴 연결이 끊긴 경우 흉내)
+    def __init__(self, body=None, delay_s=0.0, status=200, chunked=False, cut=(), cut_at=None):
+        self.body = json.dumps(body or OWM_SAMPLE).encode()
+        self.delay_s = delay_s; self.status = status; self.chunked = chunked
+        self.cut = cut; self.cut_at = len(self.body)//2 if cut_at is None else cut_at
+        self.requests = 0; self.connections = 0
+        srv = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            def setup(self):
+                import socket
+                super().setup(); srv.connections += 1
+                # 헤더/본문을 따로 쓰므로 Nagle을 끄지 않으면 keep-alive 응답이 40ms씩 늦어짐
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            def do_GET(self):
+                import time
+                srv.requests += 1
+                if srv.delay_s: time.sleep(srv.delay_s)
+                self.send_response(srv.status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                if srv.chunked:
+                    self.send_header("Transfer-Encoding", "chunked"); self.end_headers()
+                    b = srv.body
+                    for i in range(0, len(b), 100):
+                        part = b[i:i+100]
+                        self.wfile.write(b"%x\r\n" % len(part) + part + b"\r\n")
+                    self.wfile.write(b"0\r\n\r\n")
+                elif srv.requests in srv.cut:
+                    self.send_header("Content-Length", str(len(srv.body))); self.end_headers()
+                    self.wfile.write(srv.body[:srv.cut_at]); self.wfile.flush()
+                    self.close_connection = True
+                else:
+                    self.send_header("Content-Length", str(len(srv.body))); self.end_headers()
+                    self.wfile.write(srv.body)
+            def log_message(self, *a):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self._httpd.shutdown(); self._httpd.server_close()
+
+    def __enter__(self): return self
+    def __exit__(self, *a): self.close()
+
+class NTPServer:
+    # 로컬 가짜 SNTP 서버(UDP). delay_s: 응답 전 대기, drop: 처음 이만큼의 요청은 무시(손실 흉내)
+    # 현재 시각(time.time())을 돌려줌. with 문으로 쓰면 자동 종료
+    def __init__(self, delay_s=0.0, drop=0):
+        import socket
+        self.delay_s = delay_s; self.drop = drop
+        self.requests = 0
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.bind(("127.0.0.1", 0))
+        self._sock.settimeout(0.1)              # close()를 알아채도록
+        self._open = True
+        self.port = self._sock.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        import socket, struct, time
+        while self._open:
+            try:
+                req, addr = self._sock.recvfrom(48)
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            self.requests += 1
+            if self.requests <= self.drop:
+                continue
+            if self.delay_s: time.sleep(self.delay_s)
+            msg = bytearray(48)
+            msg[0] = 0x1C; msg[1] = 2                  # 서버 모드, stratum 2
+            struct.pack_into("!I", msg, 40, int(time.time()) + 2208988800)
+            try: self._sock.sendto(msg, addr)
+            except OSError: return
+
+    def close(self):
+        self._open = False
+        self._sock.close()
+
+    def __enter__(self): return self
+    def __exit__(self, *a): self.close()
+
+class FakeWLAN:
+    # network.WLAN(STA_IF) 흉내: 스캔/접속에 걸리는 시간을 난수로 만들어 재연결 지연을 잴 수 있게 함
+    #   scan_ms/assoc_ms: (최소, 최대) 구간, time_scale: 실제로 기다리는 시간 배율(0.01이면 100배 빠르게)
+    #   BSSID를 주고 connect하면 스캔 없이 assoc만 걸림(ESP-IDF의 빠른 재접속과 같은 효과).
+    #   목록에 없는 BSSID면 연결되지 않음
+    def __init__(self, ssid="mtinet", aps=((b"\x10\x20\x30\x40\x50\x60", 6, -52),
+                                           (b"\x10\x20\x30\x40\x50\x61", 11, -70)),
+                 scan_ms=(1800, 2600), assoc_ms=(250, 900), time_scale=1.0, seed=1, bssid_config=False):
+        import random
+        self.ssid = ssid.encode(); self.aps = list(aps)
+        self.scan_ms = scan_ms; self.assoc_ms = assoc_ms
+        self.time_scale = time_scale
+        self._rnd = random.Random(seed)
+        self._active = False
+        self._ready_at = None        # 이 시각(monotonic 초) 이후 연결됨
+        self.scans = 0; self.connects = 0
+        self.bssid_config = bssid_config   # config("bssid")를 아는 포트인지(ESP32는 모름 → ValueError)
+        self._ap = None
+
+    def _now(self):
+        import time
+        return time.monotonic()
+
+    def _ms(self, rng):
+        return self._rnd.uniform(*rng) * self.time_scale / 1000
+
+    def active(self, v=None):
+        if v is None: return self._active
+        self._active = bool(v)
+
+    def config(self, *a, **kw):
+        if not a:
+            return
+        if a[0] == "bssid" and self.bssid_config and self.isconnected():
+            return self._ap[0]
+        if a[0] == "channel":
+            return self._ap[1] if self._ap else 1
+        if a[0] in ("mac", "hostname"):
+            return {"mac": b"\x24\x0a\xc4\x00\x00\x01", "hostname": "esp32c3-mini"}[a[0]]
+        raise ValueError("unknown config param")
+
+    def scan(self):
+        # 실제 보드처럼 블로킹
+        import time
+        self.scans += 1
+        time.sleep(self._ms(self.scan_ms))
+        return [(self.ssid, bssid, ch, rssi, 3, False) for bssid, ch, rssi in self.aps]
+
+    def connect(self, ssid=None, key=None, bssid=None):
+        self.connects += 1
+        known = bssid is not None and any(bssid == b for b, _, _ in self.aps)
+        if bssid is not None and not known:    # 없어진 AP(공유기 교체 등): 붙지 않음
+            self._ap = None; self._ready_at = None
+            return
+        self._ap = next((ap for ap in self.aps if ap[0] == bssid), None) if known else \
+            max(self.aps, key=lambda ap: ap[2])
+        wait = self._ms(self.assoc_ms)
+        if not known:
+            wait += self._ms(self.scan_ms)     # 내부 스캔
+        self._ready_at = self._now() + wait
+
+    def isconnected(self):
+        return self._active and self._ready_at is not None and self._now() >= self._ready_at
+
+    def disconnect(self):
+        self._ready_at = None
+
+    def drop(self):
+        # AP 쪽에서 끊김(신호 약화 등)
+        self._ready_at = None
+
+    def status(self, *a):
+        return -55 if a and a[0] == "rssi" else (1010 if self.isconnected() else 1000)
+
+    def ifconfig(self):
+        return ("192.168.0.42", "255.255.255.0", "192.168.0.1", "8.8.8.8")
@@ -0,0 +1,59 @@
+# ── SNTP 시간 맞춤(비동기)
+# ntptime.settime()은 DNS 조회 + 소켓 응답 대기(약 1초)를 블로킹으로 함 → 루프 안에서 부르면 시계가 멈춤
+# 여기서는 논블로킹 UDP 소켓에 요청을 보내고 응답을 POLL_MS마다 async_sleep_ms로 확인
+# DNS(getaddrinfo)는 MicroPython에 비동기 방법이 없어 블로킹: 알아낸 주소는 기억해서 처음 한 번만
+import socket, struct, time
+from compat import async_sleep_ms, ticks_ms, ticks_diff
+
+HOST="pool.ntp.org"
+PORT=123
+POLL_MS=20
+# NTP 기준(1900년)에서 이 포트 time()의 기준까지 초(2000년 기준 포트와 1970년 기준 포트)
+NTP_DELTA=3155673600 if time.gmtime(0)[0]==2000 else 2208988800
+
+_addr={}
+
+def _resolve(host, port):
+    a=_addr.get((host,port))
+    if a is None:
+        a=_addr[(host,port)]=socket.getaddrinfo(host,port)[0][-1]
+    return a
+
+async def query(host=HOST, port=PORT, timeout_ms=1000):
+    # 서버 시각(이 포트 time() 기준 초) 또는 None(시간 초과/이상한 응답). 네트워크 오류는 OSError
+    a=_resolve(host,port)
+    s=socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        s.setblocking(False)
+        req=bytearray(48); req[0]=0x1B      # LI=0, VN=3, Mode=3(클라이언트)
+        s.sendto(req, a)
+        t0=ticks_ms()
+        while True:
+            try:
+                msg=s.recv(48); break
+            except OSError:                 # 아직 없음(EAGAIN)
+                pass
+            if ticks_diff(ticks_ms(), t0)>timeout_ms: return None
+            await async_sleep_ms(POLL_MS)
+    finally:
+        s.close()
+    if len(msg)<48 or msg[1]==0: return None  # stratum 0 = 거절(kiss-o'-death)
+    return struct.unpack("!I", msg[40:44])[0]-NTP_DELTA
+
+def settime(t):
+    # RTC를 UTC t초로(ntptime.settime과 같은 방식)
+    import machine
+    tm=time.gmtime(t)
+    machine.RTC().datetime((tm[0], tm[1], tm[2], tm[6]+1, tm[3], tm[4], tm[5], 0))
+
+async def sync(host=HOST, port=PORT, tries=3, timeout_ms=1000, retry_ms=2000, set_time=settime):
+    # 맞췄으면 True. 실패하면 retry_ms 뒤 다시(최대 tries번)
+    for k in range(tries):
+        try:
+            t=await query(host, port, timeout_ms)
+        except OSError:
+            t=None
+        if t is not None:
+            set_time(t); return True
+        if k<tries-1: await async_sleep_ms(retry_ms)
+    return False
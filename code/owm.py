@@ -0,0 +1,202 @@
+# ── OpenWeatherMap 비동기 클라이언트
+# urequests.get(...).json()은 응답 전체를 dict로 만들어 힙을 크게 씀 → 소켓에서 조금씩 읽으며
+# 필요한 세 값(weather[0].description, main.temp, main.humidity)만 뽑아냄
+# 연결은 keep-alive로 재사용(10분마다 같은 서버에 붙으므로 TCP 핸드셰이크 절약)
+from compat import asyncio
+
+HOST="api.openweathermap.org"
+READ_CHUNK=256        # 소켓에서 한 번에 읽는 최대 바이트
+MAX_TOKEN=64          # 키/값 문자열 최대 길이(넘으면 잘라냄)
+
+WEATHER_FIELDS={("weather",0,"description"):"desc", ("main","temp"):"temp", ("main","humidity"):"hum"}
+
+def weather_path(city, api_key, units="metric", lang="en"):
+    return "/data/2.5/weather?q={}&appid={}&units={}&lang={}".format(city,api_key,units,lang)
+
+def _text(tok):
+    # MAX_TOKEN에서 잘리면 UTF-8 글자가 반쯤 남을 수 있음 → 끝에서 한 바이트씩 버림
+    while tok:
+        try: return bytes(tok).decode()
+        except UnicodeError: tok=tok[:-1]
+    return ""
+
+class FieldExtractor:
+    # 스트리밍 JSON에서 원하는 경로의 값만 꺼냄. feed()로 조각을 계속 넣으면 됨
+    # wanted: {경로 튜플: 이름}, 경로의 배열 위치는 정수
+    def __init__(self, wanted, max_token=MAX_TOKEN):
+        self.wanted=wanted; self.max_token=max_token
+        self.found={}
+        self._stack=[]        # [종류('o'|'a'), 현재 키 또는 인덱스]
+        self._tok=bytearray()
+        self._state=0         # 0=일반, 1=문자열, 2=이스케이프, 3=숫자/리터럴, 4=\\uXXXX
+        self._keep=False      # 지금 토큰을 모을지(원하는 경로이거나 키)
+        self._is_key=False
+        self._u=0; self._un=0
+
+    @property
+    def done(self):
+        return len(self.found)==len(self.wanted)
+
+    def _path_wanted(self):
+        return tuple(e[1] for e in self._stack) in self.wanted
+
+    def _put(self, b):
+        if self._keep and len(self._tok)<self.max_token:
+            self._tok.append(b)
+
+    def _value(self, v):
+        name=self.wanted.get(tuple(e[1] for e in self._stack))
+        if name is not None:
+            self.found[name]=v
+
+    def _end_bare(self):
+        if self._state!=3: return
+        self._state=0
+        if self._keep:
+            t=bytes(self._tok)
+            if t==b"true": v=True
+            elif t==b"false": v=False
+            elif t==b"null": v=None
+            else:
+                try: v=int(t)
+                except ValueError: v=float(t)
+            self._value(v)
+
+    def feed(self, data):
+        for b in data:
+            st=self._state
+            if st==1:                      # 문자열 안
+                if b==0x5C: self._state=2
+                elif b==0x22:
+                    self._state=0
+                    if self._is_key:
+                        self._stack[-1][1]=_text(self._tok)
+                    elif self._keep:
+                        self._value(_text(self._tok))
+                else: self._put(b)
+                continue
+            if st==2:                      # \\ 다음 글자
+                if b==0x75: self._state=4; self._u=0; self._un=0; continue
+                self._put({0x6E:0x0A,0x74:0x09,0x72:0x0D,0x62:0x08,0x66:0x0C}.get(b,b))
+                self._state=1; continue
+            if st==4:                      # \\uXXXX
+                self._u=(self._u<<4)|int(chr(b),16); self._un+=1
+                if self._un==4:
+                    for c in chr(self._u).encode(): self._put(c)
+                    self._state=1
+                continue
+            if st==3:
+                if b in b"0123456789+-.eEtruefalsn":
+                    self._put(b); continue
+                self._end_bare()
+            # 일반 상태
+            if b==0x7B:   self._stack.append(["o",None])      # {
+            elif b==0x5B: self._stack.append(["a",0])         # [
+            elif b==0x7D or b==0x5D:                          # } ]
+                if self._stack: self._stack.pop()
+            elif b==0x2C:                                     # ,
+                top=self._stack[-1] if self._stack else None
+                if top is not None:
+                    if top[0]=="a": top[1]+=1
+                    else: top[1]=None
+            elif b==0x22:                                     # "
+                top=self._stack[-1] if self._stack else None
+                self._is_key=top is not None and top[0]=="o" and top[1] is None
+                self._keep=self._is_key or self._path_wanted()
+                self._tok=bytearray(); self._state=1
+            elif b in b" \t\r\n:":
+                pass
+            else:                                             # 숫자/true/false/null 시작
+                self._keep=self._path_wanted()
+                self._tok=bytearray(); self._state=3; self._put(b)
+        return self.done
+
+    def close(self):
+        self._end_bare()
+
+class HttpClient:
+    # 한 서버 전용 HTTP/1.1 GET 클라이언트. keepalive=True면 연결을 다음 요청에 재사용
+    def __init__(self, host, port=80, keepalive=True, timeout=10):
+        self.host=host; self.port=port; self.keepalive=keepalive; self.timeout=timeout
+        self._r=None; self._w=None
+        self.connects=0          # 새 TCP 연결 수(재사용 확인용)
+
+    async def close(self):
+        w=self._w; self._r=self._w=None
+        if w is not None:
+            try:
+                w.close(); await w.wait_closed()
+            except Exception:
+                pass
+
+    async def get(self, path, new_sink):
+        # 본문을 READ_CHUNK씩 sink.feed()에 흘려보냄. new_sink()로 시도마다 새 sink를 만듦
+        # (재시도 때 반쯤 먹은 sink를 다시 쓰지 않도록). (상태 코드, sink)를 돌려줌
+        reused=self._w is not None
+        sink=new_sink()
+        try:
+            return await asyncio.wait_for(self._get(path, sink), self.timeout), sink
+        except Exception:
+            await self.close()
+            if not reused: raise
+        # 서버가 유휴 연결을 끊어 둔 경우: 새 연결로 한 번만 재시도
+        sink=new_sink()
+        return await asyncio.wait_for(self._get(path, sink), self.timeout), sink
+
+    async def _get(self, path, sink):
+        if self._w is None:
+            self._r,self._w=await asyncio.open_connection(self.host, self.port)
+            self.connects+=1
+        r,w=self._r,self._w
+        w.write("GET {} HTTP/1.1\r\nHost: {}\r\nConnection: {}\r\n\r\n".format(
+            path, self.host, "keep-alive" if self.keepalive else "close").encode())
+        await w.drain()
+
+        line=await r.readline()
+        if not line: raise OSError("connection closed")
+        status=int(line.split(None,2)[1])
+        length=-1; chunked=False; keep=self.keepalive
+        while True:
+            line=await r.readline()
+            if not line or line==b"\r\n": break
+            k,_,v=line.partition(b":"); k=k.strip().lower(); v=v.strip().lower()
+            if k==b"content-length": length=int(v)
+            elif k==b"transfer-encoding": chunked=(v==b"chunked")
+            elif k==b"connection" and v==b"close": keep=False
+
+        if chunked:
+            while True:
+                n=int((await r.readline()).split(b";")[0],16)
+                if n==0:
+                    await r.readline(); break
+                await self._body(r, n, sink)
+                await r.readline()
+        elif length>=0:
+            await self._body(r, length, sink)
+        else:
+            keep=False
+            while True:
+                b=await r.read(READ_CHUNK)
+                if not b: break
+                sink.feed(b)
+        if hasattr(sink,"close"): sink.close()
+        if not keep: await self.close()
+        return status
+
+    async def _body(self, r, n, sink):
+        # 필요한 값을 다 찾아도 keep-alive를 위해 본문은 끝까지 읽어서 버림
+        while n>0:
+            b=await r.read(min(n,READ_CHUNK))
+            if not b: raise OSError("short body")
+            n-=len(b)
+            if not sink.done: sink.feed(b)
+
+async def fetch_weather(client, path):
+    # (설명, 기온, 습도) 또는 실패 시 None
+    try:
+        status,ex=await client.get(path, lambda: FieldExtractor(WEATHER_FIELDS))
+    except Exception:
+        return None
+    f=ex.found
+    if status!=200 or len(f)<3: return None
+    return (f["desc"], f["temp"], f["hum"])
@@ -0,0 +1,4 @@
+# ST7735 0.96" (80x160) 공용 드라이버
+# 사용: tft = ST7735_80x160(SPIBus(spi, cs_pin, dc_pin, rst_pin), rotation=...)
+from .bus import SPIBus
+from .driver import ST7735_80x160, rgb565, TFT_W, TFT_H
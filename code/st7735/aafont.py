@@ -0,0 +1,94 @@
+# ── 안티에일리어스 글자: 5x7 비트맵의 대각선 안쪽 모서리(계단)를 부분 알파로 채움
+# 칸마다 켜진 이웃 두 개(가로 하나 + 세로 하나)가 만드는 안쪽 모서리를 반 칸짜리 삼각형으로 보고,
+# 출력 점(scale배)마다 sub x sub 표본으로 덮인 비율을 재서 알파 2비트(0~3)로 저장
+# 형식: 글자 칸(6*scale x 7*scale)을 줄 순서로, 한 바이트에 4점(앞 점이 상위 비트)
+# 배경이 정해진 단색이라 (전경, 배경)마다 4색 팔레트를 한 번 섞어 두고 알파 대신 바로 찍음
+# 글자 블록은 드라이버의 GlyphCache에 들어가므로 이 계산은 캐시에 없을 때만 함
+from .font import FONT5x7, glyph
+
+SUB = 4                 # 출력 점 하나당 표본(가로/세로)
+
+def _lit(g, i, j):
+    return 0 <= i < 5 and 0 <= j < 7 and (FONT5x7[g+i] >> j) & 1
+
+def _wedges(g, i, j):
+    # 꺼진 칸 (i, j)의 안쪽 모서리들: 켜진 가로 이웃 + 세로 이웃이 만나는 쪽 (dx, dy) 목록
+    out = []
+    for dx in (-1, 1):
+        if _lit(g, i+dx, j):
+            for dy in (-1, 1):
+                if _lit(g, i, j+dy):
+                    out.append((dx, dy))
+    return out
+
+def _cover(ws, fu, fv):
+    # 칸 안 (fu, fv) 점이 모서리 삼각형(다리 길이 반 칸) 안인지
+    for dx, dy in ws:
+        if (fu if dx < 0 else 1-fu) + (fv if dy < 0 else 1-fv) < 0.5:
+            return True
+    return False
+
+def alpha_map(ch, scale=1):
+    # 글자 칸 전체(간격 열 포함)의 2비트 알파(bytes)
+    # 켜진 칸은 전부 3, 모서리 없는 꺼진 칸은 0 → 표본은 모서리가 있는 칸에서만 셈
+    g = glyph(ch)
+    w = 6*scale
+    n = SUB*SUB; step = 1 / SUB
+    out = bytearray((w*7*scale + 3) // 4)
+    def put(x, y, a):
+        k = y*w + x
+        out[k >> 2] |= a << (6 - 2*(k & 3))
+    for j in range(7):
+        for i in range(5):
+            if _lit(g, i, j):
+                for y in range(j*scale, (j+1)*scale):
+                    for x in range(i*scale, (i+1)*scale):
+                        put(x, y, 3)
+                continue
+            ws = _wedges(g, i, j)
+            if not ws:
+                continue
+            for py in range(scale):
+                for px in range(scale):
+                    c = 0
+                    for sy in range(SUB):
+                        fv = (py + (sy + 0.5)*step) / scale
+                        for sx in range(SUB):
+                            if _cover(ws, (px + (sx + 0.5)*step) / scale, fv):
+                                c += 1
+                    a = (c*3 + n - 1) // n      # 조금이라도 덮이면 1 이상(올림)
+                    if a:
+                        put(i*scale + px, j*scale + py, a)
+    return bytes(out)
+
+_pal = {}
+
+def palette(fg, bg):
+    # 알파 0~3 → RGB565 2바이트(빅엔디안). (fg, bg)마다 한 번 섞어서 보관
+    p = _pal.get((fg, bg))
+    if p is not None:
+        return p
+    if len(_pal) >= 16:
+        _pal.clear()
+    rf = fg >> 11; gf = (fg >> 5) & 0x3F; bf = fg & 0x1F
+    rb = bg >> 11; gb = (bg >> 5) & 0x3F; bb = bg & 0x1F
+    p = []
+    for a in range(4):
+        c = (((rb + ((rf-rb)*a + 1)//3) << 11) | ((gb + ((gf-gb)*a + 1)//3) << 5) |
+             (bb + ((bf-bb)*a + 1)//3))
+        p.append(bytes(((c >> 8) & 0xFF, c & 0xFF)))
+    p = _pal[(fg, bg)] = tuple(p)
+    return p
+
+def render(buf, off, stride, ch, fg, bg, scale=1, c0=0, nc=5):
+    # 글자 칸 중 폰트 열 c0..c0+nc(+간격 1열)를 buf에 RGB565로 그림(드라이버 _render_glyph와 같은 자리)
+    amap = alpha_map(ch, scale)
+    pal = palette(fg, bg)
+    w = 6*scale
+    x0 = c0*scale; x1 = (c0+nc+1)*scale      # c0+nc <= 5라 칸 안
+    for y in range(7*scale):
+        o = off + y*stride
+        k = y*w + x0
+        for _ in range(x1 - x0):
+            buf[o:o+2] = pal[(amap[k >> 2] >> (6 - 2*(k & 3))) & 3]
+            o += 2; k += 1
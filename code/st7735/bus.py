@@ -0,0 +1,74 @@
+# ── 버스 계층: 드라이버는 SPI/핀을 직접 만지지 않고 이 객체만 사용
+# 보드에서는 machine.SPI/Pin, PC에서는 host.HostSPI/HostPin을 넣으면 됨
+from compat import sleep_ms
+
+class SPIBus:
+    def __init__(self, spi, cs, dc, rst=None, delay=sleep_ms):
+        self.spi = spi
+        self.cs  = cs
+        self.dc  = dc
+        self.rst = rst
+        self.delay = delay   # ms 대기 함수(호스트에서는 기록만 하도록 교체 가능)
+        self._c = bytearray(1)   # 명령 바이트(매번 새로 만들지 않음)
+        cs.value(1); dc.value(0)
+        if rst is not None:
+            rst.value(1)
+
+    def reset(self):
+        if self.rst is None:
+            return
+        self.rst.value(0); self.delay(50)
+        self.rst.value(1); self.delay(120)
+
+    def cmd(self, c):
+        self.cs.value(0)
+        self.put_cmd(c)
+        self.cs.value(1)
+
+    def data(self, b):
+        self.cs.value(0); self.dc.value(1)
+        self.spi.write(b)
+        self.cs.value(1)
+
+    # 한 트랜잭션에 명령/인자 여러 개: begin() → put_cmd()/put_data() ... → end()
+    # CS를 내린 채 DC만 바꿔 가며 보냄(패널은 바이트마다 DC를 봄)
+    def begin(self):
+        self.cs.value(0)
+
+    def put_cmd(self, c):
+        b = self._c; b[0] = c
+        self.dc.value(0)
+        self.spi.write(b)
+
+    def put_data(self, b):
+        self.dc.value(1)
+        self.spi.write(b)
+
+    # 읽기(MISO 필요): 명령 c 뒤 n바이트. dummy: 데이터 앞에 버릴 클럭 수(비트, 명령마다 다름)
+    def read(self, c, n, dummy=0):
+        skip = dummy >> 3; k = dummy & 7
+        self.cs.value(0)
+        self.put_cmd(c)
+        self.dc.value(1)
+        raw = self.spi.read(n + skip + (1 if k else 0))
+        self.cs.value(1)
+        if not k:
+            return bytes(raw[skip:skip+n])
+        out = bytearray(n)
+        for i in range(n):
+            out[i] = ((raw[skip+i] << k) | (raw[skip+i+1] >> (8-k))) & 0xFF
+        return out
+
+    def set_baudrate(self, baud):
+        self.spi.init(baudrate=baud)
+
+    # 픽셀 스트림: begin_data() → write() 여러 번 → end()
+    # set_window 뒤에 바로 부르면 창 설정과 픽셀이 한 트랜잭션(CS가 이미 내려가 있음)
+    def begin_data(self):
+        self.cs.value(0); self.dc.value(1)
+
+    def write(self, b):
+        self.spi.write(b)
+
+    def end(self):
+        self.cs.value(1)
@@ -0,0 +1,134 @@
+# ── SPI 속도 맞추기: 빠른 속도부터 시험 무늬를 쓰고 MISO로 되읽어(RAMRD) 그대로인 가장 빠른 속도를 고름
+# - 되읽기는 항상 느린 속도(READ_BAUD, 패널 읽기 한계가 쓰기보다 훨씬 낮음) → 쓰기 경로만 시험
+# - RDDID의 제조사 바이트가 ST7735(0x7C)가 아니거나 두 번 읽은 값이 다르면 MISO가 안 붙었거나 떠 있는 것
+#   (0/FF 또는 잡음) → 시험 못 함, fallback 그대로(저장 안 함)
+# - 고른 속도는 플래시(spi.bin)에 저장. 다음 부팅은 저장된 속도로 한 번만 확인하고, 틀리면 다시 맞춤
+# - 높은 속도에서 깨진 바이트가 명령으로 들어갔을 수 있으므로, 오류가 한 번이라도 나면 패널을 다시 초기화
+#   (모든 속도가 틀렸으면 fallback 속도로. 시험 무늬도 그때 지워짐)
+# PC: host_display(recorder=PanelSim(), errors={"error_above": Hz})로 비트 오류를 넣어 시험(bench.py calibrate)
+import struct
+try:
+    import os
+except ImportError:
+    import uos as os
+from .driver import RDDID, RAMRD
+
+RATES = (80_000_000, 60_000_000, 40_000_000, 26_666_666, 20_000_000, 13_333_333, 10_000_000)
+READ_BAUD = 4_000_000
+DUMMY_ID = 1            # RDDID: 데이터 앞 더미 1클럭
+ID_MFR = 0x7C           # RDDID 첫 바이트(Sitronix). 둘째/셋째는 모듈의 NV 값이라 제품마다 다를 수 있음
+DUMMY_RAM = 8           # RAMRD: 첫 1바이트가 더미
+BOX = (0, 0, 16, 8)     # 시험 영역(x, y, w, h): 쓰고 읽는 양이 적도록 작게
+
+_MAGIC = b"SPI"; _VER = 1
+_REC = ">3sBI"
+
+def load(path="spi.bin"):
+    try:
+        with open(path, "rb") as f:
+            b = f.read()
+    except OSError:
+        return None
+    if len(b) != struct.calcsize(_REC): return None
+    magic, ver, baud = struct.unpack(_REC, b)
+    return baud if magic == _MAGIC and ver == _VER else None
+
+def save(baud, path="spi.bin"):
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(struct.pack(_REC, _MAGIC, _VER, baud))
+        os.rename(tmp, path)
+    except OSError:
+        pass
+
+def read_id(tft, read_baud=READ_BAUD):
+    tft.bus.set_baudrate(read_baud)
+    return bytes(tft.bus.read(RDDID, 3, DUMMY_ID))
+
+def _pattern(n, seed):
+    # RGB565 n픽셀: 0000/FFFF/AAAA/5555(이웃 비트가 다 바뀌는 값)과 의사난수를 섞음
+    b = bytearray(n*2)
+    v = (seed*0x9E37 + 1) & 0xFFFF
+    for i in range(n):
+        k = i & 7
+        if k < 4:
+            c = (0x0000, 0xFFFF, 0xAAAA, 0x5555)[(k + seed) & 3]
+        else:
+            v = (v*75 + 74) % 65537 & 0xFFFF
+            c = v
+        b[2*i] = c >> 8; b[2*i+1] = c & 0xFF
+    return b
+
+def verify(tft, baud, seed=0, read_baud=READ_BAUD, box=BOX):
+    # baud로 무늬를 쓰고 read_baud로 읽어서 틀린 픽셀 수(속도를 못 쓰면 -1)
+    x, y, w, h = box
+    bus = tft.bus
+    pat = _pattern(w*h, seed)
+    try:
+        bus.set_baudrate(baud)
+    except (ValueError, OSError):
+        return -1
+    tft.forget_window()                     # 창 설정도 이 속도로 다시 보냄
+    tft.write_window(x, y, w, h, pat)
+    bus.set_baudrate(read_baud)
+    tft.forget_window()                     # 위 창 설정이 깨졌을 수 있으니 읽기 전에 다시
+    tft.set_window(x, y, x+w-1, y+h-1)
+    got = bus.read(RAMRD, w*h*3, DUMMY_RAM)
+    tft.forget_window()
+    bad = 0
+    for i in range(w*h):
+        c = (pat[2*i] << 8) | pat[2*i+1]
+        r = got[3*i] >> 3; g = got[3*i+1] >> 2; b = got[3*i+2] >> 3
+        if c != (r << 11) | (g << 5) | b:
+            bad += 1
+    return bad
+
+def calibrate(tft, rates=RATES, repeats=3, read_baud=READ_BAUD, box=BOX, dirty=False, fallback=None):
+    # (고른 속도 또는 None, [(속도, 틀린 픽셀 합)...]). 빠른 것부터 repeats번 모두 맞는 첫 속도
+    # dirty: 이미 오류 난 전송이 있었음(끝나고 다시 초기화)
+    # fallback: 다 틀렸을 때 다시 초기화할 속도(None이면 rates 중 가장 느린 것)
+    pid = read_id(tft, read_baud)
+    if pid[0] != ID_MFR or read_id(tft, read_baud) != pid:
+        return None, []
+    log = []
+    chosen = None
+    for baud in sorted(rates, reverse=True):
+        bad = 0
+        for k in range(repeats):
+            e = verify(tft, baud, k, read_baud, box)
+            if e:
+                bad = e if e < 0 else bad + e
+                break
+        log.append((baud, bad))
+        if not bad:
+            chosen = baud
+            break
+    if chosen is None:
+        tft.bus.set_baudrate(fallback or min(rates))
+    else:
+        tft.bus.set_baudrate(chosen)
+    if chosen is None or dirty or any(bad for _, bad in log):
+        tft.init()                          # 깨진 명령이 상태를 바꿨을 수 있음(리셋 + 검은 화면)
+    else:
+        x, y, w, h = box
+        tft.fill_color(0, x, y, w, h)
+    return chosen, log
+
+def ensure(tft, path="spi.bin", fallback=20_000_000, **kw):
+    # 저장된 속도가 있으면 한 번 확인하고 그대로, 없거나 틀리면 다시 맞춰 저장. 쓰게 된 속도를 돌려줌
+    baud = load(path)
+    bad = 0
+    if baud is not None:
+        bad = verify(tft, baud)
+        if bad == 0:
+            tft.bus.set_baudrate(baud)
+            x, y, w, h = BOX
+            tft.fill_color(0, x, y, w, h)
+            return baud
+    baud, _ = calibrate(tft, dirty=bad > 0, fallback=fallback, **kw)
+    if baud is None:
+        tft.bus.set_baudrate(fallback)
+        return fallback
+    save(baud, path)
+    return baud
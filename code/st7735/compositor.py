@@ -0,0 +1,147 @@
+# ── 오프스크린 합성기: 화면 전체를 RAM 버퍼에 두고, 바뀐 사각형만 모아서 전송
+# 버퍼는 전송 순서 그대로(RGB565 빅엔디안) 저장 → flush 때 변환 없이 바로 write
+# framebuf가 있으면 self.fb로 직접 그릴 수도 있음(색은 swap565()로 바꿔서 넘길 것,
+# 그린 뒤 invalidate() 호출)
+from .driver import _fill565
+try:
+    import framebuf
+except ImportError:   # PC(호스트)에서는 framebuf 없이 자체 그리기만 사용
+    framebuf = None
+
+# 합칠 때 더 보내도 되는 픽셀 수: set_window 명령 한 번(약 11바이트 + CS 토글)보다 싼 만큼
+MERGE_SLACK = 16
+
+def swap565(c):
+    # framebuf.RGB565(리틀엔디안 저장)에 넘길 색: 바이트 순서를 뒤집어 두면 버퍼가 곧 전송 순서
+    return ((c & 0xFF) << 8) | (c >> 8)
+
+class Compositor:
+    def __init__(self, tft):
+        self.tft = tft
+        self.width = w = tft.width
+        self.height = h = tft.height
+        self.buf = bytearray(w*h*2)
+        self._mv = memoryview(self.buf)
+        self.fb = framebuf.FrameBuffer(self.buf, w, h, framebuf.RGB565) if framebuf else None
+        self.damage = []          # [x0, y0, x1, y1] (x1/y1 미포함)
+        self.flushed_bytes = 0
+        self.flushed_rects = 0
+
+    # ── 손상 영역 관리
+    def invalidate(self, x, y, w, h):
+        x0 = max(0, x); y0 = max(0, y)
+        x1 = min(self.width, x+w); y1 = min(self.height, y+h)
+        if x0 < x1 and y0 < y1:
+            self.damage.append([x0, y0, x1, y1])
+
+    @staticmethod
+    def _merge(rects):
+        # 합친 사각형(둘을 감싸는 상자)이 두 넓이의 합 + MERGE_SLACK보다 크지 않을 때만 합침
+        # (변 하나를 통째로 맞댄 경우 포함). 모서리만 닿거나 어긋나게 겹친 둘은 따로 보냄:
+        # 감싸는 상자로 합치면 안 바뀐 빈 곳까지 전송됨. 더 이상 합칠 게 없을 때까지 반복
+        out = []
+        for r in rects:
+            out.append(r)
+            merged = True
+            while merged:
+                merged = False
+                a = out[-1]
+                for i in range(len(out)-1):
+                    b = out[i]
+                    if a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]:
+                        u = [min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])]
+                        if (u[2]-u[0])*(u[3]-u[1]) > ((a[2]-a[0])*(a[3]-a[1]) + (b[2]-b[0])*(b[3]-b[1])
+                                                      + MERGE_SLACK):
+                            continue
+                        a = u
+                        out.pop(i); out[-1] = a
+                        merged = True
+                        break
+        return out
+
+    # ── 그리기(버퍼에만, 전송은 flush에서)
+    def fill_rect(self, x, y, w, h, color):
+        x0 = max(0, x); y0 = max(0, y)
+        x1 = min(self.width, x+w); y1 = min(self.height, y+h)
+        if x0 >= x1 or y0 >= y1:
+            return
+        n = (x1-x0)*2
+        stride = self.width*2
+        mv = self._mv
+        o0 = y0*stride + x0*2
+        _fill565(mv, o0, n, color)          # 첫 줄만 칠하고 나머지 줄은 그 줄을 복사
+        o = o0 + stride
+        for _ in range(y1-y0-1):
+            mv[o:o+n] = mv[o0:o0+n]
+            o += stride
+        self.damage.append([x0, y0, x1, y1])
+
+    def fill(self, color):
+        self.fill_rect(0, 0, self.width, self.height, color)
+
+    def blit(self, x, y, w, h, block):
+        # block: w*h RGB565 픽셀(전송 순서). 화면 밖은 잘라냄
+        x0 = max(0, x); y0 = max(0, y)
+        x1 = min(self.width, x+w); y1 = min(self.height, y+h)
+        if x0 >= x1 or y0 >= y1:
+            return
+        n = (x1-x0)*2
+        stride = self.width*2
+        buf = self.buf
+        o = y0*stride + x0*2
+        s = ((y0-y)*w + (x0-x))*2
+        for _ in range(y1-y0):
+            buf[o:o+n] = block[s:s+n]
+            o += stride; s += w*2
+        self.damage.append([x0, y0, x1, y1])
+
+    def text(self, x, y, text, color, bg, scale=1, prop=False, aa=False):
+        # 드라이버의 글자 캐시 블록을 그대로 버퍼에 복사. 그린 폭(px)을 돌려줌
+        ch_h = 7*scale
+        tft = self.tft
+        x0 = x
+        for ch in text:
+            if x >= self.width:
+                break
+            blk = tft._glyph_block(ch, color, bg, scale, prop, aa)
+            cw = len(blk) // (ch_h*2)
+            self.blit(x, y, cw, ch_h, blk)
+            x += cw
+        return x - x0
+
+    # ── 전송: 합쳐진 사각형마다 set_window 1번
+    def flush(self):
+        if not self.damage:
+            return 0
+        rects = self._merge(self.damage)
+        self.damage = []
+        tft = self.tft; bus = tft.bus
+        stride = self.width*2
+        mv = memoryview(self.buf)
+        sent = 0
+        for x0, y0, x1, y1 in rects:
+            w = x1-x0; h = y1-y0
+            tft.set_window(x0, y0, x1-1, y1-1)
+            bus.begin_data()
+            if w == self.width:
+                # 전체 폭이면 버퍼가 연속 → 한 번에
+                bus.write(mv[y0*stride:y1*stride])
+            else:
+                # 부분 폭: 줄들을 임시 버퍼에 모아 최대한 크게 전송
+                n = w*2
+                rows = max(1, tft.TEXT_BUF // n)
+                tmp = tft._text_buf(min(rows, h)*n)
+                y = y0
+                while y < y1:
+                    k = min(rows, y1-y)
+                    o = y*stride + x0*2; d = 0
+                    for _ in range(k):
+                        tmp[d:d+n] = mv[o:o+n]
+                        o += stride; d += n
+                    bus.write(memoryview(tmp)[:k*n])
+                    y += k
+            bus.end()
+            sent += w*h*2
+        self.flushed_bytes += sent
+        self.flushed_rects += len(rects)
+        return sent
@@ -0,0 +1,47 @@
+# ── 글자 단위 차분 갱신: 직전에 그린 문자열을 기억하고 바뀐 칸만 다시 그림
+# draw: (x, y, text, color, bg, scale) 순서의 그리기 함수
+#       예) tft.draw_text, Compositor.text
+class DiffText:
+    def __init__(self, draw, x, y, bg, scale=1):
+        self.draw = draw
+        self.x = x
+        self.y = y
+        self.bg = bg
+        self.scale = scale
+        self.cells = 0      # 지금까지 다시 그린 글자 칸 수(호스트 검증용)
+        self.reset()
+
+    def reset(self):
+        # 배경을 새로 칠했을 때 등: 다음 update에서 전체를 다시 그림
+        self.text = None
+        self.color = None
+
+    def update(self, text, color):
+        prev = self.text
+        cw = 6*self.scale
+        if prev is None or color != self.color:
+            # 처음이거나 색이 바뀌면(WARN → OK 등) 전체
+            self._draw_run(0, text, color, cw)
+            if prev is not None and len(prev) > len(text):
+                self._draw_run(len(text), " " * (len(prev)-len(text)), color, cw)
+        else:
+            n = max(len(prev), len(text))
+            a = prev + " " * (n-len(prev))
+            b = text + " " * (n-len(text))
+            i = 0
+            while i < n:
+                if a[i] == b[i]:
+                    i += 1
+                    continue
+                # 연속으로 바뀐 칸은 한 번에 그림(예: "59" → "00")
+                j = i + 1
+                while j < n and a[j] != b[j]:
+                    j += 1
+                self._draw_run(i, b[i:j], color, cw)
+                i = j
+        self.text = text
+        self.color = color
+
+    def _draw_run(self, i, s, color, cw):
+        self.draw(self.x + i*cw, self.y, s, color, self.bg, self.scale)
+        self.cells += len(s)
@@ -0,0 +1,422 @@
+import struct
+from compat import async_sleep_ms, const
+from .font import FONT5x7, glyph, metrics, advance, text_width
+from .glyphcache import GlyphCache
+
+# ===== 디스플레이 해상도 =====
+TFT_W = 80
+TFT_H = 160
+
+# ===== ST7735 명령 =====
+# const: MicroPython이 이 모듈 안의 사용처에 값을 바로 넣음(전역 찾기 없음). 이름은 그대로 import 가능
+SWRESET = const(0x01)
+SLPOUT  = const(0x11)
+DISPON  = const(0x29)
+CASET   = const(0x2A)
+PASET   = const(0x2B)
+RAMWR   = const(0x2C)
+MADCTL  = const(0x36)
+COLMOD  = const(0x3A)
+INVON   = const(0x21)
+INVOFF  = const(0x20)
+RDDID   = const(0x04)      # 읽기: 표시 장치 ID 3바이트
+RAMRD   = const(0x2E)      # 읽기: 창 안 픽셀(픽셀당 3바이트, 색마다 상위 6비트)
+
+# MADCTL 비트
+MY = const(0x80); MX = const(0x40); MV = const(0x20); BGR = const(0x08)
+
+def rgb565(r, g, b):
+    return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+
+def _fill565(mv, o, n, color):
+    # mv[o:o+n]를 한 색으로: 첫 픽셀을 쓰고 이미 채운 앞부분을 두 배씩 복사(새 버퍼 없음)
+    mv[o] = (color >> 8) & 0xFF; mv[o+1] = color & 0xFF
+    k = 2
+    while k < n:
+        m = min(k, n-k)
+        mv[o+k:o+k+m] = mv[o:o+m]
+        k += m
+
+class ST7735_80x160:
+    # chunk: fill_color 한 번에 보내는 픽셀 수(클수록 빠르지만 RAM 사용 증가)
+    # fill_colors: 칠하기용 색 버퍼(chunk 픽셀)를 몇 색까지 들고 있을지. 자주 칠하는 색은 매번 안 만듦
+    # glyph_budget: 글자 비트맵 캐시 예산(바이트), 0이면 캐시 안 씀
+    # init=False: 초기화를 미룸 → 나중에 init() 또는 await init_async()
+    def __init__(self, bus, rotation=0, invert=False, mirror_x=False, chunk=1024,
+                 glyph_budget=4096, init=True, fill_colors=2):
+        self.bus = bus
+        self.spi = bus.spi
+        self.cs  = bus.cs
+        self.dc  = bus.dc
+        self.rotation = rotation
+        self.invert = invert
+        self.mirror_x = mirror_x
+        self.chunk = chunk
+        self.fill_colors = fill_colors
+        self._caset = bytearray(4); self._paset = bytearray(4); self._px = bytearray(2)
+        self._win = [-1, -1, -1, -1]    # 패널에 마지막으로 보낸 창(오프셋 포함). 같으면 CASET/PASET 생략
+        self._fills = []                # [색, memoryview] 목록, 오래 안 쓴 색이 앞
+        self.glyphs = GlyphCache(glyph_budget) if glyph_budget else None
+
+        self.width  = TFT_W
+        self.height = TFT_H
+        # 기본 오프셋 (회전 0/2)
+        self.x_offset = 26
+        self.y_offset = 1
+
+        self.ready = False
+        self._apply_rotation(rotation, mirror_x)
+        if init:
+            self.init()
+
+    def _apply_rotation(self, rot, mirror_x):
+        # 기본 MADCTL
+        if rot == 0:
+            mad = BGR | (MX if not mirror_x else 0)  # 좌우 반전 토글
+            self.width, self.height = TFT_W, TFT_H
+            self.x_offset, self.y_offset = 26, 1
+        elif rot == 1:
+            mad = BGR | MV | (0 if not mirror_x else MX)  # 회전시 미러 방향 달라짐
+            self.width, self.height = TFT_H, TFT_W
+            self.x_offset, self.y_offset = 1, 26
+        elif rot == 2:
+            mad = BGR | MY | (MX if not mirror_x else 0)
+            self.width, self.height = TFT_W, TFT_H
+            self.x_offset, self.y_offset = 26, 1
+        else:  # rot == 3
+            mad = BGR | MX | MY | MV
+            if mirror_x:
+                mad ^= MX  # 토글
+            self.width, self.height = TFT_H, TFT_W
+            self.x_offset, self.y_offset = 1, 26
+
+        self._mad = mad
+
+    def _cmd(self, c):
+        self.bus.cmd(c)
+
+    def _data(self, b):
+        self.bus.data(b)
+
+    def _cmd_args(self, c, b):
+        # 명령 + 인자를 한 트랜잭션으로
+        bus = self.bus
+        bus.begin(); bus.put_cmd(c); bus.put_data(b); bus.end()
+
+    def _init_steps(self):
+        # 명령을 보내고 기다릴 ms를 차례로 내줌(동기/비동기 초기화가 같이 씀)
+        bus = self.bus
+        if bus.rst is not None:
+            bus.rst.value(0); yield 50
+            bus.rst.value(1); yield 120
+        self._cmd(SWRESET); yield 150
+        self.forget_window()
+        self._cmd(SLPOUT);  yield 120
+
+        # 16bpp
+        self._cmd_args(COLMOD, b"\x05"); yield 10
+        # 회전
+        self._cmd_args(MADCTL, bytes((self._mad,)))
+        # 색반전(모듈에 따라 ON/OFF 달라요)
+        self._cmd(INVON if self.invert else INVOFF); yield 10
+        self._cmd(DISPON); yield 100
+        self.fill_color(rgb565(0,0,0))
+        self.ready = True
+
+    def init(self):
+        for ms in self._init_steps():
+            self.bus.delay(ms)
+
+    async def init_async(self):
+        # 리셋/슬립해제 대기(약 560ms) 동안 다른 작업(Wi-Fi 접속 등)이 돌 수 있음
+        for ms in self._init_steps():
+            await async_sleep_ms(ms)
+
+    def forget_window(self):
+        # 패널의 창을 모름(리셋, 전송 오류 가능성 등) → 다음 set_window에서 CASET/PASET 다시
+        self._win[0] = self._win[2] = -1
+
+    def set_window(self, x0, y0, x1, y1):
+        # CS를 내린 채 CASET/PASET(바뀐 것만)/RAMWR을 보내고 그대로 둠
+        # → 이어지는 begin_data()~end()의 픽셀까지 한 트랜잭션. 인자는 미리 잡아 둔 버퍼에
+        x0 += self.x_offset; x1 += self.x_offset
+        y0 += self.y_offset; y1 += self.y_offset
+        bus = self.bus; win = self._win
+        bus.begin()
+        if x0 != win[0] or x1 != win[1]:
+            struct.pack_into(">HH", self._caset, 0, x0, x1)
+            bus.put_cmd(CASET); bus.put_data(self._caset)
+            win[0] = x0; win[1] = x1
+        if y0 != win[2] or y1 != win[3]:
+            struct.pack_into(">HH", self._paset, 0, y0, y1)
+            bus.put_cmd(PASET); bus.put_data(self._paset)
+            win[2] = y0; win[3] = y1
+        bus.put_cmd(RAMWR)
+
+    def write_window(self, x, y, w, h, buf):
+        # 이미 RGB565(빅엔디안)로 준비된 버퍼를 한 창에 전송
+        self.set_window(x, y, x+w-1, y+h-1)
+        self.bus.begin_data()
+        self.bus.write(buf)
+        self.bus.end()
+
+    # ── 칠하기: 색 버퍼를 재사용해서 같은 색을 반복해 칠할 때 새로 할당하지 않음
+    def _fill_chunk(self, color):
+        # chunk 픽셀짜리 색 버퍼(memoryview). fill_colors개까지 보관
+        # 색 수가 몇 개뿐이라 [색, 버퍼] 목록을 훑음. 순서는 제자리에서 밀어서 바꿈(할당 없음)
+        fl = self._fills
+        for i in range(len(fl)):
+            e = fl[i]
+            if e[0] == color:
+                self._lru_last(i)                      # 최근 사용으로(맨 뒤)
+                return e[1]
+        if len(fl) >= max(1, self.fill_colors):
+            e = fl[0]; e[0] = color                    # 가장 오래된 색 버퍼를 새 색으로 다시 칠함
+            self._lru_last(0)
+        else:
+            e = [color, memoryview(bytearray(self.chunk*2))]
+            fl.append(e)
+        _fill565(e[1], 0, len(e[1]), color)
+        return e[1]
+
+    def _lru_last(self, i):
+        fl = self._fills
+        e = fl[i]
+        for j in range(i, len(fl)-1):
+            fl[j] = fl[j+1]
+        fl[-1] = e
+
+    def _stream_solid(self, color, pixels):
+        # 열린 창(begin_data 이후)에 한 색 pixels개
+        mv = self._fill_chunk(color)
+        full = self.chunk
+        write = self.bus.write
+        while pixels >= full:
+            write(mv); pixels -= full
+        if pixels:
+            write(mv[:pixels*2])
+
+    def _stream_scratch(self, color, pixels):
+        # 한 번만 쓰는 색(그라데이션 등): 색 버퍼 캐시를 밀어내지 않도록 공용 임시 버퍼로
+        n = min(pixels, self.TEXT_BUF // 2)
+        mv = memoryview(self._text_buf(n*2))
+        _fill565(mv, 0, n*2, color)
+        write = self.bus.write
+        while pixels >= n:
+            write(mv[:n*2]); pixels -= n
+        if pixels:
+            write(mv[:pixels*2])
+
+    def fill_color(self, color565, x=0, y=0, w=None, h=None):
+        if w is None: w = self.width
+        if h is None: h = self.height
+        if w <= 0 or h <= 0: return
+        self.set_window(x, y, x+w-1, y+h-1)
+        self.bus.begin_data()
+        self._stream_solid(color565, w*h)
+        self.bus.end()
+
+    def fill_runs(self, x, y, w, h, runs):
+        # 창 하나에 (색, 픽셀 수) 구간들을 이어서 전송(RLE). 합이 w*h보다 작으면 나머지는 그대로
+        if w <= 0 or h <= 0: return
+        self.set_window(x, y, x+w-1, y+h-1)
+        self.bus.begin_data()
+        left = w*h
+        for color, n in runs:
+            n = min(n, left)
+            if n <= 0: break
+            self._stream_solid(color, n)
+            left -= n
+        self.bus.end()
+
+    def gradient(self, x, y, w, h, c0, c1, vertical=True):
+        # c0 → c1 그라데이션(색은 (r, g, b) 8비트). 작은 줄 버퍼 하나로 줄을 흘려 보냄
+        # vertical=True: 위→아래로 색이 바뀜(같은 565색 줄은 하나로 합쳐 보냄)
+        if w <= 0 or h <= 0: return
+        n = max(1, (h if vertical else w) - 1)
+        r0, g0, b0 = c0; dr = c1[0]-r0; dg = c1[1]-g0; db = c1[2]-b0
+        def at(i):
+            t = i*256 // n
+            return rgb565(r0 + (dr*t >> 8), g0 + (dg*t >> 8), b0 + (db*t >> 8))
+        self.set_window(x, y, x+w-1, y+h-1)
+        bus = self.bus
+        bus.begin_data()
+        if vertical:
+            i = 0
+            while i < h:
+                c = at(i); j = i + 1
+                while j < h and at(j) == c:
+                    j += 1
+                self._stream_scratch(c, (j-i)*w)
+                i = j
+        else:
+            # 한 줄을 만들고 버퍼에 들어가는 만큼 줄을 복사해 둔 뒤 반복 전송
+            row = w*2
+            rows = max(1, min(h, self.TEXT_BUF // row))
+            buf = memoryview(self._text_buf(rows*row))
+            i = 0
+            while i < w:
+                c = at(i); j = i + 1
+                while j < w and at(j) == c:
+                    j += 1
+                _fill565(buf, i*2, (j-i)*2, c)
+                i = j
+            for r in range(1, rows):
+                buf[r*row:(r+1)*row] = buf[0:row]
+            left = h
+            while left > 0:
+                k = min(rows, left)
+                bus.write(buf[:k*row])
+                left -= k
+        bus.end()
+
+    def fill_rect(self, x, y, w, h, color):
+        self.fill_color(color, x, y, w, h)
+
+    def rect(self, x, y, w, h, color):
+        self.fill_color(color, x, y, w, 1)
+        self.fill_color(color, x, y+h-1, w, 1)
+        self.fill_color(color, x, y, 1, h)
+        self.fill_color(color, x+w-1, y, 1, h)
+
+    def hline(self, x, y, w, color):
+        self.fill_color(color, x, y, w, 1)
+
+    def vline(self, x, y, h, color):
+        self.fill_color(color, x, y, 1, h)
+
+    # ── 5x7 텍스트
+    def pixel(self, x, y, color):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            b = self._px
+            b[0] = (color>>8)&0xFF; b[1] = color&0xFF
+            self.set_window(x, y, x, y)
+            self._data(b)
+
+    # 글자 한 칸((열 수+1)*scale x 7*scale, 오른쪽 1칸 간격 포함)을 RGB565로 buf에 그림
+    # stride: buf 한 줄의 바이트 수. c0, nc: 그릴 폰트 열(고정폭은 0, 5)
+    def _render_glyph(self, buf, off, stride, ch, fgs, bgs, scale, c0=0, nc=5):
+        g = glyph(ch) + c0
+        n = 2*scale          # 폰트 한 점의 가로 바이트 수
+        row_bytes = (nc+1)*n
+        for cy in range(7):
+            r0 = off + cy*scale*stride
+            o = r0
+            for cx in range(nc):
+                buf[o:o+n] = fgs if (FONT5x7[g+cx] >> cy) & 1 else bgs
+                o += n
+            buf[o:o+n] = bgs
+            for k in range(1, scale):
+                d = r0 + k*stride
+                buf[d:d+row_bytes] = buf[r0:r0+row_bytes]
+
+    def _text_buf(self, size):
+        b = getattr(self, "_tbuf", None)
+        if b is None or len(b) < size:
+            b = self._tbuf = bytearray(size)
+        return b
+
+    def _glyph_block(self, ch, color, bg, scale, prop=False, aa=False):
+        # 글자 한 칸 블록(한 줄 = 고정폭 6*scale, 가변폭은 (잉크 폭+1)*scale 픽셀). 캐시가 있으면 재사용
+        # aa=True: 배경색과 미리 섞은 안티에일리어스 글자(st7735.aafont). 캐시된 뒤 비용은 같음
+        cache = self.glyphs
+        key = (ch, color, bg, scale, prop, aa)
+        if cache is not None:
+            blk = cache.get(key)
+            if blk is not None:
+                return blk
+        _, c0, nc = metrics(ch, prop)
+        cw = (nc+1)*scale
+        blk = bytearray(cw*7*scale*2)
+        if aa:
+            from . import aafont
+            aafont.render(blk, 0, cw*2, ch, color, bg, scale, c0, nc)
+        else:
+            fgs = bytes(((color >> 8) & 0xFF, color & 0xFF)) * scale
+            bgs = bytes(((bg >> 8) & 0xFF, bg & 0xFF)) * scale
+            self._render_glyph(blk, 0, cw*2, ch, fgs, bgs, scale, c0, nc)
+        if cache is not None:
+            cache.put(key, blk)
+        return blk
+
+    def draw_char(self, x, y, ch, color, bg=None, scale=1, prop=False, aa=False):
+        # 전진 폭(px)을 돌려줌. aa는 배경(bg)이 있을 때만
+        if bg is None:
+            return self._draw_char_transparent(x, y, ch, color, scale, prop)
+        self._blit_text(x, y, ch, color, bg, scale, prop, aa)
+        return advance(ch, scale, prop)
+
+    def _draw_char_transparent(self, x, y, ch, color, scale, prop=False):
+        # 배경 없음: 열마다 연속된 점을 한 번의 fill로 묶어서 그림
+        g, c0, nc = metrics(ch, prop)
+        for cx in range(nc):
+            col = FONT5x7[g+c0+cx]
+            cy = 0
+            while cy < 7:
+                if (col >> cy) & 1:
+                    y0 = cy
+                    while cy < 7 and (col >> cy) & 1:
+                        cy += 1
+                    self.fill_rect(x+cx*scale, y+y0*scale, scale, (cy-y0)*scale, color)
+                else:
+                    cy += 1
+        return (nc+1)*scale
+
+    # 한 번에 보내는 글자 버퍼 최대 크기(바이트). 넘으면 여러 창으로 나눠 전송
+    TEXT_BUF = 4096
+
+    def text_into(self, buf, stride, x, y, text, color, bg, scale=1, prop=False, aa=False):
+        # 임의의 RGB565 버퍼(한 줄 stride 바이트)에 글자 블록을 복사. 잘림 처리 없음. 그린 폭(px)을 돌려줌
+        ch_h = 7*scale
+        o0 = start = y*stride + x*2
+        for c in text:
+            blk = self._glyph_block(c, color, bg, scale, prop, aa)
+            gb = len(blk) // ch_h        # 글자 블록 한 줄 바이트
+            d = o0; s = 0
+            for _ in range(ch_h):
+                buf[d:d+gb] = blk[s:s+gb]
+                d += stride; s += gb
+            o0 += gb
+        return (o0 - start) // 2
+
+    def _blit_text(self, x, y, text, color, bg, scale, prop=False, aa=False):
+        # 문자열 전체를 하나의 RGB565 버퍼로 만들어 set_window 1번 + 쓰기 1번
+        # 화면 끝에서는 글자 단위로 자르고, TEXT_BUF를 넘으면 여러 창으로 나눔
+        ch_h = 7*scale
+        if y < 0 or y + ch_h > self.height or x < 0:
+            return
+        room = self.width - x
+        limit = self.TEXT_BUF // (2*ch_h)          # 창 하나에 담을 수 있는 폭(px)
+        i = 0; n = len(text)
+        while i < n:
+            w = 0; j = i
+            while j < n:
+                a = advance(text[j], scale, prop)
+                if w + a > room or (w + a > limit and j > i): break
+                w += a; j += 1
+            if j == i:
+                return
+            if j == i + 1:
+                # 한 글자는 캐시 블록을 그대로 전송
+                self.write_window(x, y, w, ch_h, self._glyph_block(text[i], color, bg, scale, prop, aa))
+            else:
+                size = w*2*ch_h
+                buf = self._text_buf(size)
+                self.text_into(buf, w*2, 0, 0, text[i:j], color, bg, scale, prop, aa)
+                self.write_window(x, y, w, ch_h, memoryview(buf)[:size])
+            x += w; room -= w; i = j
+
+    def draw_text(self, x, y, text, color, bg=None, scale=1, prop=False, aa=False):
+        # prop=True: 가변폭(글자마다 잉크 폭 + 1). aa=True: 안티에일리어스(bg가 있을 때만)
+        # 그린 폭(px)을 돌려줌
+        if bg is None:
+            x0 = x
+            for ch in text:
+                x += self._draw_char_transparent(x, y, ch, color, scale, prop)
+            return x - x0
+        self._blit_text(x, y, text, color, bg, scale, prop, aa)
+        return text_width(text, scale, prop)
+
+    def text_width(self, text, scale=1, prop=False):
+        # 버스를 건드리지 않는 폭 계산(font.text_width와 같음)
+        return text_width(text, scale, prop)
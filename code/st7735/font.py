@@ -0,0 +1,117 @@
+# ── 5x7 폰트: 출력 가능한 ASCII 전체(0x20~0x7E)를 bytes 하나에 담음
+# 글자마다 5바이트(세로 한 열 = 1바이트, bit0이 맨 위), 코드 순서대로 → (ord(ch)-0x20)*5
+# bytes 상수라 mpy-cross/freeze로 펌웨어에 넣으면 플래시에 그대로 남고 import 때 힙을 안 씀
+# (.py로 올려도 bytes 한 덩어리 475바이트, 예전 dict-of-list보다 훨씬 작음)
+FIRST = 0x20
+LAST  = 0x7E
+
+FONT5x7 = (
+    b"\x00\x00\x00\x00\x00\x00\x00\x5F\x00\x00\x00\x07\x00\x07\x00\x14\x7F\x14\x7F\x14"  # sp ! " #
+    b"\x24\x2A\x7F\x2A\x12\x23\x13\x08\x64\x62\x36\x49\x56\x20\x50\x00\x05\x03\x00\x00"  # $ % & '
+    b"\x00\x1C\x22\x41\x00\x00\x41\x22\x1C\x00\x14\x08\x3E\x08\x14\x08\x08\x3E\x08\x08"  # ( ) * +
+    b"\x00\x40\x20\x00\x00\x08\x08\x08\x08\x08\x00\x40\x60\x00\x00\x40\x20\x10\x08\x04"  # , - . /
+    b"\x3E\x51\x49\x45\x3E\x00\x42\x7F\x40\x00\x42\x61\x51\x49\x46\x21\x41\x45\x4B\x31"  # 0 1 2 3
+    b"\x18\x14\x12\x7F\x10\x27\x45\x45\x45\x39\x3C\x4A\x49\x49\x30\x01\x71\x09\x05\x03"  # 4 5 6 7
+    b"\x36\x49\x49\x49\x36\x06\x49\x49\x29\x1E\x00\x36\x36\x00\x00\x00\x56\x36\x00\x00"  # 8 9 : ;
+    b"\x08\x14\x22\x41\x00\x14\x14\x14\x14\x14\x00\x41\x22\x14\x08\x02\x01\x51\x09\x06"  # < = > ?
+    b"\x32\x49\x79\x41\x3E\x7E\x11\x11\x11\x7E\x7F\x49\x49\x49\x36\x3E\x41\x41\x41\x22"  # @ A B C
+    b"\x7F\x41\x41\x22\x1C\x7F\x49\x49\x49\x41\x7F\x09\x09\x09\x01\x3E\x41\x49\x49\x7A"  # D E F G
+    b"\x7F\x08\x08\x08\x7F\x00\x41\x7F\x41\x00\x20\x40\x41\x3F\x01\x7F\x08\x14\x22\x41"  # H I J K
+    b"\x7F\x40\x40\x40\x40\x7F\x02\x04\x02\x7F\x7F\x04\x08\x10\x7F\x3E\x41\x41\x41\x3E"  # L M N O
+    b"\x7F\x09\x09\x09\x06\x3E\x41\x51\x21\x5E\x7F\x09\x19\x29\x46\x46\x49\x49\x49\x31"  # P Q R S
+    b"\x01\x01\x7F\x01\x01\x3F\x40\x40\x40\x3F\x1F\x20\x40\x20\x1F\x3F\x40\x38\x40\x3F"  # T U V W
+    b"\x63\x14\x08\x14\x63\x07\x08\x70\x08\x07\x61\x51\x49\x45\x43\x00\x7F\x41\x41\x00"  # X Y Z [
+    b"\x02\x04\x08\x10\x20\x00\x41\x41\x7F\x00\x04\x02\x01\x02\x04\x40\x40\x40\x40\x40"  # \\ ] ^ _
+    b"\x00\x01\x02\x04\x00\x20\x54\x54\x54\x78\x7F\x48\x44\x44\x38\x38\x44\x44\x44\x20"  # ` a b c
+    b"\x38\x44\x44\x48\x7F\x38\x54\x54\x54\x18\x08\x7E\x09\x01\x02\x0C\x52\x52\x52\x3E"  # d e f g
+    b"\x7F\x08\x04\x04\x78\x00\x44\x7D\x40\x00\x20\x40\x44\x3D\x00\x7F\x10\x28\x44\x00"  # h i j k
+    b"\x00\x41\x7F\x40\x00\x7C\x04\x18\x04\x78\x7C\x08\x04\x04\x78\x38\x44\x44\x44\x38"  # l m n o
+    b"\x7C\x14\x14\x14\x08\x08\x14\x14\x18\x7C\x7C\x08\x04\x04\x08\x48\x54\x54\x54\x20"  # p q r s
+    b"\x04\x3F\x44\x40\x20\x3C\x40\x40\x20\x7C\x1C\x20\x40\x20\x1C\x3C\x40\x30\x40\x3C"  # t u v w
+    b"\x44\x28\x10\x28\x44\x0C\x50\x50\x50\x3C\x44\x64\x54\x4C\x44\x00\x08\x36\x41\x00"  # x y z {
+    b"\x00\x00\x7F\x00\x00\x00\x41\x36\x08\x00\x10\x08\x08\x10\x08"  # | } ~
+)
+
+# 글자별 (왼쪽 빈 열 수 << 4) | 잉크 폭. 가변폭 배치용(공백은 폭 2, 간격 포함 3)
+WIDTH5x7 = (
+    b"\x02\x21\x13\x05\x05\x05\x05\x12\x13\x13\x05\x05\x12\x05\x12\x05"
+    b"\x05\x13\x05\x05\x05\x05\x05\x05\x05\x05\x12\x12\x04\x05\x14\x05"
+    b"\x05\x05\x05\x05\x05\x05\x05\x05\x05\x13\x05\x05\x05\x05\x05\x05"
+    b"\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x13\x05\x13\x05\x05"
+    b"\x13\x05\x05\x05\x05\x05\x05\x05\x05\x13\x04\x04\x13\x05\x05\x05"
+    b"\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x13\x21\x13\x05"
+)
+
+def glyph(ch):
+    # ch의 5열이 시작하는 FONT5x7 위치. 없는 글자는 공백
+    o = ord(ch) - FIRST
+    if not 0 <= o <= LAST - FIRST:
+        o = 0
+    return o*5
+
+# ── 글자 폭/배치(버스와 무관, 표만 봄)
+# prop=False: 고정폭 6*scale(5열 + 간격 1), prop=True: 잉크 폭 + 간격 1
+def metrics(ch, prop=False):
+    # (FONT5x7 위치, 시작 열, 열 수)
+    g = glyph(ch)
+    if not prop:
+        return g, 0, 5
+    m = WIDTH5x7[g // 5]
+    return g, m >> 4, m & 0x0F
+
+def advance(ch, scale=1, prop=False):
+    if not prop:
+        return 6*scale
+    return ((WIDTH5x7[glyph(ch) // 5] & 0x0F) + 1)*scale
+
+def text_width(text, scale=1, prop=False):
+    if not prop:
+        return len(text)*6*scale
+    w = 0
+    for ch in text:
+        o = ord(ch) - FIRST
+        w += (WIDTH5x7[o if 0 <= o <= LAST - FIRST else 0] & 0x0F) + 1
+    return w*scale
+
+def ellipsize(text, max_w, scale=1, prop=False, tail=".."):
+    # max_w에 들어가도록 뒤를 잘라 tail을 붙임(들어가면 그대로)
+    if text_width(text, scale, prop) <= max_w:
+        return text
+    room = max_w - text_width(tail, scale, prop)
+    w = 0; n = 0
+    for ch in text:
+        a = advance(ch, scale, prop)
+        if w + a > room: break
+        w += a; n += 1
+    return text[:n].rstrip() + tail if room > 0 else ""
+
+def wrap(text, max_w, max_lines=None, scale=1, prop=False):
+    # 단어 단위 줄바꿈(한 단어가 한 줄보다 길면 글자 단위로 자름)
+    # max_lines를 넘으면 마지막 줄에 나머지를 붙여 ellipsize
+    sp = advance(" ", scale, prop)
+    lines = []; cur = ""; cw = 0
+    for word in text.split():
+        ww = text_width(word, scale, prop)
+        while ww > max_w:
+            # 긴 단어: 들어가는 만큼씩 자름
+            if cur:
+                lines.append(cur); cur = ""; cw = 0
+            n = 0; w = 0
+            for ch in word:
+                a = advance(ch, scale, prop)
+                if w + a > max_w and n: break
+                w += a; n += 1
+            lines.append(word[:n]); word = word[n:]
+            ww = text_width(word, scale, prop)
+        if not word:
+            continue
+        if cur and cw + sp + ww <= max_w:
+            cur += " " + word; cw += sp + ww
+        else:
+            if cur: lines.append(cur)
+            cur = word; cw = ww
+    if cur: lines.append(cur)
+    if max_lines is not None and len(lines) > max_lines:
+        last = " ".join(lines[max_lines-1:])
+        lines = lines[:max_lines-1] + [ellipsize(last, max_w, scale, prop)]
+    return lines
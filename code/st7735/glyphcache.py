@@ -0,0 +1,58 @@
+# ── 글자 비트맵 캐시: (문자, 전경색, 배경색, 배율) → 바로 보낼 RGB565 블록
+# ESP32-C3 힙이 작으므로 총 바이트 예산(budget)을 넘으면 오래 안 쓴 것부터 버림(LRU)
+from collections import OrderedDict
+
+class GlyphCache:
+    def __init__(self, budget=4096):
+        self.budget = budget
+        self._d = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        d = self._d
+        if key in d:
+            # 최근 사용으로 이동(pop 후 다시 넣으면 맨 뒤로 감)
+            v = d.pop(key); d[key] = v
+            self.hits += 1
+            return v
+        self.misses += 1
+        return None
+
+    def put(self, key, block):
+        n = len(block)
+        if n > self.budget:
+            return
+        d = self._d
+        if key in d:
+            self.size -= len(d.pop(key))
+        while self.size + n > self.budget:
+            old = next(iter(d))
+            self.size -= len(d.pop(old))
+            self.evictions += 1
+        d[key] = block
+        self.size += n
+
+    def clear(self):
+        self._d = OrderedDict()
+        self.size = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "entries":   len(self._d),
+            "bytes":     self.size,
+            "budget":    self.budget,
+            "hits":      self.hits,
+            "misses":    self.misses,
+            "evictions": self.evictions,
+            "hit_rate":  (self.hits / total) if total else 0.0,
+        }
+
+    def reset_stats(self):
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._d)
@@ -0,0 +1,171 @@
+# ── PC(CPython)용 가짜 SPI/Pin: 보드 없이 전송량을 재고 회귀 검사하기 위함
+# 사용:
+#   tft, rec = host_display(rotation=1)
+#   rec.reset(); tft.draw_text(0, 0, "12:34", 0xFFFF, bg=0)
+#   print(rec.snapshot())   # 트랜잭션/명령/바이트 수
+import time
+from .bus import SPIBus
+from .driver import ST7735_80x160
+
+class Recorder:
+    # keep=True면 (dc, bytes) 원본 스트림도 log에 보관(시뮬레이터 등에서 사용)
+    def __init__(self, keep=False):
+        self.keep = keep
+        self.reset()
+
+    def reset(self):
+        self.transactions = 0   # CS low→high 한 번 = 1 트랜잭션
+        self.cs_toggles   = 0
+        self.cmds         = 0   # DC=0 상태의 write 호출
+        self.data_writes  = 0   # DC=1 상태의 write 호출
+        self.cmd_bytes    = 0
+        self.data_bytes   = 0
+        self.delay_ms     = 0
+        self.read_bytes   = 0   # MISO로 읽은 바이트
+        self.log = []
+
+    @property
+    def bytes(self):
+        return self.cmd_bytes + self.data_bytes
+
+    def snapshot(self):
+        return {
+            "transactions": self.transactions,
+            "cs_toggles":   self.cs_toggles,
+            "cmds":         self.cmds,
+            "data_writes":  self.data_writes,
+            "bytes":        self.bytes,
+            "data_bytes":   self.data_bytes,
+            "delay_ms":     self.delay_ms,
+        }
+
+    def pin(self, name, v):
+        if name == "cs":
+            self.cs_toggles += 1
+            if v:
+                self.transactions += 1
+
+    def write(self, dc, buf):
+        n = len(buf)
+        if dc:
+            self.data_writes += 1; self.data_bytes += n
+        else:
+            self.cmds += 1; self.cmd_bytes += n
+        if self.keep:
+            self.log.append((dc, bytes(buf)))
+
+    def read(self, n):
+        # 응답하는 패널이 없음(MISO 안 붙음) → 0
+        self.read_bytes += n
+        return bytes(n)
+
+    def delay(self, ms):
+        self.delay_ms += ms
+
+class HostPin:
+    OUT = 1
+    IN  = 0
+
+    def __init__(self, name, mode=OUT, value=0, recorder=None):
+        self.name = name
+        self.mode = mode
+        self._v = value
+        self.recorder = recorder
+
+    def value(self, v=None):
+        if v is None:
+            return self._v
+        v = 1 if v else 0
+        if v != self._v and self.recorder is not None:
+            self.recorder.pin(self.name, v)
+        self._v = v
+
+    def __call__(self, v=None):
+        return self.value(v)
+
+class HostSPI:
+    # realtime=True면 write가 baudrate 기준 전송 시간만큼 걸림(겹침/프레임 시간 검증용)
+    # error_above: 이 속도(Hz)를 넘으면 ber(비트당 확률)로 비트를 뒤집음(배선 한계 흉내, 쓰기/읽기 모두)
+    def __init__(self, recorder, dc, baudrate=40_000_000, realtime=False,
+                 error_above=None, ber=1e-3, seed=1):
+        self.recorder = recorder
+        self.dc = dc
+        self.baudrate = baudrate
+        self.realtime = realtime
+        self._debt = 0.0        # realtime: 아직 안 잔 전송 시간(짧은 명령마다 잠들면 오차가 더 큼)
+        self.error_above = error_above
+        self.ber = ber
+        self.flips = 0
+        if error_above is not None:
+            import random
+            self._rnd = random.Random(seed)
+            self._gap = int(self._rnd.expovariate(ber))     # 다음 오류까지 남은 비트
+
+    def init(self, baudrate=None, **kw):
+        if baudrate is not None:
+            self.baudrate = baudrate
+
+    def _noisy(self, buf):
+        # 비트 오류를 넣은 사본(원본 버퍼는 그대로). 오류 사이 간격을 지수분포로 뽑아 건너뜀
+        if self.error_above is None or self.baudrate <= self.error_above:
+            return buf
+        n = len(buf)*8
+        p = self._gap; out = None
+        while p < n:
+            if out is None: out = bytearray(buf)
+            out[p >> 3] ^= 0x80 >> (p & 7)
+            self.flips += 1
+            p += 1 + int(self._rnd.expovariate(self.ber))
+        self._gap = p - n
+        return buf if out is None else out
+
+    def read(self, n):
+        return self._noisy(self.recorder.read(n))
+
+    def write(self, buf):
+        buf = self._noisy(buf)
+        self.recorder.write(self.dc.value(), buf)
+        if self.realtime:
+            self._debt += len(buf) * 8 / self.baudrate
+            if self._debt >= 0.0005:
+                time.sleep(self._debt); self._debt = 0.0
+
+    def deinit(self):
+        pass
+
+class BareSPI:
+    # machine.SPI처럼 속도(baudrate)를 읽을 수 없는 SPI: 보드에만 있는 속성을 쓰는 코드를 PC에서 잡기 위함
+    def __init__(self, spi):
+        self._spi = spi
+
+    def init(self, **kw):
+        self._spi.init(**kw)
+
+    def write(self, buf):
+        self._spi.write(buf)
+
+    def read(self, n, *a):
+        return self._spi.read(n, *a)
+
+    def deinit(self):
+        self._spi.deinit()
+
+def host_bus(recorder=None, baudrate=40_000_000, realtime=False, **errors):
+    # errors: HostSPI의 error_above/ber/seed
+    rec = recorder if recorder is not None else Recorder()
+    cs  = HostPin("cs",  value=1, recorder=rec)
+    dc  = HostPin("dc",  value=0, recorder=rec)
+    rst = HostPin("rst", value=1, recorder=rec)
+    spi = HostSPI(rec, dc, baudrate, realtime, **errors)
+    return SPIBus(spi, cs, dc, rst, delay=rec.delay), rec
+
+def host_display(rotation=0, invert=True, mirror_x=False, keep=False,
+                 baudrate=40_000_000, realtime=False, recorder=None, errors=None, **kw):
+    # 초기화 스트림은 버리고 깨끗한 카운터로 돌려줌
+    # recorder: Recorder 대신 쓸 것(st7735.sim.PanelSim 등: 화면 재현, RDDID/RAMRD 응답)
+    # errors: 비트 오류 흉내 {"error_above": Hz, "ber": 확률, "seed": n}
+    bus, rec = host_bus(recorder if recorder is not None else Recorder(keep), baudrate, realtime,
+                        **(errors or {}))
+    tft = ST7735_80x160(bus, rotation=rotation, invert=invert, mirror_x=mirror_x, **kw)
+    rec.reset()
+    return tft, rec
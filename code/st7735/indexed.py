@@ -0,0 +1,191 @@
+# ── 팔레트(16색) 오프스크린 합성기: Compositor와 같은 그리기/flush 방식이지만 픽셀당 4비트
+# 화면 전체 160x80 = 6.4KB(RGB565는 25.6KB). 색은 그릴 때 팔레트 번호로 바꿔 저장
+# 저장 형식은 framebuf.GS4_HMSB와 같음(한 바이트 = 가로 두 픽셀, 왼쪽이 상위 4비트)
+# → framebuf가 있으면 self.fb로 직접 그릴 수도 있음(색 대신 index(색), 그린 뒤 invalidate())
+# flush: 바이트(두 픽셀) → RGB565 4바이트 표(256칸, 1KB)로 줄 버퍼에 펼쳐서 전송
+# 주의: aa 글자는 배경과 섞인 중간색이 팔레트에 없으므로 무시(단색 글자), 폭이 홀수면 안 됨
+from .compositor import Compositor
+from .font import FONT5x7, metrics
+try:
+    import framebuf
+except ImportError:   # PC(호스트)에서는 framebuf 없이 자체 그리기만 사용
+    framebuf = None
+
+def expand(dst, d, src, s, n, lut):
+    # src[s:s+n](4비트 두 픽셀씩) → dst[d:d+4n](RGB565 빅엔디언). 바이트마다 조각을 만들지 않도록
+    # 한 바이트씩 옮김(src는 memoryview로 넘길 것: 호출당 할당 한 번)
+    for b in src[s:s+n]:
+        j = b << 2
+        dst[d] = lut[j]; dst[d+1] = lut[j+1]; dst[d+2] = lut[j+2]; dst[d+3] = lut[j+3]
+        d += 4
+
+class IndexedCompositor:
+    # palette: 처음부터 넣어 둘 색들(RGB565). 없는 색은 그릴 때 빈 칸에 추가, 16색을 넘으면 ValueError
+    def __init__(self, tft, palette=()):
+        self.tft = tft
+        self.width = w = tft.width
+        self.height = h = tft.height
+        if w & 1:
+            raise ValueError("width must be even")
+        self.stride = w // 2
+        self.buf = bytearray(self.stride*h)
+        self._mv = memoryview(self.buf)
+        self.fb = framebuf.FrameBuffer(self.buf, w, h, framebuf.GS4_HMSB) if framebuf else None
+        self.palette = []
+        self._lut = bytearray(1024)
+        self._lut_ok = False
+        for c in palette:
+            self.index(c)
+        self.damage = []          # [x0, y0, x1, y1] (x1/y1 미포함)
+        self.flushed_bytes = 0
+        self.flushed_rects = 0
+
+    def index(self, color):
+        # 색 → 팔레트 번호(없으면 추가)
+        pal = self.palette
+        try:
+            return pal.index(color)
+        except ValueError:
+            pass
+        if len(pal) >= 16:
+            raise ValueError("palette full")
+        pal.append(color)
+        self._lut_ok = False
+        return len(pal) - 1
+
+    def set_color(self, i, color):
+        # 팔레트 i번 색을 바꿈: 그 색으로 그려진 곳이 전부 바뀜(다음 flush에 전체 전송)
+        self.palette[i] = color
+        self._lut_ok = False
+        self.invalidate(0, 0, self.width, self.height)
+
+    def _build_lut(self):
+        # lut[4b:4b+4] = 바이트 b의 두 픽셀(상위 4비트가 왼쪽)
+        pal = self.palette + [0]*(16 - len(self.palette))
+        lut = self._lut
+        for b in range(256):
+            hi = pal[b >> 4]; lo = pal[b & 15]
+            j = b << 2
+            lut[j] = hi >> 8; lut[j+1] = hi & 0xFF
+            lut[j+2] = lo >> 8; lut[j+3] = lo & 0xFF
+        self._lut_ok = True
+
+    # ── 손상 영역 관리(Compositor와 같음)
+    def invalidate(self, x, y, w, h):
+        x0 = max(0, x); y0 = max(0, y)
+        x1 = min(self.width, x+w); y1 = min(self.height, y+h)
+        if x0 < x1 and y0 < y1:
+            self.damage.append([x0, y0, x1, y1])
+
+    _merge = staticmethod(Compositor._merge)
+
+    # ── 그리기(버퍼에만, 전송은 flush에서)
+    def _rect(self, x0, y0, x1, y1, i):
+        # 잘라낸 사각형을 번호 i로(손상 기록 없음)
+        if self.fb is not None:
+            self.fb.fill_rect(x0, y0, x1-x0, y1-y0, i)
+            return
+        buf = self.buf; mv = self._mv
+        st = self.stride
+        row = y0*st
+        a = (x0 + 1) >> 1; b = x1 >> 1      # 두 픽셀 다 칠하는 바이트 [a, b)
+        for _ in range(y1-y0):
+            if x0 & 1:                      # 홀수 x0: 그 바이트의 오른쪽(하위 4비트)만
+                o = row + (x0 >> 1)
+                buf[o] = (buf[o] & 0xF0) | i
+            if a < b:
+                o = row + a; n = b - a
+                buf[o] = (i << 4) | i
+                k = 1
+                while k < n:
+                    m = min(k, n-k)
+                    mv[o+k:o+k+m] = mv[o:o+m]
+                    k += m
+            if x1 & 1:                      # 홀수 x1: 마지막 바이트의 왼쪽(상위 4비트)만
+                o = row + b
+                buf[o] = (buf[o] & 0x0F) | (i << 4)
+            row += st
+
+    def fill_rect(self, x, y, w, h, color):
+        x0 = max(0, x); y0 = max(0, y)
+        x1 = min(self.width, x+w); y1 = min(self.height, y+h)
+        if x0 >= x1 or y0 >= y1:
+            return
+        self._rect(x0, y0, x1, y1, self.index(color))
+        self.damage.append([x0, y0, x1, y1])
+
+    def fill(self, color):
+        self.fill_rect(0, 0, self.width, self.height, color)
+
+    def text(self, x, y, text, color, bg, scale=1, prop=False, aa=False):
+        # 글자 칸을 bg로 칠하고 점이 이어진 세로 구간마다 color로. 그린 폭(px)을 돌려줌
+        fi = self.index(color); bi = self.index(bg)
+        W = self.width
+        ch_h = 7*scale
+        x0 = x
+        for ch in text:
+            if x >= W:
+                break
+            g, c0, nc = metrics(ch, prop)
+            cw = (nc+1)*scale
+            self._clip(x, y, x+cw, y+ch_h, bi)
+            for cx in range(nc):
+                col = FONT5x7[g+c0+cx]
+                px = x + cx*scale
+                cy = 0
+                while cy < 7:
+                    if (col >> cy) & 1:
+                        s = cy
+                        while cy < 7 and (col >> cy) & 1:
+                            cy += 1
+                        self._clip(px, y+s*scale, px+scale, y+cy*scale, fi)
+                    else:
+                        cy += 1
+            x += cw
+        self.invalidate(x0, y, x - x0, ch_h)
+        return x - x0
+
+    def _clip(self, x0, y0, x1, y1, i):
+        x0 = max(0, x0); y0 = max(0, y0)
+        x1 = min(self.width, x1); y1 = min(self.height, y1)
+        if x0 < x1 and y0 < y1:
+            self._rect(x0, y0, x1, y1, i)
+
+    # ── 전송: 합쳐진 사각형마다 set_window 1번, 줄들을 RGB565로 펼쳐서
+    def flush(self):
+        if not self.damage:
+            return 0
+        if not self._lut_ok:
+            self._build_lut()
+        rects = self._merge(self.damage)
+        self.damage = []
+        tft = self.tft; bus = tft.bus
+        st = self.stride
+        src = self._mv; lut = self._lut
+        sent = 0
+        for x0, y0, x1, y1 in rects:
+            x0 &= ~1; x1 += x1 & 1            # 바이트 경계로 넓힘(버퍼에 있는 그대로라 괜찮음)
+            w = x1-x0; h = y1-y0
+            n = w >> 1                        # 줄당 원본 바이트
+            rows = max(1, tft.TEXT_BUF // (w*2))
+            tmp = tft._text_buf(min(rows, h)*w*2)
+            tft.set_window(x0, y0, x1-1, y1-1)
+            bus.begin_data()
+            y = y0
+            while y < y1:
+                k = min(rows, y1-y)
+                d = 0
+                if n == st:
+                    expand(tmp, 0, src, y*st, k*n, lut)   # 전체 폭이면 여러 줄이 연속
+                else:
+                    o = y*st + (x0 >> 1)
+                    for _ in range(k):
+                        expand(tmp, d, src, o, n, lut)
+                        o += st; d += w*2
+                bus.write(memoryview(tmp)[:k*w*2])
+                y += k
+            bus.end()
+            sent += w*h*2
+        self.flushed_bytes += sent
+        self.flushed_rects += len(rects)
+        return sent
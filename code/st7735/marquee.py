@@ -0,0 +1,109 @@
+# ── 가로 전광판(marquee): 보이는 폭 + 글자 한 칸만큼의 RGB565 고리(ring)를 두고, 창 오른쪽으로
+# 새로 들어오는 글자만 그 자리에 찍음. 프레임은 고리에서 줄 단위 memoryview 복사로 잘라 전송
+# 가상 띠 = [빈칸 gap][문자열]을 period마다 반복. 위치 v의 열은 고리의 v % 고리 폭 칸에 있음
+# 메모리: (w + 6*scale) * h * 2 바이트(고리) + 글자 칸 하나. 문자열 길이와 무관
+from compat import ticks_ms, ticks_diff
+
+class Marquee:
+    # x, y, w, h: 화면 영역. speed: 초당 px(왼쪽으로). gap: 반복 사이 빈칸(기본 w: 화면 밖에서 들어옴)
+    def __init__(self, tft, x, y, w, h, text, color, bg, speed=200, gap=None, scale=1):
+        self.tft = tft
+        self.x = x; self.y = y; self.w = w; self.h = h
+        self.speed = speed
+        self.scale = scale
+        self.frames = 0
+        self.gap = w if gap is None else gap
+        self._cw = cw = 6*scale                 # 글자 칸 폭(고정폭)
+        self._rw = rw = w + cw                  # 고리 폭: 창 + 마지막 글자를 다 찍을 여유
+        self._stride = rw*2
+        self._ring = bytearray(self._stride*h)
+        self._rmv = memoryview(self._ring)
+        self._cell = bytearray(cw*h*2)          # 글자 하나를 찍는 칸(위아래 여백은 bg)
+        self._bgc = bytearray(cw*h*2)           # 빈칸용(bg만)
+        self._frame = bytearray(w*h*2)
+        self._fmv = memoryview(self._frame)
+        self.set_text(text, color, bg)
+
+    def set_text(self, text, color, bg):
+        # 글자/색만 바꾸고 고리는 비움(보일 때 다시 찍음)
+        self.period = self.gap + len(text)*self._cw     # 한 바퀴 길이(px)
+        hi = bg >> 8; lo = bg & 0xFF
+        for b in (self._cell, self._bgc):
+            for k in range(0, len(b), 2):
+                b[k] = hi; b[k+1] = lo
+        self.text = text; self.color = color; self.bg = bg
+        self._ty = max(0, (self.h - 7*self.scale) // 2)
+        self._glyph = -1                        # _cell에 찍혀 있는 글자 번호
+        self._lo = self._hi = 0                 # 고리에 [max(_lo, _hi - 고리 폭), _hi) 위치가 들어 있음
+        self._t0 = ticks_ms()
+        self.offset = -1
+
+    def _fill(self, end):
+        # 위치 _hi..end를 고리에 채움(글자 칸 단위로, 끝이 end를 조금 넘을 수 있음)
+        cw = self._cw; rw = self._rw; st = self._stride; gap = self.gap
+        ring = self._rmv; h = self.h
+        while self._hi < end:
+            v = self._hi; p = v % self.period
+            if p < gap:
+                src = self._bgc; c0 = 0; n = min(gap - p, cw)
+            else:
+                k, c0 = divmod(p - gap, cw); n = cw - c0
+                if k != self._glyph:
+                    s = self.scale
+                    if self._ty + 7*s <= h:
+                        self.tft.text_into(self._cell, cw*2, 0, self._ty, self.text[k], self.color, self.bg, s)
+                    self._glyph = k
+                src = self._cell
+            src = memoryview(src)
+            r = v % rw
+            a = min(n, rw - r)                  # 고리 끝에서 둘로 나뉨
+            o = r*2; so = c0*2; cs = cw*2
+            for _ in range(h):
+                ring[o:o+a*2] = src[so:so+a*2]
+                if a < n:
+                    ring[o-r*2:o-r*2+(n-a)*2] = src[so+a*2:so+n*2]
+                o += st; so += cs
+            self._hi = v + n
+
+    def frame(self, off, out=None):
+        # off(px) 위치의 w x h 프레임. out을 주면 거기에(이중 버퍼 등), 아니면 내부 버퍼에
+        # 직전 위치에서 앞으로 움직이면 새로 들어온 열만 찍음(멀리 뛰거나 뒤로 가면 처음부터)
+        w = self.w; rw = self._rw
+        if off > self._hi or off < max(self._lo, self._hi - rw):
+            self._lo = self._hi = off
+        self._fill(off + w)
+        f = self._fmv if out is None else out
+        s = self._rmv
+        st = self._stride; r = off % rw
+        a = min(w, rw - r)*2; b = w*2 - a
+        o = r*2; d = 0
+        for _ in range(self.h):
+            f[d:d+a] = s[o:o+a]
+            if b:
+                f[d+a:d+a+b] = s[o-r*2:o-r*2+b]
+            d += a + b; o += st
+        return f
+
+    def _pos(self, now):
+        if now is None: now = ticks_ms()
+        return ticks_diff(now, self._t0)*self.speed//1000
+
+    def position(self, now=None):
+        # 시간에 맞는 위치(px, 한 바퀴 안)
+        return self._pos(now) % self.period
+
+    def step(self, now=None, present=None):
+        # 시간에 맞는 위치로 이동. 위치가 바뀌어 전송했으면 True
+        # present: st7735.present.DoubleBuffer(크기 w x h)를 주면 그 back에 그리고 백그라운드 전송
+        u = self._pos(now)
+        off = u % self.period
+        if off == self.offset:
+            return False
+        self.offset = off
+        if present is None:
+            self.tft.write_window(self.x, self.y, self.w, self.h, self.frame(u))
+        else:
+            self.frame(u, present.back)
+            present.present(self.x, self.y)
+        self.frames += 1
+        return True
@@ -0,0 +1,91 @@
+# ── 이중 버퍼 프레젠터: 프레임 N을 보내는 동안 프레임 N+1을 그림
+# back에 그리고 present() → 전송은 백그라운드 스레드가 맡고 back은 바로 다른 버퍼로 바뀜
+# 프레임 시간 = max(그리기, 전송) (스레드가 없으면 그 자리에서 보내므로 합)
+# 주의: 전송 중에는 같은 버스를 쓰면 안 됨 → tft를 직접 쓰기 전에 wait()
+# 전송 중 난 예외는 다음 present()/wait()에서 다시 던짐(스레드 안에서 삼키지 않음)
+# 겹침은 PC의 가짜 SPI(realtime)로만 확인함. 단일 코어인 ESP32-C3에서는 spi.write가 전송하는 동안
+# GIL을 놓아야 그리기와 겹침 → 놓지 않는 펌웨어면 스레드 없이 보내는 것과 같음(프레임 시간 = 합).
+# 보드에서 bench.present처럼 threaded=True/False 프레임 시간을 비교해 보고, 차이가 없으면 threaded=False
+try:
+    import _thread
+except ImportError:
+    _thread = None
+
+class DoubleBuffer:
+    # w, h: 버퍼 크기(픽셀). x, y: 기본 전송 위치. threaded=None이면 _thread가 있을 때만 스레드 사용
+    def __init__(self, tft, w, h, x=0, y=0, threaded=None):
+        self.tft = tft
+        self.w = w; self.h = h; self.x = x; self.y = y
+        self._bufs = (bytearray(w*h*2), bytearray(w*h*2))
+        self._mvs = (memoryview(self._bufs[0]), memoryview(self._bufs[1]))
+        self._i = 0
+        self.frames = 0
+        if threaded is None:
+            threaded = _thread is not None
+        self.threaded = threaded
+        self._job = None
+        self._err = None              # 전송 스레드에서 난 예외(다음 present/wait에서 던짐)
+        self._stop = False
+        if threaded:
+            self._go = _thread.allocate_lock(); self._go.acquire()   # 보낼 프레임이 생기면 풀림
+            self._idle = _thread.allocate_lock()                     # 전송 중에는 잠김
+            self._dead = _thread.allocate_lock(); self._dead.acquire()
+            _thread.start_new_thread(self._worker, ())
+
+    @property
+    def back(self):
+        # 지금 그려야 할 버퍼(bytearray, RGB565 빅엔디언, w*h)
+        return self._bufs[self._i]
+
+    def _worker(self):
+        while True:
+            self._go.acquire()
+            if self._stop: break
+            x, y, w, h, mv = self._job
+            try:
+                self.tft.write_window(x, y, w, h, mv)
+            except Exception as e:
+                self._err = e
+            self._idle.release()
+        self._dead.release()
+
+    def present(self, x=None, y=None, w=None, h=None):
+        # back을 화면으로 보내고 버퍼를 바꿈. w, h를 주면 back 앞부분 w*h만 보냄
+        if x is None: x = self.x
+        if y is None: y = self.y
+        if w is None: w = self.w
+        if h is None: h = self.h
+        mv = self._mvs[self._i][:w*h*2]
+        if self.threaded:
+            self._idle.acquire()          # 직전 프레임 전송이 끝날 때까지(버스는 하나)
+            self._check()
+            self._job = (x, y, w, h, mv)
+            self._go.release()
+        else:
+            self.tft.write_window(x, y, w, h, mv)
+        self.frames += 1
+        self._i ^= 1
+
+    def _check(self):
+        # _idle을 잡은 상태에서: 직전 전송이 실패했으면 _idle을 풀고 그 예외를 던짐
+        e = self._err
+        if e is not None:
+            self._err = None
+            self._idle.release()
+            raise e
+
+    def wait(self):
+        # 보내는 중인 프레임이 끝날 때까지 대기(이후 tft를 직접 써도 됨). 전송이 실패했으면 그 예외
+        if self.threaded:
+            self._idle.acquire()
+            self._check()
+            self._idle.release()
+
+    def close(self):
+        if self.threaded and not self._stop:
+            try:
+                self.wait()
+            finally:
+                self._stop = True
+                self._go.release()
+                self._dead.acquire()
@@ -0,0 +1,179 @@
+# ── 프레임 시간 프로파일러(켤 때만): 메서드를 감싸서 호출 수와 시간(ticks_us)을 셈
+# - 꺼져 있으면 감싼 것이 없으므로 드라이버 비용 0. 루프에 넣는 frame()/sleep_ms()는 enabled만 보고 돌아감
+#   → 배포 코드에 그대로 둬도 됨
+# - enable(tft): 드라이버 메서드(DRIVER)와 spi.write를 감쌈. instrument(obj, 이름들)로 다른 객체도,
+#   wrap(fn)/wrap_async(fn)으로 함수(네트워크 호출 등)도
+# - 시간은 포함 시간(fill_color 안의 set_window/spi.write도 각자 또 셈). 프레임 분해의 "그리기"는
+#   가장 바깥 호출만 더함
+# - frame(): 루프 한 바퀴(또는 flush 한 번) 끝에 → (전체, 그리기, SPI, 대기, 네트워크) us를 링 버퍼에
+# - report(): 이름별 횟수/합/p50/p95/max + 최근 프레임 분해를 시리얼(REPL)로. every 프레임마다 자동으로도
+# 주의: wrap/wrap_async로 감싼 함수는 enable() 뒤에 만들 것(enable이 통계를 새로 시작)
+from array import array
+import compat          # 시간 함수는 부를 때마다 compat에서(시뮬레이터가 가상 시계로 바꿔 끼움)
+
+DRIVER = ("set_window", "write_window", "fill_color", "fill_rect", "draw_char", "draw_text")
+DRAW = 0; SPI = 1; NET = 2
+
+enabled = False
+_n = 64                 # 링 버퍼 길이(이름별 표본, 프레임)
+_every = 0
+_stats = {}             # 이름 → [종류, 횟수, 합 us, 표본 array, 다음 칸]
+_frames = None          # [전체, 그리기, SPI, 대기, 네트워크] 각각 array
+_fi = 0
+_nframes = 0
+_cur = [0, 0, 0, 0]     # 이번 프레임: 그리기, SPI, 대기, 네트워크
+_t0 = 0
+_depth = 0
+_saved = []             # disable 때 되돌릴 (객체, 이름, 원래 값 또는 None=인스턴스 속성 지움)
+
+def _stat(name, kind):
+    st = _stats.get(name)
+    if st is None:
+        st = _stats[name] = [kind, 0, 0, array("I", bytes(4*_n)), 0]
+    return st
+
+def _add(st, us):
+    st[1] += 1; st[2] += us
+    st[3][st[4] % _n] = us; st[4] += 1
+    kind = st[0]
+    if kind == SPI:
+        _cur[1] += us
+    elif kind == NET:
+        _cur[3] += us
+    elif _depth == 0:
+        _cur[0] += us
+
+def wrap(fn, name, kind=DRAW):
+    # fn을 감싼 함수(시간을 name으로 셈)
+    st = _stat(name, kind)
+    def w(*a, **k):
+        global _depth
+        t = compat.ticks_us()
+        _depth += 1
+        try:
+            return fn(*a, **k)
+        finally:
+            _depth -= 1
+            _add(st, compat.ticks_diff(compat.ticks_us(), t))
+    return w
+
+def wrap_async(fn, name, kind=NET):
+    # 코루틴 함수용. 기다린 시간(다른 작업이 돈 시간 포함)을 셈
+    st = _stat(name, kind)
+    async def w(*a, **k):
+        t = compat.ticks_us()
+        try:
+            return await fn(*a, **k)
+        finally:
+            _add(st, compat.ticks_diff(compat.ticks_us(), t))
+    return w
+
+class _SPI:
+    # machine.SPI에는 속성을 못 붙이므로 write만 감싼 대리 객체
+    def __init__(self, spi):
+        self._spi = spi
+        self.write = wrap(spi.write, "spi.write", SPI)
+
+    def __getattr__(self, k):
+        return getattr(self._spi, k)
+
+def instrument(obj, names, kind=DRAW, prefix=""):
+    # obj의 메서드들을 감쌈(인스턴스 속성으로 덮음 → disable에서 지우면 원래대로)
+    for k in names:
+        f = getattr(obj, k, None)
+        if f is None:
+            continue
+        _saved.append((obj, k, obj.__dict__.get(k) if hasattr(obj, "__dict__") else None))
+        setattr(obj, k, wrap(f, prefix + k, kind))
+
+def enable(tft=None, frames=64, every=0, names=DRIVER):
+    # 켜고(통계 초기화) tft가 있으면 드라이버와 SPI를 감쌈. every: 그 프레임마다 report()
+    global enabled, _n, _every, _frames, _fi, _nframes, _t0
+    disable()
+    _n = frames; _every = every
+    _stats.clear()
+    _frames = [array("I", bytes(4*frames)) for _ in range(5)]
+    _fi = 0; _nframes = 0
+    _cur[0] = _cur[1] = _cur[2] = _cur[3] = 0
+    if tft is not None:
+        instrument(tft, names)
+        bus = tft.bus
+        spi = _SPI(bus.spi)
+        _saved.append((bus, "spi", bus.spi)); _saved.append((tft, "spi", tft.spi))
+        bus.spi = spi; tft.spi = spi
+    enabled = True
+    _t0 = compat.ticks_us()
+
+def disable():
+    # 감싼 것을 모두 되돌림(통계는 남김)
+    global enabled
+    enabled = False
+    while _saved:
+        obj, k, v = _saved.pop()
+        if v is None:
+            delattr(obj, k)
+        else:
+            setattr(obj, k, v)
+
+def sleep_ms(ms):
+    # time.sleep_ms 대신: 켜져 있으면 프레임의 "대기"로 셈
+    if not enabled:
+        return compat.sleep_ms(ms)
+    t = compat.ticks_us()
+    compat.sleep_ms(ms)
+    _cur[2] += compat.ticks_diff(compat.ticks_us(), t)
+
+def frame():
+    # 프레임 하나 끝: 지난 frame() 이후 시간을 나눠서 기록
+    global _fi, _nframes, _t0
+    if not enabled:
+        return
+    now = compat.ticks_us()
+    i = _fi % _n
+    f = _frames
+    f[0][i] = compat.ticks_diff(now, _t0)
+    f[1][i] = _cur[0]; f[2][i] = _cur[1]; f[3][i] = _cur[2]; f[4][i] = _cur[3]
+    _cur[0] = _cur[1] = _cur[2] = _cur[3] = 0
+    _fi += 1; _nframes += 1
+    _t0 = now
+    if _every and _nframes % _every == 0:
+        report()
+
+def _pct(xs):
+    # (p50, p95, max)
+    if not xs:
+        return (0, 0, 0)
+    xs = sorted(xs)
+    n = len(xs)
+    return (xs[(n-1)//2], xs[min(n-1, (n*95 + 99)//100 - 1)], xs[-1])
+
+def _recent(a, count):
+    return list(a[:min(count, _n)])
+
+def summary():
+    # {"calls": {이름: {...}}, "frames": {...}} (최근 _n개 표본 기준 p50/p95/max, us)
+    calls = {}
+    for name, st in _stats.items():
+        p50, p95, mx = _pct(_recent(st[3], st[4]))
+        calls[name] = {"n": st[1], "total_us": st[2], "p50": p50, "p95": p95, "max": mx}
+    frames = {"n": _nframes}
+    if _frames is not None:
+        for k, a in zip(("wall", "draw", "spi", "sleep", "net"), _frames):
+            frames[k] = _pct(_recent(a, _nframes))
+    return {"calls": calls, "frames": frames}
+
+def report():
+    s = summary()
+    print("{:<14} {:>7} {:>9} {:>7} {:>7} {:>7}".format("us", "calls", "total ms", "p50", "p95", "max"))
+    for name in sorted(s["calls"]):
+        c = s["calls"][name]
+        if not c["n"]:
+            continue
+        print("{:<14} {:>7} {:>9.1f} {:>7} {:>7} {:>7}".format(
+            name, c["n"], c["total_us"]/1000, c["p50"], c["p95"], c["max"]))
+    f = s["frames"]
+    if f["n"]:
+        print("frames {} (최근 {}): p50/p95/max us".format(f["n"], min(f["n"], _n)))
+        for k in ("wall", "draw", "spi", "sleep", "net"):
+            print("  {:<6} {:>7} {:>7} {:>7}".format(k, *f[k]))
+    return s
@@ -0,0 +1,67 @@
+# ── 하드웨어 스크롤(VSCRDEF/VSCRSADD)
+# 패널이 표시 시작 줄만 바꿔서 보여 주므로, 한 스텝마다 새로 드러나는 줄만 보내면 됨
+# 스크롤 축은 GRAM의 "줄" 방향: 회전 0/2는 화면 세로, 1/3(MV)은 화면 가로
+# (가로 회전에서는 화면 전체 높이의 세로 띠들이 함께 움직임)
+import struct
+from compat import const
+from .driver import MY, MV
+
+VSCRDEF  = const(0x33)
+VSCRSADD = const(0x37)
+NORON    = const(0x13)
+GRAM_ROWS = 162        # ST7735S GRAM 줄 수(화면에 보이는 건 160)
+
+class HwScroll:
+    # start/size: 스크롤 영역(화면 좌표, 스크롤 축 방향). 나머지 줄은 고정
+    def __init__(self, tft, start=0, size=None):
+        self.tft = tft
+        mad = tft._mad
+        self.horizontal = bool(mad & MV)
+        n = tft.width if self.horizontal else tft.height
+        if size is None:
+            size = n - start
+        off = tft.x_offset if self.horizontal else tft.y_offset
+        self.reverse = bool(mad & MY)    # MY면 GRAM 줄 순서가 화면과 반대
+        self._off = off
+        self.start = start; self.size = size
+        self.tfa = (GRAM_ROWS - off - start - size) if self.reverse else (off + start)
+        self.bfa = GRAM_ROWS - self.tfa - size
+        self.pos = 0
+        self.steps = 0
+        self._arg = bytearray(2)
+        tft._cmd_args(VSCRDEF, struct.pack(">HHH", self.tfa, size, self.bfa))
+        self._set()
+
+    def _set(self):
+        struct.pack_into(">H", self._arg, 0, self.tfa + self.pos)
+        self.tft._cmd_args(VSCRSADD, self._arg)
+
+    def _screen(self, p):
+        # GRAM 물리 줄 → 화면 좌표(스크롤 축)
+        return (GRAM_ROWS - 1 - self._off - p) if self.reverse else (p - self._off)
+
+    def scroll(self, n=1):
+        # 내용을 n줄 밀고, 새 내용을 그려야 할 화면 좌표들을 (드러나는 순서대로) 돌려줌
+        # 돌려준 좌표는 스크롤과 무관하게 평소처럼 set_window로 쓰면 됨
+        lines = []
+        for k in range(n):
+            p = self.tfa + (self.pos + k) % self.size
+            lines.append(self._screen(p))
+        self.pos = (self.pos + n) % self.size
+        self._set()
+        self.steps += 1
+        return lines
+
+    def write_line(self, line, buf):
+        # 새로 드러난 한 줄(스크롤 축에 수직인 한 줄 전체)을 전송
+        tft = self.tft
+        if self.horizontal:
+            tft.write_window(line, 0, 1, tft.height, buf)
+        else:
+            tft.write_window(0, line, tft.width, 1, buf)
+
+    def stop(self):
+        # 스크롤 해제(일반 표시 모드로)
+        self.pos = 0
+        self._set()
+        self.tft._cmd(NORON)
@@ -0,0 +1,469 @@
+# ── PC(CPython)용 패널 시뮬레이터: 버스로 나간 명령/데이터를 ST7735S GRAM(132x162)에 풀어서 화면 재현
+# - CASET/PASET/RAMWR(창 쓰기), MADCTL(MV/MX/MY/BGR), INVON/INVOFF, VSCRDEF/VSCRSADD/NORON(하드웨어 스크롤)
+# - 읽기 응답: RDDID(ID 3바이트, 앞에 더미 1비트), RAMRD(창 안 픽셀, 앞에 더미 1바이트, 픽셀당 3바이트)
+# - 유리에 보이는 곳: GRAM 열 26~105, 줄 1~160(드라이버 오프셋과 같은 자리)
+# - 그림 방향은 유리 기준: MV가 꺼져 있으면 세로 80x160(회전 0처럼 놓고 봄), 켜져 있으면 가로 160x80(회전 1처럼)
+#   → 회전 2/3이나 맞지 않는 mirror_x로 뒤집힌 건 뒤집힌 그대로 보임(보드에서 보이는 것과 같게)
+# - Recorder를 그대로 대신함: host_display(recorder=PanelSim()) 또는 keep=True로 모은 log를 replay()
+# - run_script(): 가짜 machine 모듈로 tft_*.py를 그대로 돌리며 프레임(PNG)과 프레임별 SPI 시간을 남김
+#   python3 -m st7735.sim tft_colorlane.py tft_fastscroll.py tft_weather.py --out sim_out --baud 20000000
+import struct, time, zlib
+from .host import Recorder, HostPin
+from .driver import (SWRESET, CASET, PASET, RAMWR, RAMRD, RDDID, MADCTL, INVON, INVOFF, DISPON,
+                     MY, MX, MV, BGR)
+from .scroll import VSCRDEF, VSCRSADD, NORON, GRAM_ROWS
+
+DISPOFF = 0x28
+GRAM_COLS = 132
+VIS_X0 = 26; VIS_Y0 = 1         # 유리에 보이는 GRAM 영역 시작(열, 줄)
+VIS_W = 80; VIS_H = 160
+_ARGS = {CASET: 4, PASET: 4, MADCTL: 1, VSCRDEF: 6, VSCRSADD: 2}   # 인자 바이트 수
+PANEL_ID = b"\x7c\x89\xf0"      # ST7735S RDDID
+
+def write_png(path, w, h, rgb):
+    # 8비트 RGB, 필터 없음
+    def chunk(tag, data):
+        return (struct.pack(">I", len(data)) + tag + data +
+                struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF))
+    raw = bytearray()
+    for y in range(h):
+        raw.append(0); raw += rgb[y*w*3:(y+1)*w*3]
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 2, 0, 0, 0)))
+        f.write(chunk(b"IDAT", zlib.compress(bytes(raw), 6)))
+        f.write(chunk(b"IEND", b""))
+
+class PanelSim(Recorder):
+    # baudrate: 프레임별 SPI 시간 계산용
+    # glass_inverted: 유리가 색을 반전해서 보여 주는 모듈(INVON을 켜야 제 색, 이 보드들 기본)
+    # glass_bgr: 유리가 BGR 순서(MADCTL BGR을 켜야 제 색)
+    # glass_mirror: 유리의 열 방향이 드라이버 기본과 반대인 모듈(mirror_x=True라야 바로 보임,
+    #               tft_weather/tft_fastscroll 설정과 같은 기본값)
+    # out: PNG를 남길 폴더(None이면 기록만), every: n 프레임마다 한 장
+    def __init__(self, baudrate=40_000_000, glass_inverted=True, glass_bgr=True, glass_mirror=True,
+                 out=None, prefix="f", every=1, keep=False):
+        self.baudrate = baudrate
+        self.glass_inverted = glass_inverted
+        self.glass_bgr = glass_bgr
+        self.glass_mirror = glass_mirror
+        self.out = out; self.prefix = prefix; self.every = every
+        self.gram = bytearray(GRAM_COLS*GRAM_ROWS*2)
+        self.frames = []
+        self._power_on()
+        Recorder.__init__(self, keep)
+
+    def _power_on(self):
+        self.mad = 0
+        self.inverted = False
+        self.on = False
+        self._vs = (0, GRAM_ROWS)      # 스크롤 영역(TFA, VSA)
+        self._ssa = None               # 스크롤 시작 줄(None이면 보통 표시)
+        self._win = [0, GRAM_COLS-1, 0, GRAM_ROWS-1]
+        self._cmd = None; self._args = bytearray()
+        self._x = self._y = 0; self._half = None
+
+    def reset(self):
+        # 카운터만 지움(GRAM/패널 상태는 그대로: host_display가 초기화 뒤 부름)
+        Recorder.reset(self)
+        self._fb = 0; self._ft = 0
+
+    # ── 스트림 풀기
+    def write(self, dc, buf):
+        Recorder.write(self, dc, buf)
+        self.feed(dc, buf)
+
+    def feed(self, dc, buf):
+        if not dc:
+            for c in bytes(buf):
+                self._command(c)
+            return
+        if self._cmd == RAMWR:
+            self._pixels(bytes(buf))
+            return
+        need = _ARGS.get(self._cmd)
+        if need is None or len(self._args) >= need:
+            return
+        self._args += buf
+        if len(self._args) >= need:
+            self._apply(self._cmd, bytes(self._args[:need]))
+
+    def _command(self, c):
+        self._cmd = c; self._args = bytearray()
+        if c == RAMWR or c == RAMRD:
+            w = self._win
+            self._x = w[0]; self._y = w[2]; self._half = None
+            self._rd = 0                 # 읽기: 지금까지 내보낸 바이트(처음 1바이트는 더미)
+        elif c == SWRESET:
+            self._power_on(); self._cmd = c
+        elif c == INVON: self.inverted = True
+        elif c == INVOFF: self.inverted = False
+        elif c == DISPON: self.on = True
+        elif c == DISPOFF: self.on = False
+        elif c == NORON: self._ssa = None
+
+    def _apply(self, c, a):
+        if c == CASET:
+            self._win[0], self._win[1] = struct.unpack(">HH", a)
+        elif c == PASET:
+            self._win[2], self._win[3] = struct.unpack(">HH", a)
+        elif c == MADCTL:
+            self.mad = a[0]
+        elif c == VSCRDEF:
+            tfa, vsa, _ = struct.unpack(">HHH", a)
+            self._vs = (tfa, vsa)
+        elif c == VSCRSADD:
+            self._ssa = struct.unpack(">H", a)[0]
+
+    def _phys(self, x, y):
+        # 창 주소(MADCTL 적용 전) → GRAM 바이트 위치, 밖이면 None
+        mad = self.mad
+        if mad & MV: x, y = y, x
+        if mad & MX: x = GRAM_COLS-1 - x
+        if mad & MY: y = GRAM_ROWS-1 - y
+        if 0 <= x < GRAM_COLS and 0 <= y < GRAM_ROWS:
+            return (y*GRAM_COLS + x)*2
+        return None
+
+    def read(self, n):
+        # MISO로 나가는 n바이트(지금 명령에 대한 응답)
+        Recorder.read(self, n)
+        if self._cmd == RDDID:
+            v = int.from_bytes(PANEL_ID, "big") << max(0, n*8 - 1 - 24)
+            return (v & ((1 << n*8) - 1)).to_bytes(n, "big")
+        out = bytearray(n)
+        if self._cmd != RAMRD:
+            return bytes(out)
+        g = self.gram
+        xs, xe, ys, ye = self._win
+        i = 0
+        if self._rd == 0:
+            i = 1; self._rd = 1          # 더미
+        while i < n:
+            o = self._phys(self._x, self._y)
+            p = 0 if o is None else (g[o] << 8) | g[o+1]
+            r = p >> 11; gg = (p >> 5) & 0x3F; b = p & 0x1F
+            for v in (((r << 1) | (r >> 4)) << 2, gg << 2, ((b << 1) | (b >> 4)) << 2):
+                if i < n: out[i] = v; i += 1
+            self._x += 1
+            if self._x > xe:
+                self._x = xs; self._y += 1
+                if self._y > ye: self._y = ys
+        return bytes(out)
+
+    def _pixels(self, buf):
+        i = 0; n = len(buf)
+        if self._half is not None and n:
+            buf = bytes((self._half,)) + buf; n += 1
+            self._half = None
+        g = self.gram
+        xs, xe, ys, ye = self._win
+        x = self._x; y = self._y
+        mad = self.mad
+        mv = mad & MV; mx = mad & MX; my = mad & MY
+        while i + 1 < n:
+            if mv: c = y; r = x
+            else: c = x; r = y
+            if mx: c = GRAM_COLS-1 - c
+            if my: r = GRAM_ROWS-1 - r
+            if 0 <= c < GRAM_COLS and 0 <= r < GRAM_ROWS:
+                o = (r*GRAM_COLS + c)*2
+                g[o] = buf[i]; g[o+1] = buf[i+1]
+            i += 2
+            x += 1
+            if x > xe:
+                x = xs; y += 1
+                if y > ye: y = ys
+        self._x = x; self._y = y
+        if i < n:
+            self._half = buf[i]
+
+    # ── 보이는 화면
+    def _scan(self, r):
+        # 표시 줄 r에 실제로 나오는 GRAM 줄(하드웨어 스크롤 반영)
+        if self._ssa is None:
+            return r
+        tfa, vsa = self._vs
+        if tfa <= r < tfa + vsa:
+            return tfa + (r - tfa + self._ssa - tfa) % vsa
+        return r
+
+    @property
+    def landscape(self):
+        return bool(self.mad & MV)
+
+    def image(self):
+        # (w, h, 유리에 보이는 색 RGB565 빅엔디안 버퍼). 반전/BGR은 유리 설정과 비교해서 반영
+        land = self.landscape
+        w, h = (VIS_H, VIS_W) if land else (VIS_W, VIS_H)
+        out = bytearray(w*h*2)
+        if not self.on:
+            return w, h, out
+        g = self.gram
+        inv = 0xFFFF if self.inverted != self.glass_inverted else 0
+        swap = bool(self.mad & BGR) != self.glass_bgr
+        x0, dx = (VIS_X0, 1) if self.glass_mirror else (VIS_X0 + VIS_W-1, -1)
+        for gy in range(VIS_H):
+            row = self._scan(gy + VIS_Y0)*GRAM_COLS + x0
+            for gx in range(VIS_W):
+                o = (row + dx*gx)*2
+                p = ((g[o] << 8) | g[o+1]) ^ inv
+                if swap:
+                    p = ((p & 0x1F) << 11) | (p & 0x07E0) | (p >> 11)
+                k = ((VIS_W-1 - gx)*w + gy)*2 if land else (gy*w + gx)*2
+                out[k] = p >> 8; out[k+1] = p & 0xFF
+        return w, h, out
+
+    def pixel(self, x, y, img=None):
+        # 그림 좌표(x, y)에 보이는 RGB565
+        w, h, buf = img or self.image()
+        k = (y*w + x)*2
+        return (buf[k] << 8) | buf[k+1]
+
+    def rgb(self, img=None):
+        w, h, buf = img or self.image()
+        out = bytearray(w*h*3)
+        for i in range(w*h):
+            p = (buf[2*i] << 8) | buf[2*i+1]
+            out[3*i] = (p >> 11)*255//31
+            out[3*i+1] = ((p >> 5) & 0x3F)*255//63
+            out[3*i+2] = (p & 0x1F)*255//31
+        return w, h, out
+
+    def save_png(self, path):
+        w, h, px = self.rgb()
+        write_png(path, w, h, px)
+
+    # ── 프레임: 직전 프레임 이후 보낸 양과 그 전송에 걸리는 시간(baudrate 기준)
+    def frame(self, t_ms=None, force=False):
+        b = self.bytes - self._fb; tx = self.transactions - self._ft
+        if not b and not force:
+            return None
+        self._fb = self.bytes; self._ft = self.transactions
+        n = len(self.frames)
+        f = {"n": n, "t_ms": t_ms, "bytes": b, "tx": tx,
+             "spi_ms": b*8000/self.baudrate, "png": None}
+        if self.out is not None and n % self.every == 0:
+            f["png"] = "{}/{}{:04d}.png".format(self.out, self.prefix, n)
+            self.save_png(f["png"])
+        self.frames.append(f)
+        return f
+
+    def write_timing(self, path):
+        with open(path, "w") as fp:
+            fp.write("n,t_ms,bytes,tx,spi_ms,png\n")
+            for f in self.frames:
+                fp.write("{},{},{},{},{:.3f},{}\n".format(
+                    f["n"], "" if f["t_ms"] is None else "{:.1f}".format(f["t_ms"]),
+                    f["bytes"], f["tx"], f["spi_ms"], f["png"] or ""))
+
+def replay(log, sim=None):
+    # Recorder(keep=True).log → PanelSim
+    sim = sim or PanelSim()
+    for dc, b in log:
+        sim.feed(dc, b)
+    return sim
+
+# ── 스크립트 실행기: 가짜 machine/urandom/network/ntptime으로 tft_*.py를 그대로 돌림
+# 시계는 가상: 실제 경과 + sleep_ms로 건너뛴 시간 + SPI 전송 시간(sleep은 실제로 자지 않음)
+#   시뮬레이터 자신이 쓴 시간(GRAM 풀기, PNG 저장)은 빼서 스크립트 계산 시간만 남김
+# 프레임은 스크립트가 쉴 때(time.sleep_ms, asyncio 대기)마다 하나(그 사이에 보낸 게 있을 때만)
+class _Stop(KeyboardInterrupt):
+    # max_ms가 지나면 다음 time.sleep_ms에서 던짐(보드에서 Ctrl-C를 누른 것처럼 끝남)
+    pass
+
+class _Clock:
+    def __init__(self):
+        self.start(None)
+
+    def start(self, limit_ms):
+        self.t0 = time.monotonic(); self.skip = 0.0
+        self.limit = limit_ms; self.stopped = False
+
+    def ms(self):
+        return (time.monotonic() - self.t0)*1000 + self.skip
+
+    def ticks_ms(self): return int(self.ms())
+    def ticks_us(self): return int(self.ms()*1000)
+
+    def own(self, t0):
+        # t0(monotonic)부터 지금까지는 시뮬레이터 몫 → 시계에서 뺌
+        self.skip -= (time.monotonic() - t0)*1000
+
+    def check(self):
+        if not self.stopped and self.limit is not None and self.ms() >= self.limit:
+            self.stopped = True
+            raise _Stop()
+
+class _SimSPI:
+    # top: run_script에 준 속도 = 이 배선의 한계. 그 위로 바꾸려면 ValueError(calibrate는 건너뜀)
+    def __init__(self, sim, clock, pins, dc_pin, baudrate, top=None):
+        self.sim = sim; self.clock = clock
+        self._pins = pins; self._dc = dc_pin
+        self.top = top
+        self.baudrate = top or baudrate
+        sim.baudrate = self.baudrate
+
+    def init(self, baudrate=None, **kw):
+        if baudrate:
+            if self.top and baudrate > self.top:
+                raise ValueError("baudrate")
+            self.baudrate = self.sim.baudrate = baudrate
+
+    def write(self, buf):
+        t0 = time.monotonic()
+        dc = self._pins.get(self._dc)
+        self.sim.write(dc.value() if dc is not None else 1, buf)
+        self.clock.own(t0)
+        self.clock.skip += len(buf)*8000/self.baudrate
+
+    def read(self, n, out=0):
+        self.clock.skip += n*8000/self.baudrate
+        return self.sim.read(n)
+
+    def deinit(self):
+        pass
+
+def _fake_modules(sim, clock, cs, dc, rst, seed):
+    import random, types
+    from nethost import FakeWLAN
+    pins = {}
+    names = {cs: "cs", dc: "dc", rst: "rst"}
+    machine = types.ModuleType("machine")
+    class Pin(HostPin):
+        def __init__(self, n, mode=HostPin.OUT, value=0, **kw):
+            HostPin.__init__(self, names.get(n, "p{}".format(n)), mode, value or 0, sim)
+            pins[n] = self
+    machine.Pin = Pin
+    class RTC:
+        def datetime(self, *a): pass
+    machine.RTC = RTC
+    top = sim.baudrate
+    machine.SPI = lambda id, baudrate=40_000_000, **kw: _SimSPI(sim, clock, pins, dc, baudrate, top)
+    rnd = random.Random(seed)
+    urandom = types.ModuleType("urandom")
+    urandom.getrandbits = rnd.getrandbits
+    urandom.randint = rnd.randint
+    network = types.ModuleType("network")
+    network.STA_IF = 0; network.AP_IF = 1
+    network.WLAN = lambda iface=0: FakeWLAN(time_scale=0.05)
+    ntptime = types.ModuleType("ntptime")
+    ntptime.host = "pool.ntp.org"
+    ntptime.settime = lambda: None
+    return {"machine": machine, "urandom": urandom, "network": network, "ntptime": ntptime}
+
+def run_script(path, out=None, baudrate=None, max_ms=15_000, every=10,
+               cs=5, dc=1, rst=0, seed=1, **kw):
+    # path의 스크립트를 돌려 PanelSim을 돌려줌. baudrate=None이면 스크립트가 SPI에 준 값
+    # 날씨 요청(api.openweathermap.org)은 nethost.OWMServer(로컬, 고정 응답)로,
+    # NTP(ntp.HOST)는 nethost.NTPServer로 돌림
+    # 스크립트가 쓰는 파일(spi.bin, weather.bin ...)은 out 폴더에, out이 없으면 임시 폴더에
+    import os, sys, tempfile
+    import compat
+    import owm, ntp
+    from nethost import OWMServer, NTPServer
+    from . import present
+    path = os.path.abspath(path)
+    name = os.path.splitext(os.path.basename(path))[0]
+    if out is not None:
+        out = os.path.abspath(os.path.join(out, name))
+        os.makedirs(out, exist_ok=True)
+    sim = PanelSim(baudrate, out=out, prefix="", every=every, **kw)
+    clock = _Clock()
+    asyncio = compat.asyncio
+
+    def frame():
+        t0 = time.monotonic()
+        sim.frame(clock.ms())
+        clock.own(t0)
+    def sleep_ms(ms):
+        frame()
+        clock.check()
+        clock.skip += ms
+    orig_sleep = asyncio.sleep
+    async def sleep(s, *a, **k):
+        frame()
+        if not clock.stopped and clock.limit is not None and clock.ms() >= clock.limit:
+            # asyncio 스크립트: 작업을 모두 취소해서 asyncio.run을 끝냄
+            clock.stopped = True
+            for t in asyncio.all_tasks():
+                t.cancel()
+        return await orig_sleep(s, *a, **k)
+    orig_open = asyncio.open_connection
+    srv = OWMServer()
+    async def open_connection(host=None, port=None, *a, **k):
+        if host == owm.HOST:
+            host, port = "127.0.0.1", srv.port
+        return await orig_open(host, port, *a, **k)
+    nsrv = NTPServer()
+    orig_resolve = ntp._resolve
+    def resolve(host, port):
+        return ("127.0.0.1", nsrv.port) if host == ntp.HOST else orig_resolve(host, port)
+
+    patches = [(time, "ticks_ms", clock.ticks_ms), (time, "ticks_us", clock.ticks_us),
+               (time, "ticks_diff", lambda a, b: a - b), (time, "ticks_add", lambda a, b: a + b),
+               (time, "sleep_ms", sleep_ms), (time, "sleep_us", lambda us: sleep_ms(us/1000)),
+               (compat, "ticks_ms", clock.ticks_ms), (compat, "ticks_us", clock.ticks_us),
+               (compat, "sleep_ms", sleep_ms),
+               (asyncio, "sleep", sleep), (asyncio, "sleep_ms", lambda ms: sleep(ms/1000)),
+               (asyncio, "open_connection", open_connection), (ntp, "_resolve", resolve),
+               (present, "_thread", None)]        # 프레임을 잡을 때 전송이 끝나 있도록 스레드 없이
+    saved = [(o, k, getattr(o, k, _Stop)) for o, k, _ in patches]
+    mods = _fake_modules(sim, clock, cs, dc, rst, seed)
+    saved_mods = {k: sys.modules.get(k) for k in mods}
+    cwd = os.getcwd()
+    tmp = tempfile.TemporaryDirectory() if out is None else None
+    sys.path.insert(0, os.path.dirname(path))
+    try:
+        for o, k, v in patches:
+            setattr(o, k, v)
+        sys.modules.update(mods)
+        os.chdir(out if out is not None else tmp.name)
+        clock.start(max_ms)
+        with open(path) as f:
+            src = f.read()
+        try:
+            exec(compile(src, path, "exec"), {"__name__": "__main__", "__file__": path})
+        except (_Stop, asyncio.CancelledError):
+            pass
+        sim.frame(clock.ms())
+    finally:
+        os.chdir(cwd)
+        if tmp is not None:
+            tmp.cleanup()
+        sys.path.remove(os.path.dirname(path))
+        for o, k, v in saved:
+            if v is _Stop: delattr(o, k)
+            else: setattr(o, k, v)
+        for k, m in saved_mods.items():
+            if m is None: sys.modules.pop(k, None)
+            else: sys.modules[k] = m
+        srv.close(); nsrv.close()
+    if out is not None:
+        sim.save_png(out + "/last.png")
+        sim.write_timing(out + "/timing.csv")
+    return sim
+
+def summary(sim):
+    fs = sim.frames
+    if not fs:
+        return {"frames": 0}
+    ms = sorted(f["spi_ms"] for f in fs)
+    return {"frames": len(fs), "bytes": sum(f["bytes"] for f in fs),
+            "tx": sum(f["tx"] for f in fs), "baudrate": sim.baudrate,
+            "spi_ms_p50": ms[len(ms)//2], "spi_ms_max": ms[-1]}
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="tft_*.py를 PC에서 돌려 PNG 프레임과 SPI 시간 기록")
+    ap.add_argument("scripts", nargs="+")
+    ap.add_argument("--out", default="sim_out")
+    ap.add_argument("--baud", type=int, default=None, help="기본: 스크립트가 SPI에 준 값")
+    ap.add_argument("--ms", type=int, default=15_000, help="가상 시간 상한(ms)")
+    ap.add_argument("--every", type=int, default=10, help="n 프레임마다 PNG 한 장")
+    a = ap.parse_args()
+    for p in a.scripts:
+        s = summary(run_script(p, a.out, a.baud, a.ms, a.every))
+        print("{:<18} frames {:>5}  bytes {:>9}  tx {:>6}  @{} Hz  SPI/frame p50 {:.3f} ms  max {:.3f} ms".format(
+            p, s["frames"], s.get("bytes", 0), s.get("tx", 0), s.get("baudrate"),
+            s.get("spi_ms_p50", 0), s.get("spi_ms_max", 0)))
@@ -0,0 +1,179 @@
+# ── 스프라이트 레이어: 단색 배경 위에서 움직이는 여러 물체를 최소 영역만 다시 보냄
+# - 스프라이트는 모양(줄마다 불투명 구간 목록)과 미리 그린 RGB565 그림을 가짐
+# - 움직이면 이전/현재 위치를 덮는 상자 하나(겹칠 때) 또는 두 개(멀리 뛸 때)만 전송
+#   → 상자 = 새 그림 + 드러난 배경 띠(이전 - 현재). 대각 이동이면 모서리 |dx|*|dy| 두 칸만 더 보냄
+# - 상자 안에 걸친 다른 스프라이트도 z 순서대로 같이 그려서, 서로 겹쳐도 깨지지 않음
+def circle_runs(r):
+    # 지름 2r 원: 줄마다 [(x0, x1)] (x1 미포함)
+    runs = []
+    rr = r*r
+    for y in range(2*r):
+        dy = y - r + 0.5
+        k = 0
+        while (k + 0.5)*(k + 0.5) + dy*dy <= rr:
+            k += 1
+        runs.append([(r-k, r+k)] if k else [])
+    return runs
+
+def mask_runs(rows, on="#"):
+    # 문자열 줄 목록("..##..") → 줄마다 불투명 구간
+    runs = []
+    for row in rows:
+        rr = []; x0 = None
+        for x, c in enumerate(row + " "):
+            if c == on and x0 is None: x0 = x
+            elif c != on and x0 is not None: rr.append((x0, x)); x0 = None
+        runs.append(rr)
+    return runs
+
+def _area(r):
+    return (r[2]-r[0])*(r[3]-r[1])
+
+class Sprite:
+    # runs: 줄마다 불투명 구간, color: 단색. pixels를 주면(RGB565 w*h, 전송 순서) 그 그림을 씀
+    def __init__(self, w, h, runs, color=0xFFFF, pixels=None, x=0, y=0):
+        self.w = w; self.h = h
+        self.runs = runs
+        self.x = x; self.y = y
+        self.visible = True
+        if pixels is None:
+            pixels = bytes(((color >> 8) & 0xFF, color & 0xFF)) * (w*h)
+        self.pixels = memoryview(pixels)
+        self.image = None       # 배경을 합쳐 미리 그린 그림(혼자 있을 때 그대로 전송)
+        self.drawn = None       # 화면에 마지막으로 그린 사각형 [x0, y0, x1, y1]
+        self.dirty = True
+
+    @classmethod
+    def circle(cls, r, color, **kw):
+        return cls(2*r, 2*r, circle_runs(r), color, **kw)
+
+    @classmethod
+    def rect(cls, w, h, color, **kw):
+        return cls(w, h, [[(0, w)]]*h, color, **kw)
+
+    @classmethod
+    def from_rows(cls, rows, color, **kw):
+        return cls(max(len(r) for r in rows), len(rows), mask_runs(rows), color, **kw)
+
+    def move_to(self, x, y):
+        if x != self.x or y != self.y:
+            self.x = x; self.y = y; self.dirty = True
+
+    def show(self, on=True):
+        if on != self.visible:
+            self.visible = on; self.dirty = True
+
+    def set_color(self, color):
+        # 단색 스프라이트 색 바꾸기(그림을 다시 만듦)
+        self.pixels = memoryview(bytes(((color >> 8) & 0xFF, color & 0xFF)) * (self.w*self.h))
+        self.image = None; self.dirty = True
+
+    def _bake(self, bg):
+        # 투명한 곳을 배경색으로 채운 그림
+        img = bytearray(bytes(((bg >> 8) & 0xFF, bg & 0xFF)) * (self.w*self.h))
+        self._copy(img, self.w, self.h, self.x, self.y)
+        self.image = img
+
+    def _copy(self, dst, dw, dh, ox, oy):
+        # dst: 화면 (ox, oy)부터 dw x dh 영역을 담은 버퍼. 겹치는 불투명 구간만 복사
+        sx = self.x - ox; sy = self.y - oy
+        src = self.pixels; w2 = self.w*2
+        for yy in range(max(0, sy), min(dh, sy+self.h)):
+            r = yy - sy
+            d = yy*dw*2; s = r*w2
+            for a, b in self.runs[r]:
+                a = max(a + sx, 0); b = min(b + sx, dw)
+                if a < b:
+                    dst[d+a*2:d+b*2] = src[s+(a-sx)*2:s+(b-sx)*2]
+
+class SpriteLayer:
+    # 배경색 bg로 칠해진 영역(x, y, w, h) 위의 스프라이트들. update()가 바뀐 것만 전송
+    def __init__(self, tft, bg=0, x=0, y=0, w=None, h=None):
+        self.tft = tft; self.bg = bg
+        self.x0 = x; self.y0 = y
+        self.x1 = x + (tft.width - x if w is None else w)
+        self.y1 = y + (tft.height - y if h is None else h)
+        self.sprites = []
+        self._bgrow = b""
+        self.transfers = 0      # 보낸 창 수(누적)
+        self.bytes = 0          # 보낸 픽셀 바이트(누적)
+
+    def add(self, s):
+        self.sprites.append(s)  # 나중에 넣은 것이 위
+        s.image = None; s.drawn = None; s.dirty = True
+        return s
+
+    def remove(self, s):
+        self.sprites.remove(s)
+        if s.drawn is not None:
+            self._send(s.drawn)
+
+    def clear(self):
+        # 영역 전체를 배경으로(처음 한 번)
+        self.tft.fill_color(self.bg, self.x0, self.y0, self.x1-self.x0, self.y1-self.y0)
+        for s in self.sprites:
+            s.drawn = None; s.dirty = True
+
+    def _clip(self, s):
+        if not s.visible: return None
+        x0 = max(self.x0, s.x); y0 = max(self.y0, s.y)
+        x1 = min(self.x1, s.x+s.w); y1 = min(self.y1, s.y+s.h)
+        return [x0, y0, x1, y1] if x0 < x1 and y0 < y1 else None
+
+    def update(self):
+        # 움직인 스프라이트마다 상자 1개(겹침) 또는 2개(이전/현재 따로)를 합성해서 전송
+        boxes = []
+        for s in self.sprites:
+            if not s.dirty: continue
+            s.dirty = False
+            old = s.drawn; new = self._clip(s)
+            s.drawn = new
+            if old is None or new is None:
+                if old is not None: boxes.append(old)
+                if new is not None: boxes.append(new)
+                continue
+            u = [min(old[0], new[0]), min(old[1], new[1]), max(old[2], new[2]), max(old[3], new[3])]
+            if _area(u) <= _area(old) + _area(new):
+                boxes.append(u)
+            else:
+                boxes.append(old); boxes.append(new)
+        for b in boxes:
+            self._send(b)
+        return len(boxes)
+
+    def _send(self, box):
+        x0, y0, x1, y1 = box
+        w = x1-x0; h = y1-y0
+        tft = self.tft
+        hit = [s for s in self.sprites if s.drawn is not None and
+               s.drawn[0] < x1 and x0 < s.drawn[2] and s.drawn[1] < y1 and y0 < s.drawn[3]]
+        self.transfers += 1; self.bytes += w*h*2
+        if not hit:
+            tft.fill_color(self.bg, x0, y0, w, h)       # 배경만 드러남
+            return
+        if len(hit) == 1:
+            s = hit[0]
+            if [s.x, s.y, s.x+s.w, s.y+s.h] == box:
+                # 혼자이고 상자가 곧 스프라이트: 미리 그린 그림을 그대로
+                if s.image is None: s._bake(self.bg)
+                tft.write_window(x0, y0, w, h, s.image)
+                return
+        # 합성: 줄 묶음 단위로 임시 버퍼에 그려서 한 창으로 이어 보냄
+        n = w*2
+        if len(self._bgrow) < n:
+            self._bgrow = bytes(((self.bg >> 8) & 0xFF, self.bg & 0xFF)) * tft.width
+        rows = max(1, tft.TEXT_BUF // n)
+        tmp = tft._text_buf(min(rows, h)*n)
+        tft.set_window(x0, y0, x1-1, y1-1)
+        bus = tft.bus
+        bus.begin_data()
+        y = y0
+        while y < y1:
+            k = min(rows, y1-y)
+            for i in range(k):
+                tmp[i*n:(i+1)*n] = self._bgrow[:n]
+            for s in hit:
+                s._copy(tmp, w, k, x0, y)
+            bus.write(memoryview(tmp)[:k*n])
+            y += k
+        bus.end()
@@ -0,0 +1,135 @@
+# ── 위젯 트리: 화면을 선언적으로 조립하고, 그릴 내용이 실제로 바뀐 위젯만 다시 그림
+# - 위젯은 자기 영역(x, y, w, h; 부모 패널 기준)과 마지막으로 받은 값을 가짐
+# - set()은 그릴 문자열(서식 적용 후)이 달라질 때만 dirty → 같은 "T:23.4C"는 다시 안 그림
+# - render(surf)는 dirty인 것만 surf(Compositor처럼 fill_rect/text가 있는 것)에 그림
+#   전송은 surf 쪽(Compositor.flush)이 맡음. 아무것도 안 바뀌면 손상 영역도 없음
+# - bg/aa는 안 주면 부모 패널 것을 물려받음(Screen을 만들 때 한 번 배치)
+from .difftext import DiffText
+from .font import text_width, wrap
+
+class Widget:
+    def __init__(self, x, y, w, h, color=0xFFFF, bg=None, scale=1, prop=False):
+        self.x = x; self.y = y; self.w = w; self.h = h
+        self.color = color; self.bg = bg
+        self.scale = scale; self.prop = prop
+        self.aa = None
+        self.value = None
+        self.dirty = True
+        self.draws = 0          # 다시 그린 횟수(호스트 검증용)
+
+    def _place(self, ox, oy, bg, aa):
+        # 부모 기준 → 화면 좌표, 스타일 물려받기
+        self.x += ox; self.y += oy
+        if self.bg is None: self.bg = bg
+        if self.aa is None: self.aa = aa
+
+    def set(self, value):
+        # 값이 달라졌을 때만 dirty. 바뀌었으면 True
+        if value == self.value:
+            return False
+        self.value = value
+        self.dirty = True
+        return True
+
+    def invalidate(self):
+        # 배경을 새로 칠했을 때 등: 값이 같아도 다음 render에서 다시
+        self.dirty = True
+
+    def render(self, surf):
+        # 그린 위젯 수
+        if not self.dirty:
+            return 0
+        self.dirty = False
+        self.draws += 1
+        self.paint(surf)
+        return 1
+
+    def paint(self, surf):
+        surf.fill_rect(self.x, self.y, self.w, self.h, self.bg)
+        if self.value:
+            surf.text(self.x, self.y, self.value, self.color, self.bg, self.scale, self.prop, self.aa)
+
+class Label(Widget):
+    # 고정 문자열(제목 등). 영역은 글자 폭에 맞춤
+    def __init__(self, x, y, text, color=0xFFFF, bg=None, scale=1, prop=False):
+        Widget.__init__(self, x, y, text_width(text, scale, prop), 7*scale, color, bg, scale, prop)
+        self.value = text
+
+class Value(Widget):
+    # 값 → fmt.format(값) 문자열. None이면 none 문자열(빈 문자열이면 영역만 지움)
+    # lines > 1: 단어 단위로 줄바꿈해서 step px 간격으로 최대 lines줄(넘치면 끝을 "..")
+    def __init__(self, x, y, w, h, fmt="{}", color=0xFFFF, bg=None, none="", scale=1,
+                 prop=False, lines=1, step=9):
+        Widget.__init__(self, x, y, w, h, color, bg, scale, prop)
+        self.fmt = fmt; self.none = none
+        self.lines = lines; self.step = step
+
+    def set(self, v):
+        return Widget.set(self, self.none if v is None else self.fmt.format(v))
+
+    def paint(self, surf):
+        if self.lines == 1:
+            Widget.paint(self, surf)
+            return
+        surf.fill_rect(self.x, self.y, self.w, self.h, self.bg)
+        if self.value:
+            for i, ln in enumerate(wrap(self.value, self.w, self.lines, self.scale, self.prop)):
+                surf.text(self.x, self.y + i*self.step, ln, self.color, self.bg, self.scale,
+                          self.prop, self.aa)
+
+class Clock(Widget):
+    # "hh:mm:ss". set(t, color): t는 localtime 형식. 바뀐 숫자 칸만 다시 그림(DiffText)
+    def __init__(self, x, y, color=0xFFFF, bg=None, scale=1):
+        Widget.__init__(self, x, y, 8*6*scale, 7*scale, color, bg, scale)
+        self._dt = None
+        self._surf = None
+
+    def set(self, t, color=None):
+        if color is None: color = self.color
+        return Widget.set(self, ("{:02d}:{:02d}:{:02d}".format(t[3], t[4], t[5]), color))
+
+    def invalidate(self):
+        self.dirty = True
+        if self._dt is not None:
+            self._dt.reset()
+
+    def paint(self, surf):
+        if self.value is None:
+            return
+        if self._dt is None:
+            self._dt = DiffText(self._draw, self.x, self.y, self.bg, self.scale)
+        self._surf = surf
+        self._dt.update(*self.value)
+
+    def _draw(self, x, y, text, color, bg, scale):
+        self._surf.text(x, y, text, color, bg, scale, False, self.aa)
+
+class Panel(Widget):
+    # 배경을 칠한 영역 + 자식 위젯들(좌표는 패널 기준). 패널을 다시 칠하면 자식도 전부 다시
+    def __init__(self, x, y, w, h, bg=None, children=()):
+        Widget.__init__(self, x, y, w, h, bg=bg)
+        self.children = list(children)
+
+    def _place(self, ox, oy, bg, aa):
+        Widget._place(self, ox, oy, bg, aa)
+        for c in self.children:
+            c._place(self.x, self.y, self.bg, self.aa)
+
+    def render(self, surf):
+        n = 0
+        if self.dirty:
+            self.dirty = False
+            self.draws += 1
+            surf.fill_rect(self.x, self.y, self.w, self.h, self.bg)
+            for c in self.children:
+                c.invalidate()
+            n = 1
+        for c in self.children:
+            n += c.render(surf)
+        return n
+
+class Screen(Panel):
+    # 트리의 뿌리(화면 전체). 만들 때 자식들을 화면 좌표로 배치
+    def __init__(self, w, h, bg=0, children=(), aa=False):
+        Panel.__init__(self, 0, 0, w, h, bg, children)
+        self._place(0, 0, bg, aa)
@@ -0,0 +1,101 @@
+# ── 날씨 캐시: 마지막 성공 값을 플래시에 이진 레코드로 저장
+# - 부팅 직후 네트워크를 기다리지 않고 저장된 값을 바로 표시(오래됐어도 일단 보여 주고 갱신)
+# - 요청이 실패해도 화면의 값은 그대로 두고, 재시도 간격은 지수적으로 늘림
+import struct
+try:
+    import os
+except ImportError:
+    import uos as os
+from compat import ticks_ms, ticks_diff, ticks_add
+import time
+
+# 레코드: 매직(3) 버전(1) 시각(u32, time.time()) 기온*10(i16) 습도(u8) 설명 길이(u8) + 설명(UTF-8)
+_MAGIC=b"WCR"; _VER=1
+_HDR=">3sBIhBB"
+_HDR_LEN=struct.calcsize(_HDR)
+
+def pack_record(ts, w):
+    # 기온은 i16 범위(±3276.7도)로, 습도는 0..255로 잘라서 저장(잘못된 응답 값에도 예외 없이)
+    desc,tmp,hum=w
+    d=desc.encode()[:255]
+    t10=max(-32768,min(32767,int(round(tmp*10))))
+    return struct.pack(_HDR,_MAGIC,_VER,int(ts)&0xFFFFFFFF,t10,max(0,min(255,int(round(hum)))),len(d))+d
+
+def unpack_record(b):
+    if len(b)<_HDR_LEN: return None
+    magic,ver,ts,t10,hum,n=struct.unpack(_HDR,b[:_HDR_LEN])
+    if magic!=_MAGIC or ver!=_VER or len(b)<_HDR_LEN+n: return None
+    try: desc=bytes(b[_HDR_LEN:_HDR_LEN+n]).decode()
+    except UnicodeError: return None
+    return ts,(desc,t10/10,hum)
+
+class WeatherCache:
+    # fetch: 코루틴 함수 → (설명, 기온, 습도) 또는 None
+    # path: 저장 파일(None이면 저장 안 함)
+    def __init__(self, fetch, path="weather.bin", max_age_ms=600_000,
+                 backoff_ms=15_000, backoff_max_ms=600_000):
+        self.fetch=fetch; self.path=path
+        self.max_age_ms=max_age_ms
+        self.backoff_ms=backoff_ms; self.backoff_max_ms=backoff_max_ms
+        self.value=None
+        self.ts=None                # 값을 받은 시각(time.time(), 저장/복원용)
+        self._got=None              # 이번 부팅에서 값을 받은 ticks_ms(없으면 None → 갱신 필요)
+        self._retry_at=None         # 실패 후 다음 시도 ticks_ms
+        self._delay=0
+        self.failures=0
+        self.load()
+
+    def load(self):
+        if self.path is None: return
+        try:
+            with open(self.path,"rb") as f:
+                r=unpack_record(f.read())
+        except OSError:
+            r=None
+        if r is not None:
+            self.ts,self.value=r
+
+    def save(self):
+        if self.path is None or self.value is None: return
+        tmp=self.path+".tmp"
+        try:
+            with open(tmp,"wb") as f:
+                f.write(pack_record(self.ts,self.value))
+            os.rename(tmp,self.path)   # 쓰다 끊겨도 이전 레코드는 남도록
+        except (OSError,ValueError,TypeError):   # NaN 등 담을 수 없는 값: 저장만 건너뜀
+            pass
+
+    def get(self):
+        # 마지막으로 알던 값(오래됐을 수 있음). 한 번도 못 받았으면 None
+        return self.value
+
+    @property
+    def stale(self):
+        if self.value is None: return True
+        if self._got is not None:
+            return ticks_diff(ticks_ms(),self._got)>=self.max_age_ms
+        # 플래시에서 읽은 값: 시계가 맞으면 저장 시각으로 판단, 아니면 오래된 것으로 봄
+        age=time.time()-self.ts
+        return not (0<=age<self.max_age_ms//1000)
+
+    def due(self):
+        # 지금 네트워크 요청을 해야 하는지(값이 오래됐고, 실패 대기 중이 아님)
+        if self._retry_at is not None and ticks_diff(self._retry_at,ticks_ms())>0:
+            return False
+        return self.stale
+
+    async def refresh(self):
+        try:
+            w=await self.fetch()
+        except Exception:
+            w=None
+        now=ticks_ms()
+        if w is None:
+            self.failures+=1
+            self._delay=min(self.backoff_max_ms, self._delay*2 if self._delay else self.backoff_ms)
+            self._retry_at=ticks_add(now,self._delay)
+            return self.value
+        self.value=w; self.ts=time.time(); self._got=now
+        self._retry_at=None; self._delay=0
+        self.save()
+        return w
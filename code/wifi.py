@@ -1,6 +1,6 @@
-import network
-import time
 from machine import Pin
+from compat import asyncio, async_sleep_ms
+from wifimgr import WifiManager
 
 # ====== Wi-Fi 설정 ======
 SSID = "mtinet"       # ← Wi-Fi 이름 입력
@@ -17,44 +17,39 @@ def led_set(on: bool):
     """LED ON/OFF (Active-Low 보드 고려)"""
     led.value(0 if (ACTIVE_LOW and on) else (1 if ACTIVE_LOW else (1 if not on else 0)))
 
-# ====== Wi-Fi 연결 함수 ======
-def connect_wifi(ssid, password, timeout=15):
-    wlan = network.WLAN(network.STA_IF)
-    wlan.active(True)
-    wlan.config(hostname=HOSTNAME)
-    wlan.connect(ssid, password)
-
-    print(f"Connecting to Wi-Fi: {ssid}")
-    start = time.ticks_ms()
-    while not wlan.isconnected():
-        led_set(True)
-        time.sleep(0.2)
+# ====== Wi-Fi 관리자 ======
+# 처음엔 스캔해서 접속하고 BSSID/채널을 저장(wifi.bin) → 다음부터는 스캔 없이 빠르게 재접속
+# (화면이 없는 스크립트라 스캔 동안 멈춰도 됨: scan=True. tft_weather는 스캔 없이 접속)
+# 끊김은 콜백으로 바로 알려줌(10초마다 확인하던 루프 대신)
+wifi = WifiManager(SSID, PASSWORD, HOSTNAME, scan=True)
+
+def on_change(up, mgr):
+    if up:
+        print("✅ Wi-Fi connected! ({} ms)".format(mgr.assoc_ms))
+        print("IP info:", mgr.wlan.ifconfig())
+        led_set(True)   # 연결 성공 시 LED ON (켜진 상태 유지)
+    else:
+        print("⚠️ Wi-Fi disconnected, retrying...")
         led_set(False)
-        time.sleep(0.2)
 
-        if time.ticks_diff(time.ticks_ms(), start) > timeout * 1000:
-            print("❌ Wi-Fi connection failed.")
-            return None
+wifi.on_change(on_change)
 
-    print("✅ Wi-Fi connected!")
-    print("IP info:", wlan.ifconfig())
-    led_set(True)   # 연결 성공 시 LED ON (켜진 상태 유지)
-    return wlan
+async def blink_while_down():
+    # 연결 안 된 동안 LED 깜빡임
+    while True:
+        await wifi.wait_down()
+        while not wifi.isconnected():
+            led_set(True);  await async_sleep_ms(200)
+            led_set(False); await async_sleep_ms(200)
+
+async def main():
+    print(f"Connecting to Wi-Fi: {SSID}")
+    asyncio.create_task(blink_while_down())
+    await wifi.supervise()   # 연결 → 끊기면 재연결(영원히)
 
 # ====== 메인 실행 ======
 try:
-    wlan = connect_wifi(SSID, PASSWORD)
-    if wlan and wlan.isconnected():
-        # 연결 유지 확인
-        while True:
-            if wlan.isconnected():
-                print("Wi-Fi OK:", wlan.ifconfig()[0])
-                time.sleep(10)
-            else:
-                print("⚠️ Wi-Fi disconnected, retrying...")
-                led_set(False)
-                wlan = connect_wifi(SSID, PASSWORD)
+    asyncio.run(main())
 except KeyboardInterrupt:
     led_set(False)
     print("프로그램 중단됨")
-
@@ -0,0 +1,175 @@
+# ── Wi-Fi 연결 관리자 (wifi.py, tft_weather.py 공용)
+# - 처음엔 SSID만으로 접속(AP 찾기는 드라이버가 안에서, 블로킹 없음). 붙은 AP의 BSSID/채널을
+#   포트가 알려 주면(config("bssid")) 플래시에 저장. scan=True면 예전처럼 먼저 스캔해서 가장 센 AP로
+#   (WLAN.scan()은 ESP32에서 약 2초 블로킹 → 화면/시계가 도는 스크립트에서는 쓰지 말 것)
+# - ESP32 포트는 bssid를 알려 주지 않음 → 붙은 뒤 화면이 덜 바쁜 때 learn()으로 한 번 스캔해서 저장
+# - 다음부터는 저장된 BSSID로 바로 접속(스캔 생략) → 실패하면 저장 파일을 지우고 처음 방식으로
+# - 연결/끊김은 콜백과 asyncio 이벤트로 알림(WLAN에 이벤트 콜백이 없어 내부에서만 짧게 확인)
+try:
+    import network
+except ImportError:   # PC: nethost.FakeWLAN을 넘겨서 사용
+    network = None
+import os
+from compat import asyncio, async_sleep_ms, ticks_ms, ticks_diff
+
+POLL_MS = 50          # 연결 대기 중 확인 간격
+WATCH_MS = 250        # 연결 유지 감시 간격(끊김 감지 지연 상한)
+
+class WifiManager:
+    def __init__(self, ssid, password, hostname=None, cache_path="wifi.bin", wlan=None, scan=False):
+        self.ssid = ssid; self.password = password
+        self.scan = scan
+        self.cache_path = cache_path
+        self.wlan = wlan if wlan is not None else network.WLAN(network.STA_IF)
+        self.wlan.active(True)
+        if hostname:
+            try: self.wlan.config(hostname=hostname)
+            except Exception: pass
+        self.bssid = None; self.channel = None
+        self.assoc_ms = None          # 마지막 연결에 걸린 시간
+        self.history = []             # (방식 'fast'|'scan'|'join', ms) 최근 기록
+        self._cb = []
+        self._up = asyncio.Event(); self._down = asyncio.Event()
+        self._state = None
+        self._load()
+        self._set(self.wlan.isconnected())
+
+    # ── 이벤트 ──
+    def on_change(self, fn):
+        # fn(up: bool, mgr) 연결/끊김 때마다 호출
+        self._cb.append(fn)
+
+    def _set(self, up):
+        if up == self._state: return
+        self._state = up
+        if up: self._down.clear(); self._up.set()
+        else:  self._up.clear();   self._down.set()
+        for fn in self._cb:
+            try: fn(up, self)
+            except Exception as e: print("wifi callback:", e)
+
+    def isconnected(self):
+        return bool(self._state)
+
+    async def wait_up(self):
+        await self._up.wait()
+
+    async def wait_down(self):
+        await self._down.wait()
+
+    # ── BSSID/채널 캐시(7바이트) ──
+    def _load(self):
+        if self.cache_path is None: return
+        try:
+            with open(self.cache_path, "rb") as f:
+                b = f.read()
+            if len(b) == 7:
+                self.bssid = bytes(b[:6]); self.channel = b[6]
+        except OSError:
+            pass
+
+    def _save(self):
+        if self.cache_path is None or self.bssid is None: return
+        try:
+            with open(self.cache_path, "wb") as f:
+                f.write(self.bssid + bytes([self.channel or 0]))
+        except OSError:
+            pass
+
+    def forget(self):
+        # 저장 파일도 지움(남겨 두면 다음 부팅도 없는 AP로 빠른 접속을 시도하느라 fast_timeout_ms를 씀)
+        self.bssid = self.channel = None
+        if self.cache_path is None: return
+        try: os.remove(self.cache_path)
+        except OSError: pass
+
+    # ── 연결 ──
+    async def _wait_assoc(self, timeout_ms):
+        t0 = ticks_ms()
+        while not self.wlan.isconnected():
+            if ticks_diff(ticks_ms(), t0) > timeout_ms:
+                return False
+            await async_sleep_ms(POLL_MS)
+        return True
+
+    def _scan_best(self):
+        # 같은 SSID 중 RSSI가 가장 센 AP: (bssid, channel) 또는 None
+        best = None
+        try:
+            nets = self.wlan.scan()
+        except OSError:
+            return None
+        want = self.ssid.encode()
+        for n in nets:
+            ssid, bssid, ch, rssi = n[0], n[1], n[2], n[3]
+            if ssid == want and (best is None or rssi > best[2]):
+                best = (bytes(bssid), ch, rssi)
+        return best and best[:2]
+
+    def _learn(self):
+        # 붙은 AP의 BSSID/채널(포트가 알려 줄 때만. ESP32 포트는 bssid를 모름 → learn()에서 스캔)
+        try:
+            self.bssid = bytes(self.wlan.config("bssid"))
+            self.channel = self.wlan.config("channel")
+        except (ValueError, OSError, TypeError):
+            self.bssid = self.channel = None
+
+    def learn(self):
+        # 붙어 있는데 BSSID를 모르면 한 번 스캔해서(같은 SSID 중 가장 센 AP) 저장. 저장했으면 True
+        # 스캔은 약 2초 블로킹 → 화면이 어차피 바뀌는 때(예: 시간 맞춘 직후)에 부를 것
+        if self.bssid is not None or not self.wlan.isconnected():
+            return False
+        best = self._scan_best()
+        if best is None:
+            return False
+        self.bssid, self.channel = best
+        self._save()
+        return True
+
+    async def connect(self, timeout_ms=15_000, fast_timeout_ms=4_000):
+        # 연결되면 True. 저장된 BSSID가 있으면 먼저 그쪽으로 빠르게 시도
+        if self.wlan.isconnected():
+            self._set(True); return True
+        t0 = ticks_ms()
+        if self.bssid is not None:
+            self.wlan.connect(self.ssid, self.password, bssid=self.bssid)
+            if await self._wait_assoc(fast_timeout_ms):
+                return self._done("fast", t0)
+            try: self.wlan.disconnect()
+            except OSError: pass
+            self.forget()            # AP가 바뀐 듯: 처음 방식으로
+        best = self._scan_best() if self.scan else None
+        if best is not None:
+            self.bssid, self.channel = best
+            self.wlan.connect(self.ssid, self.password, bssid=self.bssid)
+        else:
+            self.wlan.connect(self.ssid, self.password)
+        if await self._wait_assoc(max(0, timeout_ms - ticks_diff(ticks_ms(), t0))):
+            if self.bssid is None:
+                self._learn()
+            self._save()
+            return self._done("scan" if self.scan else "join", t0)
+        self._set(False)
+        return False
+
+    def _done(self, how, t0):
+        self.assoc_ms = ticks_diff(ticks_ms(), t0)
+        self.history.append((how, self.assoc_ms))
+        if len(self.history) > 32: self.history.pop(0)
+        self._set(True)
+        return True
+
+    async def supervise(self, retry_ms=2_000, retry_max_ms=60_000):
+        # 연결 유지: 끊김을 WATCH_MS 안에 알리고 바로 재연결(실패 시 간격을 늘려 재시도)
+        delay = retry_ms
+        while True:
+            if self.wlan.isconnected():
+                self._set(True); delay = retry_ms
+                await async_sleep_ms(WATCH_MS)
+                continue
+            self._set(False)
+            if await self.connect():
+                delay = retry_ms
+            else:
+                await async_sleep_ms(delay)
+                delay = min(retry_max_ms, delay * 2)